@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+# Výkonnostní měření crawleru (spouští se ručně, nejsou součástí testů)
@@ -0,0 +1,147 @@
+# benchmarks/bench_admission.py
+# Autor: Martin Šilar
+# Přijímání odkazů do visited: dřívější globální zámek s filtry uvnitř vs. filtry bez zámku a visited po částech
+#
+# Spuštění:  python -m benchmarks.bench_admission [--pages 2000] [--links 80] [--threads 16]
+# Síť ani parsování se neměří – vlákna přijímají předem vygenerované odkazy stránek.
+
+import argparse
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+from src.webcrawler.crawler import WebCrawler
+from benchmarks.common import make_config, print_table
+
+
+class LegacyAdmission:
+    """Dřívější WebCrawler._admit_links: kanonizace, filtry i visited pod jedním zámkem, čekání měřené."""
+
+    def __init__(self, crawler):
+        self.crawler = crawler
+        self.visited = set()
+        self.raw_seen = set()
+        self.lock = threading.Lock()
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait = {}
+
+    def admit(self, links):
+        crawler = self.crawler
+        canonicalizer = crawler.canonicalizer
+        admitted = []
+        waited = 0.0
+        if not self.lock.acquire(blocking=False):
+            t0 = time.perf_counter()
+            self.lock.acquire()
+            waited = time.perf_counter() - t0
+        try:
+            for raw in links:
+                link = canonicalizer.canonicalize(raw)
+                if not crawler._same_domain(link):
+                    continue
+                if not crawler._allowed_by_robots(link):
+                    continue
+                if raw not in self.raw_seen:
+                    self.raw_seen.add(raw)
+                if link in self.visited:
+                    continue
+                self.visited.add(link)
+                admitted.append(link)
+            self.acquisitions += 1
+            self.contended += waited > 0
+            name = threading.current_thread().name
+            self.wait[name] = self.wait.get(name, 0.0) + waited
+        finally:
+            self.lock.release()
+        return admitted
+
+
+def page_links(pages: int, links: int) -> list[list[str]]:
+    """Odkazy stránek: část na jiné weby, část zakázaná v robots.txt, parametry utm_* a opakování."""
+    out = []
+    for n in range(pages):
+        page = []
+        for i in range(links):
+            target = (n * 31 + i * 17) % (pages * 4)
+            if i % 10 == 0:
+                page.append(f"https://jiny-web.cz/clanek/{target}")
+            elif i % 10 == 1:
+                page.append(f"https://www.example.com/admin/{target}")
+            else:
+                page.append(f"https://www.example.com/kategorie/{target % 50}/stranka-{target}?utm_source=x&id={target}")
+        out.append(page)
+    return out
+
+
+def make_crawler(tmp, shards):
+    config = make_config(tmp, "https://www.example.com/", "example.com", visited_shards=shards)
+    with patch.object(WebCrawler, "_load_robots_txt", return_value=(["/admin"], 0)):
+        return WebCrawler(config)
+
+
+def run(admit, corpus, threads):
+    pending = list(corpus)
+    lock = threading.Lock()
+    total = [0]
+
+    def worker():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                links = pending.pop()
+            admitted = admit(links)
+            with lock:
+                total[0] += len(admitted)
+
+    workers = [threading.Thread(target=worker, name=f"worker-{i}") for i in range(threads)]
+    t0 = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return total[0], time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=2000)
+    ap.add_argument("--links", type=int, default=80)
+    ap.add_argument("--threads", type=int, default=16)
+    args = ap.parse_args()
+
+    corpus = page_links(args.pages, args.links)
+    n_links = args.pages * args.links
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = LegacyAdmission(make_crawler(tmp, 1))
+        admitted, elapsed = run(legacy.admit, corpus, args.threads)
+        wait = legacy.wait
+        rows.append((
+            "dřívější (globální zámek)", admitted, f"{n_links / elapsed / 1000:.0f}",
+            f"{legacy.contended / legacy.acquisitions * 100:.1f} %",
+            f"{sum(wait.values()) * 1000 / len(wait):.1f}", f"{max(wait.values()) * 1000:.1f}",
+        ))
+
+        for shards in (1, 16, 64):
+            crawler = make_crawler(tmp, shards)
+            admitted, elapsed = run(crawler._admit_links, corpus, args.threads)
+            summary = crawler.admission_summary()
+            rows.append((
+                f"visited_shards = {shards}", admitted, f"{n_links / elapsed / 1000:.0f}",
+                f"{summary['contended'] / max(1, summary['acquisitions']) * 100:.1f} %",
+                f"{summary['wait_per_worker_ms']:.1f}", f"{summary['max_wait_worker_ms']:.1f}",
+            ))
+
+    print(f"\n{args.pages} stránek po {args.links} odkazech, {args.threads} vláken\n")
+    print_table(
+        ("varianta", "přijato", "odkazy [k/s]", "zamčení s čekáním", "čekání/worker [ms]", "max worker [ms]"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
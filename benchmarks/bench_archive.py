@@ -0,0 +1,103 @@
+# benchmarks/bench_archive.py
+# Autor: Martin Šilar
+# Ukládání HTML: soubor na stránku (html_store = files) vs. archiv WARC gzip / zstd – propustnost a místo na disku
+#
+# Spuštění:  python -m benchmarks.bench_archive [--pages 20000] [--threads 4]
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from src.webcrawler.archive import ArchiveReader, ResponseMeta, zstandard
+from src.webcrawler.crawler import WebCrawler
+from benchmarks.common import make_config, print_table
+from benchmarks.stub_server import StubSite
+
+META = ResponseMeta(200, {"Content-Type": "text/html; charset=utf-8", "Server": "stub"})
+
+
+def disk_usage(directory: Path) -> tuple[int, int]:
+    """(počet souborů, obsazené místo včetně zaokrouhlení na bloky)."""
+    files = 0
+    used = 0
+    for root, _, names in os.walk(directory):
+        for name in names:
+            files += 1
+            used += os.stat(os.path.join(root, name)).st_blocks * 512
+    return files, used
+
+
+def run(store, compression, pages, threads):
+    with tempfile.TemporaryDirectory() as tmp:
+        config = make_config(
+            tmp, "https://bench.cz/", "bench.cz",
+            save_html=True,
+            html_store=store,
+            archive_compression=compression,
+        )
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(config)
+        crawler._open_archive()
+
+        def save(n):
+            crawler._save_page(n, f"https://bench.cz/page/{n}", pages[n], META)
+
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(save, range(len(pages))))
+        crawler._close_archive()
+        elapsed = time.perf_counter() - t0
+
+        files, used = disk_usage(config.output_dir)
+
+        read_ms = None
+        if store == "archive":
+            reader = ArchiveReader(config.output_dir / "archive")
+            sample = random.Random(1).sample(range(len(pages)), 200)
+            reader.get(f"https://bench.cz/page/{sample[0]}")  # načtení indexu
+            t0 = time.perf_counter()
+            for n in sample:
+                assert reader.get(f"https://bench.cz/page/{n}").body == pages[n]
+            read_ms = (time.perf_counter() - t0) * 1000 / len(sample)
+
+        return elapsed, files, used, read_ms
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=20000)
+    ap.add_argument("--padding", type=int, default=8000)
+    ap.add_argument("--threads", type=int, default=4)
+    args = ap.parse_args()
+
+    site = StubSite(pages=args.pages, padding=args.padding, mirrors=True)
+    pages = [site.render(n) for n in range(args.pages)]
+    raw = sum(len(p.encode("utf-8")) for p in pages)
+
+    variants = [("files", "gzip"), ("archive", "gzip")]
+    if zstandard is not None:
+        variants.append(("archive", "zstd"))
+
+    rows = []
+    for store, compression in variants:
+        elapsed, files, used, read_ms = run(store, compression, pages, args.threads)
+        rows.append((
+            store if store == "files" else f"archive ({compression})",
+            f"{args.pages / elapsed:.0f}",
+            files,
+            f"{used / 2**20:.1f}",
+            f"{raw / used:.1f}×",
+            f"{read_ms:.2f}" if read_ms is not None else "-",
+        ))
+
+    print(f"\n{args.pages} stránek po ~{raw // args.pages} B, {args.threads} vláken, HTML celkem {raw / 2**20:.1f} MB\n")
+    print_table(("html_store", "stránky/s", "souborů", "na disku [MB]", "úspora", "čtení [ms/stránku]"), rows)
+
+
+if __name__ == "__main__":
+    main()
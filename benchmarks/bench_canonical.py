@@ -0,0 +1,66 @@
+# benchmarks/bench_canonical.py
+# Autor: Martin Šilar
+# Kolik stažení ušetří kanonizace URL na webu, který odkazuje na stejné stránky různými zápisy
+#
+# Spuštění:  python -m benchmarks.bench_canonical [--pages 200] [--fanout 5]
+
+import argparse
+import tempfile
+import time
+from unittest.mock import patch
+
+from src.webcrawler.canonical import DEFAULT_RULES
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from benchmarks.common import make_config, print_table
+from benchmarks.stub_server import StubSite
+
+
+def run(site, canonicalize, max_pages):
+    with tempfile.TemporaryDirectory() as tmp:
+        config = make_config(
+            tmp, site.start_url, site.domain,
+            max_pages=max_pages,
+            canonicalize=canonicalize,
+        )
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(config)
+        crawler.set_extractor(ContactsExtractor())
+
+        hits_before = site.hits
+        t0 = time.perf_counter()
+        crawler.run()
+        elapsed = time.perf_counter() - t0
+        return crawler, site.hits - hits_before, elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=200)
+    ap.add_argument("--fanout", type=int, default=5)
+    ap.add_argument("--latency", type=float, default=0.005)
+    args = ap.parse_args()
+
+    # Strop stránek je dost vysoký, aby oba běhy prošly celý web.
+    max_pages = args.pages * 10
+
+    rows = []
+    with StubSite(pages=args.pages, fanout=args.fanout, latency=args.latency, duplicate_links=True) as site:
+        for label, rules in (("vypnuto", []), ("výchozí pravidla", list(DEFAULT_RULES))):
+            crawler, fetches, elapsed = run(site, rules, max_pages)
+            summary = crawler.canonical_summary()
+            rows.append((
+                label,
+                fetches,
+                len(crawler.results),
+                summary["rewritten"],
+                summary["saved"],
+                f"{elapsed:.2f}",
+            ))
+
+    print(f"\n{args.pages} různých stránek, ke každému odkazu 5 duplicitních variant\n")
+    print_table(("kanonizace", "stažení", "záznamů", "přepsaných odkazů", "ušetřeno", "čas [s]"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/bench_charset.py
+# Autor: Martin Šilar
+# Určení kódování českých stránek (windows-1250 / iso-8859-2 / utf-8): charset_normalizer nad celým tělem
+# (requests.Response.apparent_encoding) vs. detect_encoding a parsování lxml z textu vs. přímo z bajtů
+#
+# Spuštění:  python -m benchmarks.bench_charset [--pages 60] [--padding 60000]
+
+import argparse
+import time
+
+from src.webcrawler.charset import decode_html, detect_encoding, normalize_encoding
+from src.webcrawler.parsers import create_document, is_available
+from benchmarks.common import print_table
+from benchmarks.stub_server import StubSite
+
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+ENCODINGS = ("windows-1250", "iso-8859-2", "utf-8")
+
+
+def corpus(pages, padding, encoding, declared):
+    site = StubSite(pages=pages, padding=padding, mirrors=True, encoding=encoding if declared else None)
+    return [site.render(n).encode(encoding) for n in range(pages)]
+
+
+def measure(fn, bodies):
+    t0 = time.perf_counter()
+    results = [fn(b) for b in bodies]
+    return (time.perf_counter() - t0) * 1000 / len(bodies), results
+
+
+def apparent_encoding(body):
+    return charset_normalizer.from_bytes(body).best().encoding
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=60)
+    ap.add_argument("--padding", type=int, default=60000)
+    args = ap.parse_args()
+
+    detectors = [("detect_encoding", detect_encoding)]
+    if charset_normalizer is not None:
+        detectors.insert(0, ("charset_normalizer", apparent_encoding))
+
+    rows = []
+    for encoding in ENCODINGS:
+        for declared in (False, True):
+            bodies = corpus(args.pages, args.padding, encoding, declared)
+            for name, fn in detectors:
+                ms, found = measure(fn, bodies)
+                correct = sum(normalize_encoding(e) == normalize_encoding(encoding) for e in found)
+                rows.append((
+                    encoding,
+                    "<meta charset>" if declared else "žádné",
+                    name,
+                    f"{ms:.3f}",
+                    f"{correct}/{len(bodies)}",
+                ))
+
+    size = sum(len(b) for b in bodies) // len(bodies)
+    print(f"\n{args.pages} stránek po ~{size // 1000} kB, kódování v hlavičce Content-Type chybí\n")
+    print_table(("kódování", "ohlášeno", "detektor", "ms/stránku", "správně"), rows)
+
+    if is_available("lxml"):
+        rows = []
+        for encoding in ("windows-1250", "utf-8"):
+            bodies = corpus(args.pages, args.padding, encoding, True)
+            enc = detect_encoding(bodies[0])
+            text_ms, _ = measure(lambda b: create_document(decode_html(b, enc), "lxml").parse(), bodies)
+            bytes_ms, _ = measure(lambda b: create_document(b, "lxml", enc).parse(), bodies)
+            rows.append((encoding, f"{text_ms:.2f}", f"{bytes_ms:.2f}"))
+        print("\nDekódování + parsování lxml (ms/stránku)\n")
+        print_table(("kódování", "z textu", "z bajtů"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_contacts.py
+# Autor: Martin Šilar
+# Extrakce kontaktů: dřívější cesta (text ze stromu + re.findall / re.sub na kandidáta) vs. contact_scanner jedním průchodem
+#
+# Spuštění:  python -m benchmarks.bench_contacts [--corpus data] [--pages 200] [--padding 20000]
+# Korpus tvoří stránky uložené crawlerem (save_html = true); když žádné nejsou,
+# použijí se syntetické stránky stub serveru s kontakty na každé stránce.
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+from src.webcrawler.contact_scanner import scan_contacts, scan_text
+from src.webcrawler.parsers import available_parsers, create_document
+from benchmarks.bench_parsers import load_corpus
+from benchmarks.common import print_table
+from benchmarks.stub_server import StubSite
+
+
+def legacy_contacts(text: str):
+    """Dřívější ContactsExtractor: nezkompilované vzory a re.sub na každého kandidáta."""
+    emails = list(set(re.findall(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text)))
+    cleaned = []
+    for raw in re.findall(r"(?:\+?\d[\d\s\-]{8,15})", text):
+        num = re.sub(r"[^\d+]", "", raw)
+        if num.startswith("+420") and len(num) == 13:
+            cleaned.append(num)
+        elif num.startswith("00420") and len(num) == 14:
+            cleaned.append("+" + num[2:])
+        elif num.isdigit() and len(num) == 9:
+            cleaned.append("+420" + num)
+    return emails, list(set(cleaned))
+
+
+def synthetic_corpus(pages: int, padding: int) -> list[str]:
+    site = StubSite(pages=pages, padding=padding, mirrors=True)
+    extra = (
+        '<p>Obchod: obchod{n} [at] firma [dot] cz, <a href="mailto:prodej{n}@firma.cz">napište</a>, '
+        '<a href="tel:+420608{n:06d}">volejte</a>, sklad 602&nbsp;{n:03d}&nbsp;111</p>'
+    )
+    return [site.render(n).replace("</body>", extra.format(n=n % 1000) + "</body>") for n in range(pages)]
+
+
+def bench(fn, corpus):
+    found = 0
+    t0 = time.perf_counter()
+    for html in corpus:
+        emails, phones = fn(html)
+        found += len(emails) + len(phones)
+    return time.perf_counter() - t0, found
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--corpus", type=Path, default=Path("data"))
+    ap.add_argument("--pages", type=int, default=200)
+    ap.add_argument("--padding", type=int, default=20000)
+    args = ap.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus.is_dir() else []
+    source = str(args.corpus)
+    if not corpus:
+        corpus = synthetic_corpus(args.pages, args.padding)
+        source = "syntetický"
+
+    variants = [
+        (f"dřívější ({parser})", lambda html, p=parser: legacy_contacts(create_document(html, p).clean_text()))
+        for parser in available_parsers()
+    ]
+    fastest = available_parsers()[-1]
+    variants += [
+        (f"scan_text ({fastest})", lambda html: scan_text(create_document(html, fastest).clean_text())),
+        ("scan_contacts (bez stromu)", scan_contacts),
+    ]
+
+    rows = []
+    for label, fn in variants:
+        elapsed, found = bench(fn, corpus)
+        rows.append((label, found, f"{elapsed * 1000 / len(corpus):.2f}", f"{len(corpus) / elapsed:,.0f}"))
+
+    avg_kb = sum(len(h) for h in corpus) / len(corpus) / 1024
+    print(f"\nKorpus {source}: {len(corpus)} stránek, průměr {avg_kb:.0f} kB\n")
+    print_table(("varianta", "kontaktů", "ms/stránku", "stránky/s"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# benchmarks/bench_dedup.py
+# Autor: Martin Šilar
+# Podíl duplicitních stránek a ušetřená práce při dedup = off / exact / near na webu se zrcadly
+#
+# Spuštění:  python -m benchmarks.bench_dedup [--pages 200] [--fanout 5]
+# Každá stránka má přesnou kopii /copy/N a verzi pro tisk /print/N.
+
+import argparse
+import tempfile
+import time
+from unittest.mock import patch
+
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from benchmarks.common import make_config, print_table
+from benchmarks.stub_server import StubSite
+
+
+def run(site, mode, max_pages):
+    with tempfile.TemporaryDirectory() as tmp:
+        config = make_config(
+            tmp, site.start_url, site.domain,
+            max_pages=max_pages,
+            dedup=mode,
+        )
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(config)
+        crawler.set_extractor(ContactsExtractor())
+
+        t0 = time.perf_counter()
+        crawler.run()
+        elapsed = time.perf_counter() - t0
+        return crawler, elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=200)
+    ap.add_argument("--fanout", type=int, default=5)
+    ap.add_argument("--padding", type=int, default=8000)
+    args = ap.parse_args()
+
+    max_pages = args.pages * 3
+
+    rows = []
+    with StubSite(pages=args.pages, fanout=args.fanout, padding=args.padding, mirrors=True) as site:
+        for mode in ("off", "exact", "near"):
+            crawler, elapsed = run(site, mode, max_pages)
+            summary = crawler.dedup_summary()
+            timing = crawler.timing_summary()
+            rows.append((
+                mode,
+                crawler.page_count,
+                crawler.timed_pages,
+                summary["exact"],
+                summary["near"],
+                f"{summary['rate'] * 100:.1f} %",
+                len(crawler.results),
+                f"{timing['parse'] + timing['extract']:.2f}",
+                f"{elapsed:.2f}",
+            ))
+
+    print(f"\n{args.pages} stránek, každá s přesnou kopií a verzí pro tisk\n")
+    print_table(
+        ("dedup", "staženo", "zpracováno", "přesných", "téměř", "duplicit", "záznamů",
+         "parse+extract [ms/str.]", "čas [s]"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
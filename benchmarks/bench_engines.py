@@ -0,0 +1,81 @@
+# benchmarks/bench_engines.py
+# Autor: Martin Šilar
+# Porovnání enginu threads vs. async: stránky/s a RSS při 5, 50 a 500 souběžných požadavcích
+#
+# Spuštění:  python -m benchmarks.bench_engines [--pages 2000] [--latency 0.05]
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import make_config, peak_rss_mb, print_table
+from benchmarks.stub_server import StubSite
+
+CONCURRENCY = (5, 50, 500)
+ENGINES = ("threads", "async")
+
+
+def run_child(engine, concurrency, start_url, domain, pages):
+    """Jeden běh crawleru – spouští se v samostatném procesu kvůli čistému měření RSS."""
+    from src.webcrawler.contacts_extractor import ContactsExtractor
+    from src.webcrawler.engine import build_crawler
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = make_config(
+            tmp, start_url, domain,
+            engine=engine,
+            max_workers=concurrency,
+            max_pages=pages,
+        )
+        crawler = build_crawler(config)
+        crawler.set_extractor(ContactsExtractor())
+
+        t0 = time.perf_counter()
+        crawler.run()
+        elapsed = time.perf_counter() - t0
+
+    print(json.dumps({
+        "pages": crawler.page_count,
+        "seconds": elapsed,
+        "rss_mb": peak_rss_mb(),
+    }))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=2000)
+    ap.add_argument("--latency", type=float, default=0.05)
+    ap.add_argument("--child", nargs=5, metavar=("ENGINE", "CONC", "URL", "DOMAIN", "PAGES"))
+    args = ap.parse_args()
+
+    if args.child:
+        engine, conc, url, domain, pages = args.child
+        run_child(engine, int(conc), url, domain, int(pages))
+        return
+
+    rows = []
+    with StubSite(pages=args.pages, fanout=8, latency=args.latency) as site:
+        for conc in CONCURRENCY:
+            for engine in ENGINES:
+                out = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_engines", "--child",
+                     engine, str(conc), site.start_url, site.domain, str(args.pages)],
+                    capture_output=True, text=True, check=True,
+                )
+                r = json.loads(out.stdout.strip().splitlines()[-1])
+                rows.append((
+                    engine, conc, r["pages"],
+                    f"{r['seconds']:.2f}",
+                    f"{r['pages'] / r['seconds']:.1f}",
+                    f"{r['rss_mb']:.1f}",
+                ))
+
+    print(f"\nStub server: {args.pages} stránek, latence {args.latency * 1000:.0f} ms\n")
+    print_table(("engine", "souběh", "stránky", "čas [s]", "stránky/s", "RSS [MB]"), rows)
+
+
+if __name__ == "__main__":
+    main()
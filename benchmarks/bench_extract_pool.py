@@ -0,0 +1,102 @@
+# benchmarks/bench_extract_pool.py
+# Autor: Martin Šilar
+# Škálování CPU části (parse + extrakce + odkazy) s počtem procesů – extract_processes = 0, 1, 2, 4, …
+#
+# Spuštění:  python -m benchmarks.bench_extract_pool [--pages 400] [--threads 16]
+# Síť se neměří: "fetch" vlákna berou předem vyrenderované stránky, aby šlo jen o CPU.
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from queue import Queue
+from unittest.mock import patch
+
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from benchmarks.common import make_config, print_table
+from benchmarks.stub_server import StubSite
+
+
+def run(processes, corpus, threads):
+    with tempfile.TemporaryDirectory() as tmp:
+        config = make_config(
+            tmp, "http://stub/page/0", "stub",
+            max_pages=len(corpus) + 1,
+            extract_processes=processes,
+        )
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(config)
+        crawler.set_extractor(ContactsExtractor())
+        crawler._start_extract_pool()
+
+        # Zahřátí poolu (spawn procesů) se do měření nepočítá.
+        if crawler.extract_pool:
+            crawler.extract_pool.submit("http://stub/", "<p>x</p>").result()
+
+        # Stránky jdou přes frontu s task_done / join jako v crawleru – pool označí
+        # stránku za hotovou až ve zpětném volání. Odkazy, které crawler do fronty
+        # zařadí, se jen odeberou (síť se neměří).
+        work = Queue()
+        crawler.task_queue = work
+        for item in enumerate(corpus, start=1):
+            work.put(item)
+
+        def fetcher(wid):
+            while True:
+                item = work.get()
+                if item is None:
+                    return
+                if isinstance(item, str):
+                    work.task_done()
+                    continue
+                index, (url, html) = item
+                if crawler.extract_pool and crawler._submit_to_pool(wid, index, url, html, 0.0):
+                    continue
+                if not crawler.extract_pool:
+                    crawler._process_page(wid, index, url, html)
+                work.task_done()
+
+        t0 = time.perf_counter()
+        workers = [threading.Thread(target=fetcher, args=(i,)) for i in range(threads)]
+        for t in workers:
+            t.start()
+        work.join()
+        elapsed = time.perf_counter() - t0
+
+        for t in workers:
+            work.put(None)
+        for t in workers:
+            t.join()
+        crawler._stop_extract_pool()
+        return len(crawler.results), elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=400)
+    ap.add_argument("--threads", type=int, default=16)
+    args = ap.parse_args()
+
+    site = StubSite(pages=args.pages, fanout=20, padding=20000)
+    corpus = [(f"http://stub/page/{n}", site.render(n)) for n in range(args.pages)]
+
+    cores = os.cpu_count() or 1
+    levels = [0] + [p for p in (1, 2, 4, 8, 16) if p <= max(cores, 1)]
+
+    rows = []
+    base = None
+    for processes in levels:
+        found, elapsed = run(processes, corpus, args.threads)
+        rate = len(corpus) / elapsed
+        base = base or rate
+        label = "vlákna (bez poolu)" if processes == 0 else str(processes)
+        rows.append((label, found, f"{elapsed:.2f}", f"{rate:.1f}", f"{rate / base:.2f}x"))
+
+    print(f"\n{len(corpus)} stránek, {args.threads} fetch vláken, {cores} CPU jader\n")
+    print_table(("extract_processes", "záznamů", "čas [s]", "stránky/s", "vs. vlákna"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_frontier.py
+# Autor: Martin Šilar
+# Malá queue_maxsize na velkém webu: dřívější zahazování odkazů při plné frontě vs. přetečení na disk
+#
+# Spuštění:  python -m benchmarks.bench_frontier [--pages 2000] [--fanout 10] [--queue 100]
+
+import argparse
+import tempfile
+import time
+from queue import Full
+from unittest.mock import patch
+
+from src.webcrawler.crawler import WebCrawler
+from benchmarks.common import make_config, print_table
+from benchmarks.stub_server import StubSite
+
+
+class DroppingCrawler(WebCrawler):
+    """Dřívější chování: bez přetečení na disk se odkazy nad queue_maxsize zahazovaly."""
+
+    def _new_scheduler(self, scheduler_cls):
+        with patch("src.webcrawler.crawler.SpillQueue", return_value=None):
+            return super()._new_scheduler(scheduler_cls)
+
+    def _enqueue(self, url):
+        try:
+            self.task_queue.put_nowait(url)
+        except Full:
+            self.log(f"[CRAWLER] Plná fronta, URL zahozena: {url}")
+
+
+def run(site, pages, queue_maxsize, spill):
+    with tempfile.TemporaryDirectory() as tmp:
+        config = make_config(
+            tmp, site.start_url, site.domain,
+            max_pages=pages * 2,
+            queue_maxsize=queue_maxsize,
+            profile="raw",
+            profiles=["raw"],
+        )
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(config) if spill else DroppingCrawler(config)
+
+        t0 = time.perf_counter()
+        crawler.run()
+        elapsed = time.perf_counter() - t0
+        summary = crawler.frontier_summary() if spill else {"spilled": "-", "refilled": "-"}
+        return crawler.page_count, summary, elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=2000)
+    ap.add_argument("--fanout", type=int, default=10)
+    ap.add_argument("--queue", type=int, default=100)
+    args = ap.parse_args()
+
+    rows = []
+    with StubSite(pages=args.pages, fanout=args.fanout) as site:
+        for label, queue_maxsize, spill in (
+            ("zahazování", args.queue, False),
+            ("přetečení na disk", args.queue, True),
+            ("neomezená fronta", 0, True),
+        ):
+            crawled, summary, elapsed = run(site, args.pages, queue_maxsize, spill)
+            rows.append((
+                label, queue_maxsize or "∞", f"{crawled} / {args.pages}",
+                summary["spilled"], summary["refilled"], f"{elapsed:.2f}",
+            ))
+
+    print(f"\n{args.pages} stránek, {args.fanout} odkazů na stránku\n")
+    print_table(("fronta", "queue_maxsize", "staženo", "na disk", "zpět", "čas [s]"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# benchmarks/bench_http_pool.py
+# Autor: Martin Šilar
+# Spojení přes TLS: session na worker vs. sdílený pool (requests / httpx), bez keep-alive – handshaky a znovupoužití spojení
+#
+# Spuštění:  python -m benchmarks.bench_http_pool [--sites 10] [--pages 60] [--workers 10]
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import patch
+
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.http_client import HttpClient, httpx
+from benchmarks.common import make_config, print_table
+from benchmarks.stub_server import StubSite
+
+
+class PerWorkerSessions(WebCrawler):
+    """Dřívější chování: každý worker má vlastní requests.Session a tedy vlastní pool spojení."""
+
+    def __init__(self, config, resume=False):
+        self._local = threading.local()
+        self._clients = []
+        super().__init__(config, resume=resume)
+        self.dns_cache = None
+
+    @property
+    def http(self):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = HttpClient("requests", self.config.user_agent, stats=self.http_stats)
+            self._clients.append(client)
+        return client
+
+    @http.setter
+    def http(self, value):
+        pass
+
+    def _open_http(self):
+        pass
+
+    def _close_http(self):
+        for client in self._clients:
+            client.close()
+
+
+def crawl(cls, sites, tmp, workers, **overrides):
+    seed_file = Path(tmp) / "seeds.txt"
+    seed_file.write_text("".join(f"{s.start_url} {s.domain}\n" for s in sites), encoding="utf-8")
+    config = make_config(
+        tmp, sites[0].start_url, sites[0].domain,
+        max_workers=workers,
+        max_pages=10_000,
+        seed_file=seed_file,
+        profile="raw",
+        **overrides,
+    )
+    with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+        crawler = cls(config)
+    handshakes = sum(s.handshakes for s in sites)
+    t0 = time.perf_counter()
+    crawler.run()
+    elapsed = time.perf_counter() - t0
+    return crawler.page_count, elapsed, crawler.connection_summary(), sum(s.handshakes for s in sites) - handshakes
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sites", type=int, default=10)
+    ap.add_argument("--pages", type=int, default=60)
+    ap.add_argument("--workers", type=int, default=10)
+    ap.add_argument("--latency", type=float, default=0.01)
+    args = ap.parse_args()
+
+    variants = [
+        ("session na worker", PerWorkerSessions, {}),
+        ("sdílený pool (requests)", WebCrawler, {}),
+        ("bez keep-alive", WebCrawler, {"http_keepalive": False}),
+    ]
+    if httpx is not None:
+        variants.insert(2, ("sdílený pool (httpx)", WebCrawler, {"http_client": "httpx"}))
+
+    rows = []
+    with ExitStack() as stack, tempfile.TemporaryDirectory() as certs:
+        sites = [
+            stack.enter_context(StubSite(pages=args.pages, fanout=3, latency=args.latency, tls=True))
+            for _ in range(args.sites)
+        ]
+        # Certifikáty podepsané samy sebou – klienti jim věří přes společný balík CA.
+        bundle = Path(certs) / "bundle.pem"
+        bundle.write_text("".join(s.cafile.read_text() for s in sites))
+        os.environ["REQUESTS_CA_BUNDLE"] = os.environ["SSL_CERT_FILE"] = str(bundle)
+
+        for label, cls, overrides in variants:
+            with tempfile.TemporaryDirectory() as tmp:
+                pages, elapsed, stats, handshakes = crawl(cls, sites, tmp, args.workers, **overrides)
+            rows.append((
+                label,
+                f"{pages / elapsed:.1f}",
+                stats["connections"],
+                handshakes,
+                f"{handshakes / pages:.2f}",
+                f"{stats['reuse_rate'] * 100:.1f} %",
+                f"{stats['dns_lookups']}/{stats['dns_cached']}",
+            ))
+
+    print(f"\n{args.sites} webů přes HTTPS po {args.pages} stránkách, {args.workers} workerů\n")
+    print_table(
+        ("klient", "stránky/s", "spojení", "TLS handshaky", "handshaky/stránku", "znovupoužito", "DNS dotazy/cache"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_links.py
+# Autor: Martin Šilar
+# Hledání odkazů na velkých stránkách: link_extraction = dom (podle backendu) vs. fast
+#
+# Spuštění:  python -m benchmarks.bench_links [--links 5000] [--pages 20]
+
+import argparse
+import time
+from unittest.mock import patch
+
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.extraction import analyze_page
+from src.webcrawler.link_scanner import scan_links
+from src.webcrawler.parsers import available_parsers, create_document
+from benchmarks.common import make_config, print_table
+
+
+def large_page(n_links: int, seed: int) -> str:
+    parts = ["<html><head><title>Velká stránka</title><base href='/katalog/'></head><body>"]
+    for i in range(n_links):
+        parts.append(
+            f'<div class="item"><h3>Položka {i}</h3><p>Popis položky {i} '
+            f's <b>důležitým</b> textem.</p>'
+            f'<a class="detail" href="produkt/{seed}-{i}?ref=list&amp;p={i % 7}">Detail</a></div>'
+        )
+        if i % 50 == 0:
+            parts.append(f"<script>var x{i} = '<a href=\"/js\">';</script><!-- <a href='/c'> -->")
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--links", type=int, default=5000)
+    ap.add_argument("--pages", type=int, default=20)
+    args = ap.parse_args()
+
+    corpus = [large_page(args.links, seed) for seed in range(args.pages)]
+    page_url = "https://example.com/index.html"
+
+    rows = []
+    for mode, parser in [("dom", p) for p in available_parsers()] + [("fast", "-")]:
+        overrides = {"link_extraction": mode}
+        if parser != "-":
+            overrides["parser"] = parser
+        config = make_config("/tmp/bench_links", page_url, "example.com", **overrides)
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(config)
+
+        # Jen nalezení hodnot href (bez absolutizace přes urljoin).
+        t0 = time.perf_counter()
+        for html in corpus:
+            if mode == "fast":
+                scan_links(html)
+            else:
+                create_document(html, parser).links()
+        scan_elapsed = time.perf_counter() - t0
+
+        found = 0
+        t0 = time.perf_counter()
+        for html in corpus:
+            found += len(analyze_page(None, page_url, html, crawler.parser, mode).links)
+        elapsed = time.perf_counter() - t0
+
+        rows.append((
+            mode, parser, found,
+            f"{scan_elapsed * 1000 / len(corpus):.1f}",
+            f"{found / scan_elapsed:,.0f}",
+            f"{elapsed * 1000 / len(corpus):.1f}",
+            f"{found / elapsed:,.0f}",
+        ))
+
+    avg_kb = sum(len(h) for h in corpus) / len(corpus) / 1024
+    print(f"\n{len(corpus)} stránek po {args.links} odkazech, průměr {avg_kb:.0f} kB\n")
+    print_table(
+        ("režim", "parser", "odkazů", "hledání [ms/str]", "hledání [odkazů/s]",
+         "vč. urljoin [ms/str]", "vč. urljoin [odkazů/s]"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/bench_multi_domain.py
+# Autor: Martin Šilar
+# Mnoho webů: samostatný běh pro každý web vs. jeden běh se seznamem seedů
+#
+# Spuštění:  python -m benchmarks.bench_multi_domain [--sites 20] [--pages 20]
+
+import argparse
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from benchmarks.common import make_config, print_table
+from benchmarks.stub_server import StubSite
+
+
+def crawl(config):
+    crawler = WebCrawler(config)
+    crawler.set_extractor(ContactsExtractor())
+    crawler.run()
+    crawler.save_results()
+    return crawler.page_count
+
+
+def sequential(sites, workers, tmp):
+    pages = 0
+    for i, site in enumerate(sites):
+        config = make_config(Path(tmp) / str(i), site.start_url, site.domain, max_workers=workers, max_pages=10_000)
+        pages += crawl(config)
+    return pages
+
+
+def seed_list(sites, workers, tmp):
+    seed_file = Path(tmp) / "seeds.txt"
+    seed_file.write_text("".join(f"{s.start_url} {s.domain}\n" for s in sites), encoding="utf-8")
+    config = make_config(
+        tmp, sites[0].start_url, sites[0].domain,
+        max_workers=workers,
+        max_pages=10_000,
+        seed_file=seed_file,
+    )
+    return crawl(config)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sites", type=int, default=20)
+    ap.add_argument("--pages", type=int, default=20)
+    ap.add_argument("--workers", type=int, default=10)
+    ap.add_argument("--latency", type=float, default=0.02)
+    args = ap.parse_args()
+
+    rows = []
+    with ExitStack() as stack:
+        sites = [
+            stack.enter_context(StubSite(pages=args.pages, fanout=3, latency=args.latency))
+            for _ in range(args.sites)
+        ]
+        for label, fn in (("běh po webech", sequential), ("seznam seedů", seed_list)):
+            with tempfile.TemporaryDirectory() as tmp:
+                t0 = time.perf_counter()
+                pages = fn(sites, args.workers, tmp)
+                elapsed = time.perf_counter() - t0
+            rows.append((label, pages, f"{elapsed:.2f}", f"{pages / elapsed:.1f}"))
+
+    print(f"\n{args.sites} webů po {args.pages} stránkách, {args.workers} workerů, robots.txt se stahuje\n")
+    print_table(("režim", "stránek", "čas [s]", "stránky/s"), rows)
+
+
+if __name__ == "__main__":
+    main()
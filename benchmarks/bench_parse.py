@@ -0,0 +1,90 @@
+# benchmarks/bench_parse.py
+# Autor: Martin Šilar
+# Úspora parsování: původní dvojí parsování stránky vs. sdílený HtmlDocument
+#
+# Spuštění:  python -m benchmarks.bench_parse [--pages 200]
+
+import argparse
+import time
+
+from bs4 import BeautifulSoup
+
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.content_extractor import ContentExtractor
+from src.webcrawler.extraction import analyze_page
+from src.webcrawler.seo_extractor import SEOExtractor
+from benchmarks.common import print_table
+from benchmarks.stub_server import StubSite
+
+EXTRACTORS = {
+    "contacts": ContactsExtractor,
+    "seo": SEOExtractor,
+    "content": ContentExtractor,
+}
+
+
+def legacy_links(base, html):
+    """Hledání odkazů tak, jak ho dělal crawler před sdíleným dokumentem."""
+    soup = BeautifulSoup(html, "html.parser")
+    return [a["href"] for a in soup.find_all("a", href=True)]
+
+
+def measure(extractor, corpus):
+    legacy = {"parse+extract": 0.0, "links": 0.0}
+    single = {"parse": 0.0, "extract": 0.0, "links": 0.0}
+
+    for url, html in corpus:
+        t0 = time.perf_counter()
+        extractor.extract(url, html)
+        t1 = time.perf_counter()
+        legacy_links(url, html)
+        t2 = time.perf_counter()
+        legacy["parse+extract"] += t1 - t0
+        legacy["links"] += t2 - t1
+
+        analysis = analyze_page(extractor, url, html, "html.parser", "dom")
+        single["parse"] += analysis.parse_seconds
+        single["extract"] += analysis.extract_seconds
+        single["links"] += analysis.links_seconds
+
+    n = len(corpus)
+    return (
+        {k: v * 1000 / n for k, v in legacy.items()},
+        {k: v * 1000 / n for k, v in single.items()},
+    )
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=200)
+    ap.add_argument("--padding", type=int, default=20000)
+    args = ap.parse_args()
+
+    site = StubSite(pages=args.pages, fanout=20, padding=args.padding)
+    corpus = [(f"http://stub/page/{n}", site.render(n)) for n in range(args.pages)]
+
+    rows = []
+    for name, cls in EXTRACTORS.items():
+        legacy, single = measure(cls(), corpus)
+        legacy_total = sum(legacy.values())
+        single_total = sum(single.values())
+        rows.append((
+            name,
+            f"{legacy_total:.2f}",
+            f"{single['parse']:.2f}",
+            f"{single['extract']:.2f}",
+            f"{single['links']:.2f}",
+            f"{single_total:.2f}",
+            f"{(1 - single_total / legacy_total) * 100:.0f} %",
+        ))
+
+    print(f"\nKorpus: {len(corpus)} stránek, průměrná velikost "
+          f"{sum(len(h) for _, h in corpus) // len(corpus)} B\n")
+    print_table(
+        ("profil", "dvojí parse [ms]", "parse [ms]", "extract [ms]", "links [ms]", "jeden parse [ms]", "úspora"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# benchmarks/bench_parsers.py
+# Autor: Martin Šilar
+# Mikrobenchmark HTML backendů: ms/stránku pro parsování a pro všechny dotazy extraktorů
+#
+# Spuštění:  python -m benchmarks.bench_parsers [--corpus data] [--repeat 3]
+# Korpus tvoří stránky uložené crawlerem (save_html = true); když žádné nejsou,
+# použijí se syntetické stránky stub serveru.
+
+import argparse
+import time
+from pathlib import Path
+
+from src.webcrawler.parsers import available_parsers, create_document
+from benchmarks.common import print_table
+from benchmarks.stub_server import StubSite
+
+
+def load_corpus(directory: Path) -> list[str]:
+    pages = []
+    for path in sorted(directory.glob("*.html")):
+        html = path.read_text(encoding="utf-8", errors="replace")
+        if html.startswith("<!-- URL:"):
+            html = html.split("\n", 1)[1] if "\n" in html else ""
+        pages.append(html)
+    return pages
+
+
+def synthetic_corpus(n=200) -> list[str]:
+    site = StubSite(pages=n, fanout=20, padding=20000)
+    return [site.render(i) for i in range(n)]
+
+
+def run_queries(doc):
+    doc.links()
+    doc.title()
+    doc.meta_content("description")
+    doc.meta_content("keywords")
+    doc.headings()
+    doc.clean_text()
+    doc.text("\n", strip=True)
+
+
+def bench(parser, corpus, repeat):
+    parse_total = 0.0
+    full_total = 0.0
+    for _ in range(repeat):
+        for html in corpus:
+            t0 = time.perf_counter()
+            doc = create_document(html, parser).parse()
+            t1 = time.perf_counter()
+            run_queries(doc)
+            t2 = time.perf_counter()
+            parse_total += t1 - t0
+            full_total += t2 - t0
+    n = len(corpus) * repeat
+    return parse_total * 1000 / n, full_total * 1000 / n
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--corpus", type=Path, default=Path("data"))
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus.is_dir() else []
+    source = str(args.corpus)
+    if not corpus:
+        corpus = synthetic_corpus()
+        source = "syntetický (stub server)"
+
+    rows = []
+    baseline = None
+    for parser in available_parsers():
+        parse_ms, full_ms = bench(parser, corpus, args.repeat)
+        if baseline is None:
+            baseline = full_ms
+        rows.append((parser, f"{parse_ms:.2f}", f"{full_ms:.2f}", f"{baseline / full_ms:.1f}x"))
+
+    avg = sum(len(h) for h in corpus) // max(len(corpus), 1)
+    print(f"\nKorpus: {source}, {len(corpus)} stránek, průměr {avg} B\n")
+    print_table(("parser", "parse [ms/str]", "parse+dotazy [ms/str]", "zrychlení"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# benchmarks/bench_priority.py
+# Autor: Martin Šilar
+# Pořadí crawlu pro profil contacts: fifo (do šířky) vs. best_first na webu plném štítků a navigace
+#
+# Spuštění:  python -m benchmarks.bench_priority [--pages 500] [--fanout 4] [--taxonomy 6]
+# Měří se nalezené záznamy (stránky s kontaktem) na stažené stránky při různém max_pages.
+
+import argparse
+import tempfile
+import time
+from unittest.mock import patch
+
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from benchmarks.common import make_config, print_table
+from benchmarks.stub_server import StubSite
+
+
+def run(site, order, max_pages):
+    with tempfile.TemporaryDirectory() as tmp:
+        config = make_config(tmp, site.start_url, site.domain, max_pages=max_pages, crawl_order=order)
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(config)
+        crawler.set_extractor(ContactsExtractor())
+
+        t0 = time.perf_counter()
+        crawler.run()
+        return crawler.page_count, len(crawler.results), time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=500)
+    ap.add_argument("--fanout", type=int, default=4)
+    ap.add_argument("--taxonomy", type=int, default=6)
+    args = ap.parse_args()
+
+    rows = []
+    with StubSite(pages=args.pages, fanout=args.fanout, taxonomy=args.taxonomy) as site:
+        for max_pages in (50, 100, 200):
+            for order in ("fifo", "best_first"):
+                fetched, records, elapsed = run(site, order, max_pages)
+                rows.append((max_pages, order, fetched, records, f"{records / fetched:.2f}", f"{elapsed:.2f}"))
+
+    contacts = (args.pages + 9) // 10
+    print(f"\n{args.pages} stránek ({contacts} s kontaktem), {args.taxonomy} štítků na stránce\n")
+    print_table(("max_pages", "crawl_order", "staženo", "záznamů", "záznamů/stránku", "čas [s]"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# benchmarks/bench_profiles.py
+# Autor: Martin Šilar
+# Tři profily: samostatný crawl pro každý profil vs. jeden crawl s profile = contacts, seo, content
+#
+# Spuštění:  python -m benchmarks.bench_profiles [--pages 200] [--latency 0.01] [--padding 8000]
+# Počítá požadavky na stub server, čas a CPU parsování + extrakce.
+
+import argparse
+import tempfile
+import time
+from unittest.mock import patch
+
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.extractor import build_extractor
+from benchmarks.common import make_config, print_table
+from benchmarks.stub_server import StubSite
+
+PROFILES = ("contacts", "seo", "content")
+
+
+def run(site, profile, max_pages):
+    with tempfile.TemporaryDirectory() as tmp:
+        config = make_config(tmp, site.start_url, site.domain, max_pages=max_pages, profile=profile)
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(config)
+        crawler.set_extractor(build_extractor(profile))
+
+        hits = site.hits
+        t0 = time.perf_counter()
+        crawler.run()
+        elapsed = time.perf_counter() - t0
+        timing = crawler.timing_summary()
+        cpu = (timing["parse"] + timing["extract"]) * crawler.timed_pages / 1000
+        counts = {p: len(rows) for p, rows in crawler.profile_results.items()}
+        return site.hits - hits, elapsed, cpu, counts
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=200)
+    ap.add_argument("--fanout", type=int, default=5)
+    ap.add_argument("--latency", type=float, default=0.01)
+    ap.add_argument("--padding", type=int, default=8000)
+    args = ap.parse_args()
+
+    rows = []
+    with StubSite(pages=args.pages, fanout=args.fanout, latency=args.latency, padding=args.padding) as site:
+        total = [0, 0.0, 0.0]
+        counts = {}
+        for profile in PROFILES:
+            hits, elapsed, cpu, found = run(site, profile, args.pages)
+            rows.append((profile, hits, found[profile], f"{cpu:.2f}", f"{elapsed:.2f}"))
+            total = [total[0] + hits, total[1] + elapsed, total[2] + cpu]
+            counts.update(found)
+        rows.append(("3 běhy celkem", total[0], sum(counts.values()), f"{total[2]:.2f}", f"{total[1]:.2f}"))
+
+        hits, elapsed, cpu, found = run(site, ", ".join(PROFILES), args.pages)
+        rows.append(("jeden běh, 3 profily", hits, sum(found.values()), f"{cpu:.2f}", f"{elapsed:.2f}"))
+
+    print(f"\n{args.pages} stránek, latence {args.latency * 1000:.0f} ms\n")
+    print_table(("profil", "požadavků", "záznamů", "parse+extract [s]", "čas [s]"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# benchmarks/bench_recrawl.py
+# Autor: Martin Šilar
+# Inkrementální recrawl: první běh vs. opakovaný běh s recrawl_cache (podmíněný GET, převzetí uložené extrakce)
+#
+# Spuštění:  python -m benchmarks.bench_recrawl [--pages 3000] [--changed 0.1]
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from benchmarks.common import make_config, print_table
+from benchmarks.stub_server import StubSite
+
+
+def crawl(tmp, site, pages, validators):
+    config = make_config(
+        tmp, site.start_url, site.domain,
+        max_pages=pages,
+        recrawl_cache=Path(tmp) / "recrawl.sqlite",
+    )
+    with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+        crawler = WebCrawler(config)
+    crawler.set_extractor(ContactsExtractor())
+
+    sent = site.bytes_sent
+    t0 = time.perf_counter()
+    crawler.run()
+    elapsed = time.perf_counter() - t0
+
+    timing = crawler.timing_summary()
+    cpu_ms = timing["parse"] + timing["extract"] + timing["links"]
+    return elapsed, site.bytes_sent - sent, cpu_ms, crawler.recrawl_summary()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=3000)
+    ap.add_argument("--padding", type=int, default=20000)
+    ap.add_argument("--changed", type=float, default=0.1)
+    args = ap.parse_args()
+
+    rows = []
+    for validators in (True, False):
+        site = StubSite(pages=args.pages, padding=args.padding, validators=validators)
+        site.start()
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                runs = [("první běh", crawl(tmp, site, args.pages, validators))]
+                site.edited.update(random.Random(1).sample(range(args.pages), int(args.pages * args.changed)))
+                runs.append(("recrawl", crawl(tmp, site, args.pages, validators)))
+        finally:
+            site.stop()
+
+        for name, (elapsed, sent, cpu_ms, summary) in runs:
+            rows.append((
+                "ETag" if validators else "bez validátorů",
+                name,
+                f"{elapsed:.2f}",
+                f"{sent / 2**20:.1f}",
+                f"{cpu_ms:.2f}",
+                summary["not_modified"],
+                summary["unchanged"],
+            ))
+
+    print(f"\n{args.pages} stránek po ~{args.padding // 1000} kB, změněno {args.changed * 100:.0f} % stránek\n")
+    print_table(("server", "běh", "čas [s]", "přeneseno [MB]", "CPU [ms/stránku]", "304", "stejný hash"), rows)
+
+
+if __name__ == "__main__":
+    main()
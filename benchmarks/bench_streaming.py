@@ -0,0 +1,67 @@
+# benchmarks/bench_streaming.py
+# Autor: Martin Šilar
+# Streamované stahování: celé tělo každé odpovědi vs. kontrola Content-Type / Content-Length a limit max_body_bytes
+#
+# Spuštění:  python -m benchmarks.bench_streaming [--pages 300] [--attachment-mb 5]
+
+import argparse
+import tempfile
+import time
+from unittest.mock import patch
+
+from src.webcrawler.crawler import WebCrawler
+from benchmarks.common import make_config, print_table
+from benchmarks.stub_server import StubSite
+
+
+def crawl(site, limit, gated):
+    with tempfile.TemporaryDirectory() as tmp:
+        config = make_config(tmp, site.start_url, site.domain, max_pages=10_000, max_body_bytes=limit)
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(config)
+        sent = site.bytes_sent
+        t0 = time.perf_counter()
+        if gated:
+            crawler.run()
+        else:
+            # Dřívější chování: každé tělo se stáhne celé a dekóduje jako HTML.
+            with patch("src.webcrawler.http_client.check_headers", return_value=None):
+                crawler.run()
+        elapsed = time.perf_counter() - t0
+    return elapsed, site.bytes_sent - sent, crawler.connection_summary()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=300)
+    ap.add_argument("--attachment-mb", type=float, default=5)
+    ap.add_argument("--limit-mb", type=float, default=1)
+    args = ap.parse_args()
+
+    attachment = int(args.attachment_mb * 2**20)
+    oversized = range(7, args.pages, 25)
+    rows = []
+    with StubSite(pages=args.pages, fanout=4, attachments=attachment, oversized=oversized, padding=24000) as site:
+        for label, limit, gated in (
+            ("celé tělo (dříve)", 0, False),
+            ("Content-Type + limit", int(args.limit_mb * 2**20), True),
+        ):
+            elapsed, sent, stats = crawl(site, limit, gated)
+            rows.append((
+                label,
+                f"{elapsed:.2f}",
+                f"{stats['bytes_read'] / 2**20:.1f}" if gated else f"{sent / 2**20:.1f}",
+                stats["skipped_content_type"],
+                stats["skipped_too_large"],
+                f"{stats['bytes_avoided'] / 2**20:.1f}",
+            ))
+
+    print(
+        f"\n{args.pages} stránek, na každé odkaz na PDF {args.attachment_mb:g} MB, "
+        f"{len(oversized)} stránek ~1,2 MB, limit {args.limit_mb:g} MB\n"
+    )
+    print_table(("režim", "čas [s]", "staženo [MB]", "ne-HTML", "přes limit", "ušetřeno [MB]"), rows)
+
+
+if __name__ == "__main__":
+    main()
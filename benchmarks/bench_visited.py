@@ -0,0 +1,80 @@
+# benchmarks/bench_visited.py
+# Autor: Martin Šilar
+# Paměť na URL a propustnost vkládání/dotazů pro visited_store = set / fingerprint / bloom
+#
+# Spuštění:  python -m benchmarks.bench_visited [--urls 500000]
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.webcrawler.visited import make_visited_set
+from benchmarks.common import print_table
+
+
+def make_urls(n, prefix):
+    return [f"https://www.example.cz/{prefix}/kategorie-{i % 97}/clanek-{i}?strana={i % 13}" for i in range(n)]
+
+
+def bench(kind, n, error_rate, capacity):
+    # URL se vyrábí až uvnitř měření: v crawleru drží set jediný trvalý odkaz na řetězec,
+    # kompaktní úložiště si řetězec nenechává vůbec.
+    gc.collect()
+    tracemalloc.start()
+    visited = make_visited_set(kind, capacity=capacity, error_rate=error_rate)
+
+    t0 = time.perf_counter()
+    for i in range(n):
+        visited.add(f"https://www.example.cz/a/kategorie-{i % 97}/clanek-{i}?strana={i % 13}")
+    add_seconds = time.perf_counter() - t0
+
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    hits = make_urls(n, "a")
+    misses = make_urls(n, "b")
+
+    t0 = time.perf_counter()
+    found = sum(1 for u in hits if u in visited)
+    hit_seconds = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    false_positives = sum(1 for u in misses if u in visited)
+    miss_seconds = time.perf_counter() - t0
+
+    assert found == n
+    return memory, add_seconds, hit_seconds, miss_seconds, false_positives
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--urls", type=int, default=500_000)
+    ap.add_argument("--error-rate", type=float, default=0.001)
+    ap.add_argument("--capacity", type=int, default=100_000, help="visited_capacity (počáteční velikost)")
+    args = ap.parse_args()
+
+    n = args.urls
+    rows = []
+    for kind in ("set", "fingerprint", "bloom"):
+        memory, add_s, hit_s, miss_s, fp = bench(kind, n, args.error_rate, args.capacity)
+        rows.append((
+            kind,
+            f"{memory / n:.1f}",
+            f"{memory / 2**20:.1f}",
+            f"{n / add_s / 1000:.0f}",
+            f"{n / hit_s / 1000:.0f}",
+            f"{n / miss_s / 1000:.0f}",
+            f"{fp / n * 100:.3f} %",
+        ))
+
+    print(f"\n{n} URL, visited_capacity {args.capacity}, bloom error_rate {args.error_rate}\n")
+    print_table(
+        ("visited_store", "B/URL", "celkem [MB]", "add [k/s]", "hit [k/s]", "miss [k/s]", "falešné shody"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# benchmarks/common.py
+# Autor: Martin Šilar
+# Společné pomůcky pro benchmarky
+
+import resource
+from pathlib import Path
+
+from src.webcrawler.config import CrawlerConfig
+
+
+def make_config(workdir: Path, start_url: str, domain: str, **overrides) -> CrawlerConfig:
+    """Konfigurace crawleru mířící do dočasného adresáře."""
+    values = dict(
+        start_url=start_url,
+        allowed_domain=domain,
+        max_workers=5,
+        max_pages=100,
+        queue_maxsize=100000,
+        request_timeout=30,
+        user_agent="WebCrawlerBenchmark/1.0",
+        output_dir=Path(workdir) / "data",
+        log_file=Path(workdir) / "logs" / "bench.log",
+        profile="contacts",
+        save_html=False,
+        profiles=["contacts", "seo", "content"],
+    )
+    values.update(overrides)
+    return CrawlerConfig(**values)
+
+
+def peak_rss_mb() -> float:
+    """Maximální RSS aktuálního procesu v MB (Linux vrací ru_maxrss v kB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    line = "  ".join(str(h).ljust(w) for h, w in zip(headers, widths))
+    print(line)
+    print("-" * len(line))
+    for r in rows:
+        print("  ".join(str(v).ljust(w) for v, w in zip(r, widths)))
@@ -0,0 +1,315 @@
+# benchmarks/stub_server.py
+# Autor: Martin Šilar
+# Lokální HTTP server se syntetickým webem pro benchmarky a integrační testy
+
+import posixpath
+import random
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote
+
+
+def make_self_signed_cert(directory: Path) -> tuple[Path, Path]:
+    """Certifikát a klíč pro 127.0.0.1 (vyžaduje příkaz openssl)."""
+    cert, key = Path(directory) / "cert.pem", Path(directory) / "key.pem"
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-keyout", str(key), "-out", str(cert),
+         "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1"],
+        check=True, capture_output=True,
+    )
+    return cert, key
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+    tls_context = None
+    on_handshake = None
+
+    def finish_request(self, request, client_address):
+        # TLS handshake běží ve vlákně požadavku, ne ve smyčce accept.
+        if self.tls_context is None:
+            return super().finish_request(request, client_address)
+        try:
+            request = self.tls_context.wrap_socket(request, server_side=True)
+        except (ssl.SSLError, OSError):
+            return
+        try:
+            self.on_handshake()
+            super().finish_request(request, client_address)
+        finally:
+            request.close()
+
+
+class StubSite:
+    """
+    Syntetický web: stránky /page/0 … /page/{pages-1} tvořící strom s větvením fanout.
+    Každá stránka s indexem dělitelným 10 obsahuje kontaktní e-mail a telefon.
+    latency simuluje síťové zpoždění odpovědi (v sekundách).
+    duplicate_links přidá ke každému odkazu varianty téže URL (sledovací
+    parametry, přeházený dotaz, %XX v cestě, /../) – server je všechny
+    obslouží stejnou stránkou, jako běžný web.
+    mirrors přidá ke každé stránce přesnou kopii /copy/N a verzi pro tisk
+    /print/N (stejná stránka s hlavičkou pro tisk) a text stránek je pak jedinečný.
+    validators posílá ETag a Last-Modified a na podmíněný GET odpoví 304;
+    stránky v edited mají změněný obsah (a tedy i ETag).
+    tls servíruje web přes HTTPS s certifikátem podepsaným sám sebou (cafile),
+    handshakes počítá navázaná TLS spojení.
+    attachments > 0 přidá ke každé stránce odkaz na PDF /files/N.pdf o této
+    velikosti, stránky v oversized mají 50× delší obsah a s send_length=False
+    server neposílá Content-Length (tělo končí zavřením spojení).
+    encoding (např. windows-1250) servíruje stránky v daném kódování,
+    ohlášeném jen v <meta charset>, ne v hlavičce Content-Type.
+    taxonomy > 0 přidá na začátek každé stránky tolik odkazů na štítky
+    /stitky/K (výpisy bez kontaktů, které odkazují na další štítky) a stránky
+    s kontaktem odkazuje jako /kontakt/N – web, na kterém crawl do šířky
+    utratí max_pages hlavně za navigaci.
+    """
+
+    WORDS = (
+        "crawler stránka obsah kontakt služba firma produkt cena objednávka doprava "
+        "novinka článek autor datum město ulice telefon email dotaz odpověď "
+        "zákazník podpora návod recenze kategorie výrobce sklad akce sleva termín"
+    ).split()
+
+    def __init__(self, pages=200, fanout=5, latency=0.0, padding=2000, duplicate_links=False, mirrors=False,
+                 validators=False, tls=False, attachments=0, oversized=(), send_length=True,
+                 encoding=None, taxonomy=0):
+        self.pages = pages
+        self.fanout = fanout
+        self.latency = latency
+        self.padding = padding
+        self.duplicate_links = duplicate_links
+        self.mirrors = mirrors
+        self.validators = validators
+        self.tls = tls
+        self.attachments = attachments
+        self.oversized = set(oversized)
+        self.send_length = send_length
+        self.encoding = encoding
+        self.taxonomy = taxonomy
+        self.cafile = None
+        self.handshakes = 0
+        self._tmp = None
+        self.edited = set()
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self.hits = 0
+        self.path_hits = Counter()
+        self.inflight = 0
+        self.peak_inflight = 0
+        self.hits_lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"{'https' if self.tls else 'http'}://{host}:{port}"
+
+    @property
+    def start_url(self):
+        return self.base_url + "/page/0"
+
+    @property
+    def domain(self):
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def _tag_links(self, n: int) -> list[str]:
+        return [
+            f'<a href="/stitky/{(n * self.taxonomy + j) % self.pages}">Štítek</a>'
+            for j in range(1, self.taxonomy + 1)
+        ]
+
+    def render_tag(self, k: int) -> str:
+        return (
+            f"<html><head><title>Štítek {k}</title></head><body><h1>Štítek {k}</h1>"
+            f"<nav>{''.join(self._tag_links(k))}</nav>"
+            f'<p><a href="/page/{k}">Stránka {k}</a></p>'
+            "</body></html>"
+        )
+
+    def render(self, n: int, print_view=False) -> str:
+        links = self._tag_links(n) if self.taxonomy else []
+        for i in range(1, self.fanout + 1):
+            child = n * self.fanout + i
+            if child < self.pages:
+                section = "kontakt" if self.taxonomy and child % 10 == 0 else "page"
+                links.append(f'<a href="/{section}/{child}">Stránka {child}</a>')
+                if self.duplicate_links:
+                    links.extend(self._duplicate_links(child))
+        links.append('<a href="/page/0">Domů</a>')
+        if self.mirrors:
+            links.append(f'<a href="/copy/{n}">Kopie</a><a href="/print/{n}">Tisk</a>')
+        if self.attachments:
+            links.append(f'<a href="/files/{n}.pdf">Ceník (PDF)</a>')
+
+        contact = ""
+        if n % 10 == 0:
+            contact = f"<p>Kontakt: info{n}@example.cz, tel: +420 777 {n % 1000:03d} 456</p>"
+
+        if self.mirrors:
+            rng = random.Random(n)
+            words = [rng.choice(self.WORDS) for _ in range(self.padding // 8)]
+            filler = f'<div class="text"><p>{" ".join(words)}</p></div>'
+        else:
+            filler = '<div class="text"><p>Lorem ipsum <b>dolor</b> sit amet.</p></div>' * (self.padding // 64)
+        if n in self.oversized:
+            filler *= 50
+
+        banner = "<p>Verze pro tisk</p>" if print_view else ""
+        if n in self.edited:
+            banner += "<p>Upraveno</p>"
+        charset = f'<meta charset="{self.encoding}">' if self.encoding else ""
+
+        return (
+            "<html><head>"
+            f"{charset}"
+            f"<title>Stránka {n}</title>"
+            f'<meta name="description" content="Popis stránky {n}">'
+            "</head><body>"
+            f"<h1>Stránka {n}</h1>"
+            f"{banner}{contact}{filler}"
+            f"<nav>{''.join(links)}</nav>"
+            "</body></html>"
+        )
+
+    @staticmethod
+    def _duplicate_links(n: int) -> list[str]:
+        variants = (
+            f"/page/{n}?utm_source=nav&amp;utm_medium=link",
+            f"/page/{n}?a=1&amp;b=2",
+            f"/page/{n}?b=2&amp;a=1",
+            f"/%70age/{n}",
+            f"/page/x/../{n}",
+        )
+        return [f'<a href="{href}">Varianta {n}</a>' for href in variants]
+
+    def _make_handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with site.hits_lock:
+                    site.hits += 1
+                    site.path_hits[self.path] += 1
+                    site.inflight += 1
+                    site.peak_inflight = max(site.peak_inflight, site.inflight)
+
+                # Souběžné požadavky se počítají jen během simulovaného zpoždění,
+                # odeslání odpovědi už se s dalším požadavkem klienta může překrývat.
+                if site.latency > 0:
+                    time.sleep(site.latency)
+                with site.hits_lock:
+                    site.inflight -= 1
+
+                path = self.path.split("?", 1)[0].split("#", 1)[0]
+                if path:
+                    path = posixpath.normpath(unquote(path))
+
+                if site.attachments and path.startswith("/files/") and path.endswith(".pdf"):
+                    self._send(200, b"%PDF-1.4\n" + b"0" * (site.attachments - 9), "application/pdf")
+                    return
+
+                prefixes = ("/page/", "/copy/", "/print/") if site.mirrors else ("/page/",)
+                if site.taxonomy:
+                    prefixes += ("/kontakt/", "/stitky/")
+                prefix = next((p for p in prefixes if path.startswith(p)), None)
+                if path in ("/", ""):
+                    n = 0
+                elif prefix:
+                    try:
+                        n = int(path[len(prefix):].strip("/"))
+                    except ValueError:
+                        n = -1
+                else:
+                    n = -1
+
+                if n < 0 or n >= site.pages:
+                    self._send(404, b"not found", "text/plain")
+                    return
+
+                if prefix == "/stitky/":
+                    body = site.render_tag(n).encode(site.encoding or "utf-8")
+                else:
+                    body = site.render(n, print_view=prefix == "/print/").encode(site.encoding or "utf-8")
+                headers = {}
+                if site.validators:
+                    headers["ETag"] = f'"{zlib.crc32(body):08x}"'
+                    headers["Last-Modified"] = "Mon, 05 Oct 2026 10:00:00 GMT"
+                    if self.headers.get("If-None-Match") == headers["ETag"]:
+                        with site.hits_lock:
+                            site.not_modified += 1
+                        self._send(304, b"", None, headers)
+                        return
+                self._send(200, body, "text/html" if site.encoding else "text/html; charset=utf-8", headers)
+
+            def _send(self, status, body, ctype, headers=None):
+                self.send_response(status)
+                if ctype:
+                    self.send_header("Content-Type", ctype)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if site.send_length or status == 304:
+                    self.send_header("Content-Length", str(len(body)))
+                else:
+                    self.send_header("Connection", "close")
+                    self.close_connection = True
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Klient čtení přerušil (limit velikosti, jiný typ obsahu).
+                    self.close_connection = True
+                    return
+                with site.hits_lock:
+                    site.bytes_sent += len(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._server = _Server(("127.0.0.1", 0), self._make_handler())
+        if self.tls:
+            self._tmp = tempfile.TemporaryDirectory()
+            self.cafile, key = make_self_signed_cert(self._tmp.name)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self.cafile, key)
+            self._server.tls_context = context
+            self._server.on_handshake = self._count_handshake
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def _count_handshake(self):
+        with self.hits_lock:
+            self.handshakes += 1
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._tmp:
+            self._tmp.cleanup()
+            self._tmp = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
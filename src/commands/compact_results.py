@@ -0,0 +1,40 @@
+# src/commands/compact_results.py
+# Autor: Martin Šilar
+# Převod průběžně zapsaných výsledků (JSONL / CSV / SQLite / Parquet) na původní <profil>_data.json
+
+from ..webcrawler.config import load_config
+from ..webcrawler.extractor import profile_names
+from ..webcrawler.sink import SUFFIXES, compact_to_json
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+CYAN = "\033[96m"
+RESET = "\033[0m"
+
+
+class CompactResultsCommand:
+    def __init__(self, config_path="config.ini"):
+        self.config_path = config_path
+
+    def execute(self):
+        config = load_config(self.config_path)
+        if config.result_format == "json":
+            print(f"{RED}Výsledky se už ukládají jako JSON (result_format = json).{RESET}")
+            return
+
+        names = [f"{profile}_data{SUFFIXES[config.result_format]}" for profile in profile_names(config.profile)]
+        # Jeden web: output_dir/<soubor>, seznam seedů: output_dir/<doména>/<soubor>.
+        paths = []
+        for name in names:
+            paths += sorted(config.output_dir.glob(name)) + sorted(config.output_dir.glob(f"*/{name}"))
+        if not paths:
+            print(f"{RED}V {config.output_dir} nejsou žádné výsledky {', '.join(names)}.{RESET}")
+            return
+
+        for path in paths:
+            try:
+                output_path = compact_to_json(path)
+            except (ImportError, ValueError, OSError) as e:
+                print(f"{RED}{path}: {e}{RESET}")
+                continue
+            print(f"{GREEN}{path}{RESET} -> {CYAN}{output_path}{RESET}")
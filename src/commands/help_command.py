@@ -30,6 +30,7 @@ class HelpCommand(Command):
    contacts → e-maily, telefonní čísla
    seo      → title, meta description, nadpisy
    content  → čistý text stránky
+   raw      → jen procházení a ukládání HTML (se save_html = true)
 
 3) {GREEN}Konfigurace{RESET}
    Nastavení lze měnit přímo v aplikaci:
@@ -0,0 +1,66 @@
+# src/commands/reextract.py
+# Autor: Martin Šilar
+# Opakovaná extrakce nad uloženým HTML bez nového crawlu
+
+from tqdm import tqdm
+
+from ..webcrawler.config import load_config
+from ..webcrawler.extractor import profile_names
+from ..webcrawler.reextract import REEXTRACT_DIR, reextract
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+CYAN = "\033[96m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+
+class ReextractCommand:
+    def __init__(self, config_path="config.ini", profile=None, processes=None):
+        self.config_path = config_path
+        self.profile = profile
+        self.processes = processes
+
+    def execute(self):
+        config = load_config(self.config_path)
+        profile = (self.profile or config.profile).lower()
+        processes = self.processes if self.processes is not None else config.extract_processes
+        # Výsledky se vždy zapisují průběžně; místo json se použije jsonl (převod přes --compact-to-json).
+        result_format = config.result_format if config.result_format != "json" else "jsonl"
+
+        print(f"\n{CYAN}{BOLD}========== Reextrakce ({profile}) z {config.output_dir} =========={RESET}\n")
+
+        progress = tqdm(desc="Stránky", unit="str", dynamic_ncols=True)
+        last = [0]
+
+        def on_page(stats):
+            progress.update(stats.pages - last[0])
+            last[0] = stats.pages
+
+        try:
+            stats = reextract(
+                config.output_dir, profile,
+                parser=config.parser,
+                processes=processes,
+                result_format=result_format,
+                fsync=config.result_fsync,
+                progress=on_page,
+                seed_file=config.seed_file,
+            )
+        except (ImportError, ValueError, OSError) as e:
+            progress.close()
+            print(f"{RED}{e}{RESET}")
+            return
+        progress.close()
+
+        if not stats.pages:
+            print(f"{RED}V {config.output_dir} není žádné uložené HTML (save_html = true).{RESET}")
+            return
+
+        print(f"\n{GREEN}{BOLD}========== HOTOVO =========={RESET}")
+        print(
+            f"Stránky: {stats.pages}, výsledky: {stats.results}, chyby: {stats.errors}, "
+            f"{stats.pages / stats.seconds:.0f} stránek/s"
+        )
+        for name in profile_names(profile):
+            print(f"Výsledky: {CYAN}{config.output_dir}/{REEXTRACT_DIR}/**/{name}_data.{result_format}{RESET}")
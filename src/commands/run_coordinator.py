@@ -0,0 +1,61 @@
+# src/commands/run_coordinator.py
+# Autor: Martin Šilar
+# Spuštění koordinátora distribuovaného crawlu
+
+import time
+
+from ..webcrawler.config import load_config
+from ..webcrawler.distributed import Coordinator, serve_coordinator
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+CYAN = "\033[96m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+
+class RunCoordinatorCommand:
+    def __init__(self, config_path="config.ini"):
+        self.config_path = config_path
+
+    def execute(self):
+        print(f"\n{CYAN}{BOLD}========== Koordinátor distribuovaného crawlu =========={RESET}\n")
+
+        config = load_config(self.config_path)
+        try:
+            coordinator = Coordinator(config)
+            server = serve_coordinator(coordinator, config.coordinator, config.coordinator_authkey)
+        except (ValueError, OSError) as e:
+            print(f"{RED}{e}{RESET}")
+            return
+
+        print(f"Čekám na workery na {CYAN}{config.coordinator}{RESET} (python -m src.main --worker)")
+
+        last = None
+        try:
+            while not coordinator.finished.wait(1.0):
+                stats = coordinator.stats()
+                line = (stats["workers"], stats["pages"], stats["queued"])
+                if line != last:
+                    print(f"Workery: {stats['workers']}, stránky: {stats['pages']}, ve frontě: {stats['queued']}")
+                    last = line
+
+            # Workery se po konci ještě naposledy ozvou s výsledky.
+            deadline = time.monotonic() + config.lease_timeout
+            while coordinator.stats()["workers"] and time.monotonic() < deadline:
+                time.sleep(0.1)
+        except KeyboardInterrupt:
+            print(f"\n{RED}Přerušeno – ukládám dosavadní výsledky.{RESET}")
+        finally:
+            server.stop_event.set()
+
+        output_path = coordinator.save_results()
+        stats = coordinator.stats()
+
+        print(f"\n{GREEN}{BOLD}========== HOTOVO =========={RESET}")
+        print(f"Výsledky: {CYAN}{output_path}{RESET}")
+        print(
+            f"Stránky: {stats['pages']} od {stats['registered']} workerů, "
+            f"odkazy zahozené jako už navštívené: {stats['duplicates_dropped']}, "
+            f"vrácené výpůjčky: {stats['requeued']}"
+        )
@@ -7,10 +7,8 @@ import threading
 import time
 from tqdm import tqdm
 
-from ..webcrawler.crawler import WebCrawler
-from ..webcrawler.contacts_extractor import ContactsExtractor
-from ..webcrawler.seo_extractor import SEOExtractor
-from ..webcrawler.content_extractor import ContentExtractor
+from ..webcrawler.engine import build_crawler
+from ..webcrawler.extractor import build_extractor, profile_names
 from ..webcrawler.config import load_config
 
 GREEN = "\033[92m"
@@ -21,23 +19,37 @@ BOLD = "\033[1m"
 
 
 class RunCrawlerCommand:
+    def __init__(self, config_path="config.ini", resume=False):
+        self.config_path = config_path
+        self.resume = resume
+
     def execute(self):
-        print(f"\n{CYAN}{BOLD}========== Spouštím crawler =========={RESET}\n")
+        title = "Navazuji přerušený crawl" if self.resume else "Spouštím crawler"
+        print(f"\n{CYAN}{BOLD}========== {title} =========={RESET}\n")
 
-        config = load_config()
-        crawler = WebCrawler(config)
+        config = load_config(self.config_path)
+        if self.resume and not config.state_file:
+            print(f"{RED}Pro --resume nastav v configu state_file.{RESET}")
+            return
 
-        if config.profile == "contacts":
-            extractor = ContactsExtractor()
-        elif config.profile == "seo":
-            extractor = SEOExtractor()
-        elif config.profile == "content":
-            extractor = ContentExtractor()
-        else:
-            print(f"{RED}Neplatný profil v configu.{RESET}")
+        try:
+            crawler = build_crawler(config, resume=self.resume)
+        except (ImportError, ValueError, OSError) as e:
+            print(f"{RED}{e}{RESET}")
             return
 
-        crawler.set_extractor(extractor)
+        # profile = contacts, seo, … spustí všechny vyjmenované profily nad jedním crawlem.
+        if config.profile == "raw":
+            extractor = None
+        else:
+            try:
+                extractor = build_extractor(config.profile)
+            except ValueError:
+                print(f"{RED}Neplatný profil v configu.{RESET}")
+                return
+
+        if extractor:
+            crawler.set_extractor(extractor)
 
         progress = tqdm(
             total=config.max_pages,
@@ -77,6 +89,61 @@ class RunCrawlerCommand:
             except Exception:
                 pass
 
+        if crawler.interrupted:
+            print(f"\n{RED}Přerušeno – pokračuj pomocí: python -m src.main --resume{RESET}")
+
         print(f"\n{GREEN}{BOLD}========== HOTOVO =========={RESET}")
-        print(f"Výsledný JSON: {CYAN}{output_path}{RESET}")
+        if crawler.multi_domain:
+            print(f"Výsledky po doménách ({len(crawler.seeds)} webů): {CYAN}{output_path}{RESET}")
+        else:
+            print(f"Výsledky: {CYAN}{output_path}{RESET}")
+        if len(crawler.profiles) > 1:
+            counts = ", ".join(f"{p} {len(r)}" for p, r in crawler.profile_results.items())
+            print(f"Profily ({', '.join(crawler.profiles)}) z jednoho crawlu" + (f": {counts}" if not crawler.sink else ""))
+        if crawler.sink:
+            names = ", ".join(f"{p}_data.json" for p in profile_names(config.profile))
+            print(f"Převod na {names}: python -m src.main --compact-to-json")
+
+        timing = crawler.timing_summary()
+        print("Průměr na stránku: " + ", ".join(f"{k} {v:.1f} ms" for k, v in timing.items()))
+
+        frontier = crawler.frontier_summary()
+        if frontier["spilled"]:
+            print(f"Fronta: {frontier['spilled']} URL přeteklo na disk, {frontier['refilled']} se vrátilo do paměti")
+
+        admission = crawler.admission_summary()
+        print(
+            f"Přijímání odkazů: visited v {admission['shards']} částech, čekání na zámky "
+            f"{admission['wait_per_worker_ms']:.1f} ms na worker ({admission['contended']} z {admission['acquisitions']} zamčení)"
+        )
+
+        if crawler.canonicalizer:
+            canon = crawler.canonical_summary()
+            print(f"Kanonizace URL: přepsáno {canon['rewritten']} odkazů, ušetřeno {canon['saved']} stažení")
+
+        if crawler.duplicates:
+            dedup = crawler.dedup_summary()
+            print(
+                f"Duplicitní stránky: {dedup['exact']} přesných, {dedup['near']} téměř shodných "
+                f"z {dedup['checked']} ({dedup['rate'] * 100:.1f} %)"
+            )
+
+        conn = crawler.connection_summary()
+        print(
+            f"Spojení: {conn['connections']} nových na {conn['requests']} požadavků "
+            f"(znovupoužito {conn['reuse_rate'] * 100:.1f} %), TLS handshaky na stránku {conn['handshakes_per_page']:.2f}"
+        )
+
+        if conn["skipped_content_type"] or conn["skipped_too_large"]:
+            print(
+                f"Nestaženo: {conn['skipped_content_type']} odpovědí mimo HTML, {conn['skipped_too_large']} přes "
+                f"max_body_bytes, ušetřeno {conn['bytes_avoided'] / 2**20:.1f} MB"
+            )
+
+        if crawler.recrawl:
+            recrawl = crawler.recrawl_summary()
+            print(
+                f"Recrawl: {recrawl['not_modified']} stránek 304, {recrawl['unchanged']} beze změny, "
+                f"ušetřeno {recrawl['bytes_saved'] / 2**20:.1f} MB přenosu a {recrawl['cpu_saved']:.1f} s CPU"
+            )
         input(f"\n{BOLD}Stiskněte Enter pro návrat do menu...{RESET}")
@@ -0,0 +1,34 @@
+# src/commands/run_worker.py
+# Autor: Martin Šilar
+# Spuštění workera distribuovaného crawlu
+
+from ..webcrawler.config import load_config
+from ..webcrawler.distributed import DistributedCrawler
+from ..webcrawler.extractor import build_extractor
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+CYAN = "\033[96m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+
+class RunWorkerCommand:
+    def __init__(self, config_path="config.ini"):
+        self.config_path = config_path
+
+    def execute(self):
+        config = load_config(self.config_path)
+        try:
+            extractor = build_extractor(config.profile) if config.profile != "raw" else None
+            crawler = DistributedCrawler(config)
+        except (ImportError, ValueError, OSError) as e:
+            print(f"{RED}{e}{RESET}")
+            return
+
+        if extractor:
+            crawler.set_extractor(extractor)
+
+        print(f"{CYAN}Worker {crawler.worker_id} připojen ke koordinátoru {config.coordinator}{RESET}")
+        crawler.run()
+        print(f"{GREEN}Worker {crawler.worker_id} hotov: {crawler.page_count} stránek{RESET}")
@@ -19,11 +19,18 @@ class ShowConfigCommand(Command):
     def execute(self):
         html_state = f"{GREEN}ON{RESET}" if self.config.save_html else f"{RED}OFF{RESET}"
 
+        if self.config.seed_file:
+            target = f"Seznam seedů:    {YELLOW}{self.config.seed_file}{RESET}"
+        else:
+            target = (
+                f"Start URL:       {YELLOW}{self.config.start_url}{RESET}\n"
+                f"Doména:          {YELLOW}{self.config.allowed_domain}{RESET}"
+            )
+
         print(f"""
 {CYAN}{BOLD}Aktuální konfigurace:{RESET}
 -----------------------------------
-Start URL:       {YELLOW}{self.config.start_url}{RESET}
-Doména:          {YELLOW}{self.config.allowed_domain}{RESET}
+{target}
 Profil:          {YELLOW}{self.config.profile}{RESET}
 Ukládání HTML:   {html_state}
 Max workers:     {self.config.max_workers}
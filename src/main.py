@@ -5,6 +5,10 @@
 import sys
 from src.webcrawler.config import load_config
 from src.commands.run_crawler import RunCrawlerCommand
+from src.commands.run_coordinator import RunCoordinatorCommand
+from src.commands.run_worker import RunWorkerCommand
+from src.commands.compact_results import CompactResultsCommand
+from src.commands.reextract import ReextractCommand
 from src.commands.show_config import ShowConfigCommand
 from src.commands.config_menu import ConfigMenuCommand
 from src.commands.help_command import HelpCommand
@@ -19,14 +23,40 @@ YELLOW = "\033[93m"
 
 
 def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    flags = sys.argv[1:]
+    options = dict(a[2:].split("=", 1) for a in flags if a.startswith("--") and "=" in a)
+    resume = "--resume" in flags
+
     config_path = "config.ini"
-    if len(sys.argv) > 1:
-        config_path = sys.argv[1]
+    if args:
+        config_path = args[0]
+
+    if resume:
+        RunCrawlerCommand(config_path, resume=True).execute()
+        return
+
+    if "--coordinator" in flags:
+        RunCoordinatorCommand(config_path).execute()
+        return
+
+    if "--worker" in flags:
+        RunWorkerCommand(config_path).execute()
+        return
+
+    if "--compact-to-json" in flags:
+        CompactResultsCommand(config_path).execute()
+        return
+
+    if "--reextract" in flags:
+        processes = int(options["processes"]) if "processes" in options else None
+        ReextractCommand(config_path, options.get("profile"), processes).execute()
+        return
 
     config = load_config(config_path)
 
     commands = {
-        "1": RunCrawlerCommand(),
+        "1": RunCrawlerCommand(config_path),
         "2": ShowConfigCommand(config),
         "3": ConfigMenuCommand(config, config_path),
         "4": HelpCommand(config),
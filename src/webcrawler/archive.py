@@ -0,0 +1,264 @@
+# src/webcrawler/archive.py
+# Autor: Martin Šilar
+# Archiv stažených stránek ve formátu WARC – komprimované záznamy v segmentech s indexem místo souboru na stránku
+
+import gzip
+import http
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .charset import decode_html, detect_encoding
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+ARCHIVE_COMPRESSIONS = ("gzip", "zstd")
+HTML_STORES = ("files", "archive")
+
+INDEX_NAME = "index.tsv"
+SEGMENT_PREFIX = "pages-"
+
+# Hlavičky popisující přenos, které po dekódování těla neplatí.
+_TRANSFER_HEADERS = frozenset(("content-encoding", "content-length", "transfer-encoding"))
+
+
+@dataclass(frozen=True)
+class ResponseMeta:
+    status: int = 200
+    headers: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ArchiveRecord:
+    url: str
+    status: int
+    headers: dict
+    timestamp: str
+    body: str
+    payload: bytes = b""
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    segment: str
+    offset: int
+    length: int
+    status: int
+    timestamp: str
+    url: str
+
+
+def _suffix(compression: str) -> str:
+    return ".warc.gz" if compression == "gzip" else ".warc.zst"
+
+
+def _check_compression(compression: str):
+    if compression not in ARCHIVE_COMPRESSIONS:
+        raise ValueError(f"Unknown archive_compression: {compression}")
+    if compression == "zstd" and zstandard is None:
+        raise ImportError("Komprese 'zstd' vyžaduje balíček zstandard (pip install zstandard).")
+
+
+def _status_line(status: int) -> str:
+    try:
+        return f"HTTP/1.1 {status} {http.HTTPStatus(status).phrase}"
+    except ValueError:
+        return f"HTTP/1.1 {status} "
+
+
+def _http_block(status: int, headers: dict, body: bytes) -> bytes:
+    lines = [_status_line(status)]
+    for name, value in headers.items():
+        if name.lower() not in _TRANSFER_HEADERS:
+            lines.append(f"{name}: {value}")
+    lines.append(f"Content-Length: {len(body)}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8", "replace") + body
+
+
+def build_record(url: str, body: bytes | str, status: int, headers: dict, timestamp: str) -> bytes:
+    """
+    Záznam WARC/1.1 typu response; tělo se ukládá tak, jak přišlo ze serveru
+    (v původním kódování). Text (str) se uloží v UTF-8.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8", "surrogatepass")
+    block = _http_block(status, headers, body)
+    head = (
+        "WARC/1.1\r\n"
+        "WARC-Type: response\r\n"
+        f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>\r\n"
+        f"WARC-Date: {timestamp}\r\n"
+        f"WARC-Target-URI: {url}\r\n"
+        "Content-Type: application/http; msgtype=response\r\n"
+        f"Content-Length: {len(block)}\r\n"
+        "\r\n"
+    )
+    return head.encode("utf-8") + block + b"\r\n\r\n"
+
+
+def parse_record(data: bytes) -> ArchiveRecord:
+    head, _, rest = data.partition(b"\r\n\r\n")
+    warc = dict(line.split(": ", 1) for line in head.decode("utf-8").split("\r\n")[1:])
+    block = rest[:int(warc["Content-Length"])]
+
+    http_head, _, body = block.partition(b"\r\n\r\n")
+    lines = http_head.decode("utf-8", "replace").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = dict(line.split(": ", 1) for line in lines[1:] if ": " in line)
+    headers.pop("Content-Length", None)
+
+    return ArchiveRecord(
+        url=warc["WARC-Target-URI"],
+        status=status,
+        headers=headers,
+        timestamp=warc["WARC-Date"],
+        body=decode_html(body, detect_encoding(body, headers.get("Content-Type"))),
+        payload=body,
+    )
+
+
+class PageArchive:
+    """
+    Zapisovač archivu stránek: každá stránka je jeden záznam WARC, komprimovaný
+    samostatně (gzip member / zstd frame), takže segment je platný .warc.gz
+    či .warc.zst a každý záznam jde přečíst sám o sobě podle offsetu.
+    Po překročení segment_size bajtů se začne nový segment. index.tsv drží
+    segment, offset a délku každého záznamu.
+
+    Komprese běží ve vlákně volajícího (zlib i zstd uvolňují GIL), pod zámkem
+    se jen připisuje na konec segmentu a do indexu.
+    """
+
+    def __init__(self, directory: Path, compression: str = "gzip", segment_size: int = 100 * 2**20, append=False):
+        _check_compression(compression)
+        self.directory = Path(directory)
+        self.compression = compression
+        self.segment_size = segment_size
+        self.lock = threading.Lock()
+        self.records = 0
+        self.bytes_written = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        existing = sorted(self.directory.glob(f"{SEGMENT_PREFIX}*.warc.*"))
+        if not append:
+            for path in existing:
+                path.unlink()
+            existing = []
+            index_mode = "w"
+        else:
+            index_mode = "a"
+
+        # Při navázání se pokračuje novým segmentem – konec starého může být useknutý.
+        self._segment_no = int(existing[-1].name[len(SEGMENT_PREFIX):].split(".", 1)[0]) + 1 if existing else 0
+        self._segment = None
+        self._segment_name = None
+        self._index = (self.directory / INDEX_NAME).open(index_mode, encoding="utf-8")
+        self._zstd = zstandard.ZstdCompressor() if compression == "zstd" else None
+
+    def _compress(self, data: bytes) -> bytes:
+        if self._zstd is not None:
+            return self._zstd.compress(data)
+        return gzip.compress(data, compresslevel=6, mtime=0)
+
+    def _open_segment(self):
+        if self._segment is not None:
+            self._segment.close()
+        self._segment_name = f"{SEGMENT_PREFIX}{self._segment_no:05d}{_suffix(self.compression)}"
+        self._segment = (self.directory / self._segment_name).open("wb")
+        self._segment_no += 1
+
+    def add(self, url: str, body: bytes | str, meta: ResponseMeta | None = None, timestamp: str | None = None):
+        meta = meta or ResponseMeta()
+        timestamp = timestamp or time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        data = self._compress(build_record(url, body, meta.status, meta.headers, timestamp))
+
+        with self.lock:
+            size = self._segment.tell() if self._segment is not None else None
+            if size is None or (size and size + len(data) > self.segment_size):
+                self._open_segment()
+            offset = self._segment.tell()
+            self._segment.write(data)
+            # Do indexu jen záznam, který už je celý v souboru.
+            self._segment.flush()
+            self._index.write(f"{self._segment_name}\t{offset}\t{len(data)}\t{meta.status}\t{timestamp}\t{url}\n")
+            self.records += 1
+            self.bytes_written += len(data)
+
+    def flush(self):
+        with self.lock:
+            if self._segment is not None:
+                self._segment.flush()
+            self._index.flush()
+
+    def close(self):
+        with self.lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+            self._index.close()
+
+
+class ArchiveReader:
+    """Čtení archivu: průchod všemi stránkami v pořadí zápisu nebo přímý přístup podle URL."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._by_url = None
+
+    def entries(self):
+        with (self.directory / INDEX_NAME).open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    segment, offset, length, status, timestamp, url = line.rstrip("\n").split("\t", 5)
+                    entry = IndexEntry(segment, int(offset), int(length), int(status), timestamp, url)
+                except ValueError:
+                    # Useknutý poslední řádek po pádu.
+                    continue
+                yield entry
+
+    def urls(self) -> list[str]:
+        return [entry.url for entry in self.entries()]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.entries())
+
+    def __iter__(self):
+        handles = {}
+        try:
+            for entry in self.entries():
+                f = handles.get(entry.segment)
+                if f is None:
+                    f = handles[entry.segment] = (self.directory / entry.segment).open("rb")
+                yield self._read(f, entry)
+        finally:
+            for f in handles.values():
+                f.close()
+
+    def get(self, url: str) -> ArchiveRecord | None:
+        """Poslední uložená verze stránky, nebo None."""
+        if self._by_url is None:
+            self._by_url = {entry.url: entry for entry in self.entries()}
+        entry = self._by_url.get(url)
+        if entry is None:
+            return None
+        with (self.directory / entry.segment).open("rb") as f:
+            return self._read(f, entry)
+
+    @staticmethod
+    def _read(f, entry: IndexEntry) -> ArchiveRecord:
+        f.seek(entry.offset)
+        data = f.read(entry.length)
+        if entry.segment.endswith(".zst"):
+            if zstandard is None:
+                raise ImportError("Čtení .warc.zst vyžaduje balíček zstandard (pip install zstandard).")
+            data = zstandard.ZstdDecompressor().decompress(data)
+        else:
+            data = gzip.decompress(data)
+        return parse_record(data)
+
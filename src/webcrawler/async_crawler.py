@@ -0,0 +1,202 @@
+# src/webcrawler/async_crawler.py
+# Autor: Martin Šilar
+# Asynchronní engine crawleru – tisíce souběžných požadavků v jedné smyčce asyncio
+
+import asyncio
+import threading
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .archive import ResponseMeta
+from .crawler import WebCrawler, LOG_SENTINEL
+from .charset import detect_encoding
+from .extraction import PageAnalysis
+from .http_client import CHUNK_SIZE, BodyRejected, FetchedPage, check_headers, check_size
+from .politeness import AsyncHostScheduler
+
+
+class AsyncWebCrawler(WebCrawler):
+    """
+    Varianta WebCrawleru, která stahuje stránky v jedné smyčce asyncio.
+    max_workers zde udává počet souběžných stahování (korutin), ne vláken.
+
+    Visited, robots.txt, extraktory i save_results sdílí s vláknovým enginem,
+    CPU práce nad stránkou (_process_page) běží v poolu vláken smyčky,
+    aby parsování neblokovalo stahování, případně v poolu procesů
+    (extract_processes > 0). Spojení drží pool aiohttp, http_client a http2
+    platí jen pro vláknový engine.
+    """
+
+    def __init__(self, config, resume=False):
+        if aiohttp is None:
+            raise ImportError("Engine 'async' vyžaduje balíček aiohttp (pip install aiohttp).")
+        super().__init__(config, resume=resume)
+
+    def run(self):
+        logger = threading.Thread(target=self.logger_thread, daemon=False)
+        logger.start()
+
+        self._start_extract_pool()
+        self._open_sink()
+        self._open_archive()
+        self._open_recrawl()
+        try:
+            asyncio.run(self._run_async())
+        finally:
+            self._stop_extract_pool()
+            self._close_state()
+            self._close_sink()
+            self._close_archive()
+            self._close_recrawl()
+            self.log_queue.put(LOG_SENTINEL)
+            self.log_queue.join()
+            logger.join()
+
+    async def _run_async(self):
+        queue = self._new_scheduler(AsyncHostScheduler)
+        self.task_queue = queue
+
+        seeds = self._seed_urls()
+
+        # Pool spojení aiohttp je sdílený všemi korutinami; DNS cache má aiohttp vlastní.
+        connector = aiohttp.TCPConnector(
+            limit=self.config.max_workers,
+            limit_per_host=self.config.max_connections_per_host,
+            use_dns_cache=self.config.dns_cache_ttl > 0,
+            ttl_dns_cache=self.config.dns_cache_ttl or None,
+            force_close=not self.config.http_keepalive,
+        )
+        timeout = aiohttp.ClientTimeout(total=self.config.request_timeout)
+        headers = {"User-Agent": self.config.user_agent}
+
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=headers, trace_configs=[self._trace_config()]
+        ) as session:
+            workers = [
+                asyncio.create_task(self._worker(i + 1, session, queue))
+                for i in range(self.config.max_workers)
+            ]
+
+            for url in seeds:
+                await queue.put(url)
+
+            await queue.join()
+
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if self.page_count < self.config.max_pages:
+            self.finished_early = True
+
+    async def _read_body(self, resp) -> FetchedPage:
+        """Tělo po blocích s kontrolou Content-Type a limitu max_body_bytes (jako HttpClient.fetch)."""
+        max_bytes = self.config.max_body_bytes
+        length = check_headers(resp.headers, max_bytes)
+        body = bytearray()
+        async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+            body += chunk
+            check_size(len(body), length, max_bytes)
+        self.http_stats.add(bytes_read=len(body))
+        body = bytes(body)
+        headers = dict(resp.headers)
+        return FetchedPage(resp.status, headers, body, detect_encoding(body, resp.headers.get("Content-Type")))
+
+    def _trace_config(self):
+        """Metriky spojení (connection_summary) z trasovacích událostí aiohttp."""
+        stats = self.http_stats
+
+        async def on_request_start(session, ctx, params):
+            ctx.https = params.url.scheme == "https"
+            stats.add(requests=1)
+
+        async def on_connection_create_end(session, ctx, params):
+            stats.add(connections=1, tls_handshakes=int(getattr(ctx, "https", False)))
+
+        async def on_dns_resolvehost_end(session, ctx, params):
+            stats.add(dns_lookups=1)
+
+        async def on_dns_cache_hit(session, ctx, params):
+            stats.add(dns_cached=1)
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(on_request_start)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        trace.on_dns_cache_hit.append(on_dns_cache_hit)
+        return trace
+
+    async def _worker(self, wid: int, session, queue: AsyncHostScheduler):
+        self.log(f"[WORKER-{wid}] Start worker (async)")
+        loop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                url = await queue.get()
+                try:
+                    await self._handle_url(wid, url, session, queue, loop)
+                finally:
+                    queue.task_done()
+        except asyncio.CancelledError:
+            self.log(f"[WORKER-{wid}] Ukončen.")
+            raise
+
+    async def _handle_url(self, wid, url, session, queue, loop):
+        index = self._claim_page()
+        if index is None:
+            queue.release(url)
+            return
+
+        cached = await loop.run_in_executor(None, self.recrawl.get, url) if self.recrawl else None
+        page = html = meta = None
+
+        t0 = time.perf_counter()
+        try:
+            async with session.get(url, headers=cached.conditional_headers() if cached else None) as resp:
+                if not (cached and resp.status == 304):
+                    resp.raise_for_status()
+                    page = await self._read_body(resp)
+                    html = page.body
+                    meta = ResponseMeta(page.status_code, page.headers)
+        except BodyRejected as e:
+            self.http_stats.record_rejected(e)
+            self.log(f"[WORKER-{wid}] SKIP {url}: {e}")
+            self._page_done(url)
+            return
+        except Exception as e:
+            self.log(f"[WORKER-{wid}] ERROR {url}: {e}")
+            self._page_done(url)
+            return
+        finally:
+            queue.release(url)
+        fetch_seconds = time.perf_counter() - t0
+
+        if cached and await loop.run_in_executor(None, self._reuse_cached, url, cached, html, meta):
+            links = self._finish_cached(wid, url, cached, fetch_seconds)
+        elif self.duplicates and await loop.run_in_executor(
+            None, self._is_duplicate, wid, url, page.body, page.encoding
+        ):
+            self._page_done(url)
+            return
+        elif self.extract_pool:
+            save_seconds = await loop.run_in_executor(
+                None, self._save_page_timed, index, url, html, meta, page.encoding
+            )
+            try:
+                future = await loop.run_in_executor(None, self.extract_pool.submit, url, html, page.encoding)
+                analysis = await asyncio.wrap_future(future)
+            except Exception as e:
+                analysis = PageAnalysis(error=f"process pool: {e}")
+            self._remember(url, html, meta, analysis)
+            links = self._finish_page(wid, url, analysis, fetch_seconds, save_seconds)
+        else:
+            links = await loop.run_in_executor(
+                None, self._process_page, wid, index, url, html, fetch_seconds, meta, page.encoding
+            )
+
+        for link in links:
+            queue.put_nowait(link)
@@ -2,25 +2,55 @@
 # Autor: Martin Šilar
 # Základní třída pro extraktory – společná logika
 
-import re
-from bs4 import BeautifulSoup
+import copy
+
+from .document import HtmlDocument
+from .parsers import create_document
+from .priority import DEFAULT_SCORER
 
 
 class BaseExtractor:
     """
     Společná logika pro extraktory.
+
+    Kontrakt: extract(url, doc), kde doc je HtmlDocument naparsovaný crawlerem
+    jednou pro celou stránku. Kvůli zpětné kompatibilitě lze předat i holý
+    HTML řetězec – _document() ho zabalí backendem crawleru (jinak html.parser).
+
+    uses_tree = False značí extraktor, který čte jen surové HTML (doc.html);
+    analyze_page mu pak strom předem nestaví.
+
+    url_scorer určuje při crawl_order = best_first, které URL se stáhnou
+    dřív (score_url) – profil si nastaví vlastní UrlScorer s klíčovými slovy.
     """
 
+    uses_tree = True
+    url_scorer = DEFAULT_SCORER
+
     def __init__(self):
         self.crawler = None
 
     def set_crawler(self, crawler):
         self.crawler = crawler
 
-    def extract(self, url: str, html: str):
+    def without_crawler(self) -> "BaseExtractor":
+        """Kopie bez odkazu na crawler (zámky, fronty) – pro předání do jiného procesu."""
+        clone = copy.copy(self)
+        clone.crawler = None
+        return clone
+
+    def extract(self, url: str, doc: HtmlDocument | str):
         raise NotImplementedError
 
-    def _strip_html(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
-        text = soup.get_text(separator=" ")
-        return re.sub(r"\s+", " ", text).strip()
+    def score_url(self, url: str) -> float:
+        """Priorita URL pro best-first frontier, vyšší = dřív."""
+        return self.url_scorer(url)
+
+    def _document(self, doc: HtmlDocument | str) -> HtmlDocument:
+        if isinstance(doc, HtmlDocument):
+            return doc
+        parser = self.crawler.parser if self.crawler else "html.parser"
+        return create_document(doc, parser)
+
+    def _strip_html(self, doc: HtmlDocument | str) -> str:
+        return self._document(doc).clean_text()
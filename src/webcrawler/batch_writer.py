@@ -0,0 +1,80 @@
+# src/webcrawler/batch_writer.py
+# Autor: Martin Šilar
+# Společné zapisovací vlákno – operace z workerů jdou přes frontu a zapisují se po dávkách
+
+import threading
+import time
+from queue import Queue, Empty
+
+
+WRITER_SENTINEL = object()
+
+
+class BatchWriter:
+    """
+    Základ pro úložiště, do kterých workery jen vkládají operace do fronty
+    (self.ops). Jedno zapisovací vlákno je sbírá a předá _write_batch() po
+    batch_size operacích nebo nejpozději po flush_interval sekundách; zbytek
+    se zapíše při close().
+
+    Potomek implementuje _write_batch(batch) a podle potřeby _writer_open()
+    (volá se ve vlákně před první dávkou) a _writer_close() (po poslední).
+    """
+
+    batch_size = 500
+    flush_interval = 0.5
+
+    def __init__(self):
+        self.ops = Queue()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._writer_thread, daemon=False)
+        self._thread.start()
+
+    def close(self):
+        if self._thread:
+            self.ops.put(WRITER_SENTINEL)
+            self._thread.join()
+            self._thread = None
+
+    def _writer_open(self):
+        pass
+
+    def _write_batch(self, batch: list):
+        raise NotImplementedError
+
+    def _writer_close(self):
+        pass
+
+    def _writer_thread(self):
+        self._writer_open()
+        batch = []
+        last_flush = time.monotonic()
+
+        try:
+            while True:
+                timeout = max(0.0, self.flush_interval - (time.monotonic() - last_flush))
+                try:
+                    op = self.ops.get(timeout=timeout)
+                except Empty:
+                    op = None
+
+                if op is WRITER_SENTINEL:
+                    break
+                if op is not None:
+                    batch.append(op)
+
+                if batch and (len(batch) >= self.batch_size
+                              or time.monotonic() - last_flush >= self.flush_interval):
+                    self._write_batch(batch)
+                    batch = []
+                    last_flush = time.monotonic()
+                elif not batch:
+                    last_flush = time.monotonic()
+        finally:
+            try:
+                if batch:
+                    self._write_batch(batch)
+            finally:
+                self._writer_close()
@@ -0,0 +1,145 @@
+# src/webcrawler/canonical.py
+# Autor: Martin Šilar
+# Kanonizace URL před deduplikací – různé zápisy téže stránky se stáhnou jen jednou
+
+import fnmatch
+import re
+from urllib.parse import urlsplit, urlunsplit
+
+
+# Pravidla zapnutá, když config klíč canonicalize chybí. Bezpečná – nemění, na kterou stránku URL vede.
+DEFAULT_RULES = ("case", "default_port", "percent_encoding", "dot_segments", "sort_query", "strip_params")
+
+# Volitelná pravidla – na většině webů bezpečná, ale obecně mohou sloučit různé stránky.
+OPTIONAL_RULES = ("trailing_slash", "https", "www")
+
+ALL_RULES = DEFAULT_RULES + OPTIONAL_RULES
+
+DEFAULT_STRIP_PARAMS = (
+    "utm_*", "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid",
+    "_ga", "yclid", "igshid", "phpsessid", "jsessionid", "sid",
+)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Nerezervované znaky (RFC 3986), které se v %XX kódovat nemusí.
+_UNRESERVED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+_PCT_RE = re.compile(r"%([0-9A-Fa-f]{2})")
+
+
+def _normalize_percent(part: str) -> str:
+    """Dekóduje %XX nerezervovaných znaků a ostatní escapy převede na velká písmena."""
+    def repl(m):
+        ch = chr(int(m.group(1), 16))
+        return ch if ch in _UNRESERVED else "%" + m.group(1).upper()
+    return _PCT_RE.sub(repl, part) if "%" in part else part
+
+
+def _remove_dot_segments(path: str) -> str:
+    if "." not in path:
+        return path
+    out = []
+    for seg in path.split("/"):
+        if seg == "..":
+            if len(out) > 1:
+                out.pop()
+        elif seg != ".":
+            out.append(seg)
+    result = "/".join(out)
+    if path.endswith(("/.", "/..")):
+        result += "/"
+    return result or "/"
+
+
+class UrlCanonicalizer:
+    """
+    Převádí URL na kanonický tvar podle zapnutých pravidel:
+
+    - case             – schéma a host malými písmeny
+    - default_port     – odstraní :80 u http a :443 u https
+    - percent_encoding – %XX nerezervovaných znaků dekóduje, ostatní velkými písmeny
+    - dot_segments     – vyřeší /./ a /../ v cestě
+    - sort_query       – seřadí parametry dotazu podle klíče (hodnoty a escapy nemění)
+    - strip_params     – odstraní parametry podle blacklistu (vzory fnmatch, např. utm_*)
+    - trailing_slash   – odstraní koncové lomítko cesty (kromě kořene)
+    - https            – http:// sjednotí na https://
+    - www              – odstraní prefix www. z hostu
+
+    Fragment se odstraňuje vždy (to dělal crawler i předtím).
+    """
+
+    def __init__(self, rules=DEFAULT_RULES, strip_params=DEFAULT_STRIP_PARAMS):
+        rules = [r.strip().lower() for r in rules if r.strip()]
+        unknown = [r for r in rules if r not in ALL_RULES]
+        if unknown:
+            raise ValueError(f"Unknown canonicalize rule: {', '.join(unknown)}")
+        self.rules = frozenset(rules)
+        self.strip_params = tuple(p.strip().lower() for p in strip_params if p.strip())
+
+    def _strip(self, name: str) -> bool:
+        name = name.lower()
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in self.strip_params)
+
+    def canonicalize(self, url: str) -> str:
+        try:
+            parts = urlsplit(url)
+            port = parts.port
+        except ValueError:
+            return url
+
+        rules = self.rules
+        scheme = parts.scheme
+        host = parts.hostname or ""
+        path = parts.path
+        query = parts.query
+
+        if "case" in rules:
+            scheme = scheme.lower()
+        else:
+            # hostname je z urlsplit vždy malými písmeny – bez pravidla vrátíme původní zápis.
+            host = parts.netloc.rsplit("@", 1)[-1]
+            if port is not None or host.endswith(":"):
+                host = host.rsplit(":", 1)[0]
+
+        if "https" in rules and scheme.lower() == "http":
+            if port == 80:
+                port = None
+            scheme = "https"
+
+        if "www" in rules and host.lower().startswith("www."):
+            host = host[4:]
+
+        if "default_port" in rules and port is not None and DEFAULT_PORTS.get(scheme.lower()) == port:
+            port = None
+
+        if host and not path:
+            path = "/"
+
+        if "percent_encoding" in rules:
+            path = _normalize_percent(path)
+            query = _normalize_percent(query)
+
+        if "dot_segments" in rules:
+            path = _remove_dot_segments(path)
+
+        if "trailing_slash" in rules and len(path) > 1 and path.endswith("/"):
+            path = path.rstrip("/") or "/"
+
+        if query and ("sort_query" in rules or "strip_params" in rules):
+            # Parametry se nedekódují ani znovu nekódují – %E9, klíč bez "=" i ";" zůstanou, jak byly.
+            params = [param for param in query.split("&") if param]
+            if "strip_params" in rules:
+                params = [param for param in params if not self._strip(param.split("=", 1)[0])]
+            if "sort_query" in rules:
+                # Stabilní řazení jen podle klíče – opakovaný klíč si zachová pořadí hodnot.
+                params.sort(key=lambda param: param.split("=", 1)[0])
+            query = "&".join(params)
+
+        netloc = f"[{host}]" if ":" in host and not host.startswith("[") else host
+        if parts.username is not None:
+            userinfo = parts.netloc.rsplit("@", 1)[0]
+            netloc = f"{userinfo}@{netloc}"
+        if port is not None:
+            netloc = f"{netloc}:{port}"
+
+        return urlunsplit((scheme, netloc, path, query, ""))
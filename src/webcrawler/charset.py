@@ -0,0 +1,94 @@
+# src/webcrawler/charset.py
+# Autor: Martin Šilar
+# Rychlé určení kódování stránky – BOM, hlavička Content-Type, <meta charset>, odhad z omezeného začátku těla
+
+import codecs
+import re
+
+# <meta charset> musí být podle HTML5 v prvních 1024 bajtech, bereme rezervu.
+META_SCAN_BYTES = 4096
+# Odhad kódování se dělá jen nad začátkem těla – cena nezávisí na velikosti stránky.
+SNIFF_BYTES = 64 * 1024
+
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+HEADER_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+META_CHARSET_RE = re.compile(
+    rb"<meta\s[^>]*?charset\s*=\s*[\"']?\s*([\w.:-]+)",
+    re.I,
+)
+
+# Bajty, kterými se windows-1250 a iso-8859-2 liší u českých písmen:
+# Š Ť Ž š ť ž jsou ve windows-1250 na 0x8A 0x8D 0x8E 0x9A 0x9D 0x9E, v iso-8859-2 na 0xA9 0xAB 0xAE 0xB9 0xBB 0xBE.
+LATIN2_ONLY = re.compile(rb"[\xa9\xab\xae\xb9\xbb\xbe]")
+C1_BYTES = re.compile(rb"[\x80-\x9f]")
+
+# Prohlížeče čtou iso-8859-1 / ascii jako windows-1252 (nadmnožina), totéž děláme my.
+ALIASES = {"latin-1": "cp1252", "iso8859-1": "cp1252", "ascii": "cp1252"}
+
+
+def normalize_encoding(name: str | None) -> str | None:
+    """Kanonický název kodeku Pythonu, None pro neznámé kódování."""
+    if not name:
+        return None
+    try:
+        name = codecs.lookup(name.strip().strip("\"'")).name
+    except LookupError:
+        return None
+    return ALIASES.get(name, name)
+
+
+def header_encoding(content_type: str | None) -> str | None:
+    m = HEADER_CHARSET_RE.search(content_type or "")
+    return normalize_encoding(m.group(1)) if m else None
+
+
+def meta_encoding(body: bytes) -> str | None:
+    """Kódování z <meta charset=...> nebo <meta http-equiv content="...; charset=..."> na začátku stránky."""
+    m = META_CHARSET_RE.search(body, 0, META_SCAN_BYTES)
+    if not m:
+        return None
+    name = normalize_encoding(m.group(1).decode("ascii", "replace"))
+    # Stránka, která o sobě tvrdí UTF-16, ale prošla až sem jako ASCII text, je ve skutečnosti UTF-8.
+    return "utf-8" if name and name.startswith("utf-16") else name
+
+
+def sniff_encoding(body: bytes) -> str:
+    """
+    Odhad kódování z prvních SNIFF_BYTES bajtů: platné UTF-8 (nebo čisté
+    ASCII) je utf-8, jinak se podle znaků typických pro češtinu rozhodne
+    mezi windows-1250 a iso-8859-2.
+    """
+    prefix = body[:SNIFF_BYTES]
+    try:
+        prefix.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError as e:
+        # Useknutý vícebajtový znak na konci vzorku není chyba.
+        if len(prefix) == SNIFF_BYTES and e.start >= len(prefix) - 3 and e.reason == "unexpected end of data":
+            return "utf-8"
+
+    # iso-8859-2 má na 0x80–0x9F jen řídicí znaky, windows-1250 tam má Š Ť Ž š ť ž i uvozovky.
+    if LATIN2_ONLY.search(prefix) and not C1_BYTES.search(prefix):
+        return "iso8859-2"
+    return "cp1250"
+
+
+def detect_encoding(body: bytes, content_type: str | None = None) -> str:
+    """
+    Kódování stránky v pořadí BOM → charset z Content-Type → <meta charset>
+    → odhad ze začátku těla. Žádný krok nečte celé tělo.
+    """
+    for bom, name in BOMS:
+        if body.startswith(bom):
+            return name
+    return header_encoding(content_type) or meta_encoding(body) or sniff_encoding(body)
+
+
+def decode_html(body: bytes, encoding: str) -> str:
+    # utf-8-sig zahodí případný BOM, jinak by skončil na začátku textu.
+    return body.decode("utf-8-sig" if encoding == "utf-8" else encoding, errors="replace")
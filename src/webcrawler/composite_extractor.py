@@ -0,0 +1,54 @@
+# src/webcrawler/composite_extractor.py
+# Autor: Martin Šilar
+# Více profilů v jednom crawlu – extraktory všech profilů nad jednou staženou a naparsovanou stránkou
+
+from .base_extractor import BaseExtractor
+
+
+class CompositeExtractor(BaseExtractor):
+    """
+    Spustí extraktory několika profilů nad týmž HtmlDocument, takže se
+    stránka stáhne i naparsuje jen jednou pro všechny profily.
+
+    Výsledek je slovník profil → výsledek extraktoru (profily, jejichž
+    extraktor nic nenašel nebo selhal, chybí); None, když nic nenašel žádný.
+    Chyba jednoho extraktoru se zaloguje a ostatní profily běží dál.
+    O uložení rozhoduje crawler pro každý profil zvlášť (should_save).
+    """
+
+    def __init__(self, extractors: dict[str, BaseExtractor]):
+        super().__init__()
+        self.extractors = dict(extractors)
+        self.uses_tree = any(e.uses_tree for e in self.extractors.values())
+
+    @property
+    def profiles(self) -> list[str]:
+        return list(self.extractors)
+
+    def set_crawler(self, crawler):
+        super().set_crawler(crawler)
+        for extractor in self.extractors.values():
+            extractor.set_crawler(crawler)
+
+    def without_crawler(self) -> "CompositeExtractor":
+        clone = super().without_crawler()
+        clone.extractors = {profile: e.without_crawler() for profile, e in self.extractors.items()}
+        return clone
+
+    def score_url(self, url: str) -> float:
+        # URL zajímavá pro kterýkoli z profilů jde dopředu.
+        return max(e.score_url(url) for e in self.extractors.values())
+
+    def extract(self, url: str, doc):
+        doc = self._document(doc)
+        results = {}
+        for profile, extractor in self.extractors.items():
+            try:
+                data = extractor.extract(url, doc)
+            except Exception as e:
+                if self.crawler:
+                    self.crawler.log(f"[EXTRACTOR] EXTRACT ERROR {url} (profil {profile}): {e}")
+                continue
+            if data is not None:
+                results[profile] = data
+        return results or None
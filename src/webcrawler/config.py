@@ -3,9 +3,11 @@
 # Načítání a správa konfigurace crawleru
 
 import configparser
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from .canonical import DEFAULT_RULES, DEFAULT_STRIP_PARAMS
+
 
 @dataclass
 class CrawlerConfig:
@@ -20,8 +22,47 @@ class CrawlerConfig:
     log_file: Path
     profile: str
     save_html: bool
-    open_json_after_finish: bool
     profiles: list[str]
+    open_json_after_finish: bool = False
+    engine: str = "threads"
+    parser: str = "html.parser"
+    link_extraction: str = "dom"
+    extract_processes: int = 0
+    state_file: Path | None = None
+    visited_store: str = "set"
+    visited_capacity: int = 100_000
+    visited_error_rate: float = 0.001
+    visited_shards: int = 16
+    canonicalize: list[str] = field(default_factory=lambda: list(DEFAULT_RULES))
+    canonical_strip_params: list[str] = field(default_factory=lambda: list(DEFAULT_STRIP_PARAMS))
+    dedup: str = "off"
+    dedup_threshold: float = 0.85
+    host_delay: float = 0.0
+    max_connections_per_host: int = 0
+    seed_file: Path | None = None
+    coordinator: str = "127.0.0.1:8765"
+    coordinator_authkey: str = ""
+    distributed_batch: int = 20
+    lease_timeout: float = 120.0
+    result_format: str = "json"
+    result_fsync: str = "close"
+    html_store: str = "files"
+    archive_compression: str = "gzip"
+    archive_segment_mb: int = 100
+    recrawl_cache: Path | None = None
+    http_client: str = "requests"
+    http_pool_size: int = 10
+    http_pool_hosts: int = 100
+    http_keepalive: bool = True
+    http2: bool = False
+    dns_cache_ttl: float = 300.0
+    max_body_bytes: int = 10 * 2**20
+    frontier_spill_dir: Path | None = None
+    crawl_order: str = "fifo"
+
+
+def _list(value: str) -> list[str]:
+    return [p.strip() for p in value.split(",") if p.strip()]
 
 
 def load_config(path="config.ini") -> CrawlerConfig:
@@ -35,6 +76,14 @@ def load_config(path="config.ini") -> CrawlerConfig:
 
     output_dir = Path(c.get("output_dir", "data"))
     log_file = Path(c.get("log_file", "logs/crawler.log"))
+    state_file = c.get("state_file", fallback="").strip()
+    seed_file = c.get("seed_file", fallback="").strip()
+    recrawl_cache = c.get("recrawl_cache", fallback="").strip()
+    frontier_spill_dir = c.get("frontier_spill_dir", fallback="").strip()
+
+    # Chybějící klíč = výchozí pravidla, prázdná hodnota = kanonizace vypnutá.
+    canonicalize = _list(c.get("canonicalize", fallback=",".join(DEFAULT_RULES)).lower())
+    strip_params = _list(c.get("canonical_strip_params", fallback=",".join(DEFAULT_STRIP_PARAMS)))
 
     return CrawlerConfig(
         start_url=c.get("start_url"),
@@ -50,4 +99,39 @@ def load_config(path="config.ini") -> CrawlerConfig:
         save_html=c.getboolean("save_html", fallback=False),
         open_json_after_finish=c.getboolean("open_json_after_finish", fallback=False),
         profiles=profiles,
+        engine=c.get("engine", fallback="threads").strip().lower(),
+        parser=c.get("parser", fallback="html.parser").strip().lower(),
+        link_extraction=c.get("link_extraction", fallback="dom").strip().lower(),
+        extract_processes=c.getint("extract_processes", fallback=0),
+        state_file=Path(state_file) if state_file else None,
+        visited_store=c.get("visited_store", fallback="set").strip().lower(),
+        visited_capacity=c.getint("visited_capacity", fallback=100_000),
+        visited_error_rate=c.getfloat("visited_error_rate", fallback=0.001),
+        visited_shards=c.getint("visited_shards", fallback=16),
+        canonicalize=canonicalize,
+        canonical_strip_params=strip_params,
+        dedup=c.get("dedup", fallback="off").strip().lower(),
+        dedup_threshold=c.getfloat("dedup_threshold", fallback=0.85),
+        host_delay=c.getfloat("host_delay", fallback=0.0),
+        max_connections_per_host=c.getint("max_connections_per_host", fallback=0),
+        seed_file=Path(seed_file) if seed_file else None,
+        coordinator=c.get("coordinator", fallback="127.0.0.1:8765").strip(),
+        coordinator_authkey=c.get("coordinator_authkey", fallback=""),
+        distributed_batch=c.getint("distributed_batch", fallback=20),
+        lease_timeout=c.getfloat("lease_timeout", fallback=120.0),
+        result_format=c.get("result_format", fallback="json").strip().lower(),
+        result_fsync=c.get("result_fsync", fallback="close").strip().lower(),
+        html_store=c.get("html_store", fallback="files").strip().lower(),
+        archive_compression=c.get("archive_compression", fallback="gzip").strip().lower(),
+        archive_segment_mb=c.getint("archive_segment_mb", fallback=100),
+        recrawl_cache=Path(recrawl_cache) if recrawl_cache else None,
+        http_client=c.get("http_client", fallback="requests").strip().lower(),
+        http_pool_size=c.getint("http_pool_size", fallback=10),
+        http_pool_hosts=c.getint("http_pool_hosts", fallback=100),
+        http_keepalive=c.getboolean("http_keepalive", fallback=True),
+        http2=c.getboolean("http2", fallback=False),
+        dns_cache_ttl=c.getfloat("dns_cache_ttl", fallback=300.0),
+        max_body_bytes=c.getint("max_body_bytes", fallback=10 * 2**20),
+        frontier_spill_dir=Path(frontier_spill_dir) if frontier_spill_dir else None,
+        crawl_order=c.get("crawl_order", fallback="fifo").strip().lower(),
     )
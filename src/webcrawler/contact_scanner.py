@@ -0,0 +1,138 @@
+# src/webcrawler/contact_scanner.py
+# Autor: Martin Šilar
+# Hledání e-mailů a telefonů jedním průchodem surového HTML (bez stavby stromu) nebo textu
+
+import html as html_lib
+import re
+from urllib.parse import unquote
+
+
+EMAIL_LOCAL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-")
+
+# Zavináč a tečka i v zápisech proti robotům: info [at] firma [dot] cz, info(zavináč)firma.cz, info&#64;firma.cz.
+_AT = r"(?:(?<=[\[({])\s*(?:at|zavináč|zavinac)\s*[\])}]|(?<=&)(?:\#0*64;|\#x0*40;))\s*"
+_DOT = r"(?:\.|&\#0*46;|\s*[\[({]\s*(?:dot|tečka|tecka)\s*[\])}]\s*)"
+
+# Každá shoda začíná jedním ze znaků první třídy – re pak běžný text přeskakuje v C a větve zkouší
+# jen na <, @, [ ( { &, + a číslicích. Větev pozná, kterým znakem shoda začala, podle lookbehindu.
+# E-mail se chytá od zavináče, jméno před ním se dohledá zpětně (_local_part).
+_CONTACT_BRANCHES = (
+    r"(?<=@)(?P<email>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
+    r"|" + _AT + r"(?P<obfuscated>(?:[a-zA-Z0-9-]+" + _DOT + r")+[a-zA-Z]{2,})"
+)
+
+_TEXT_RE = re.compile(
+    r"[@\[({&+\d](?:"
+    + _CONTACT_BRANCHES +
+    r"|(?:(?<=\+)\d|(?<=\d))(?P<phone>[\d\s\-]{8,15})"
+    r")",
+    re.IGNORECASE,
+)
+
+# Řádkové značky, které smí rozdělit telefon (<span>+420 123</span> <span>456 789</span>, +42<b>0</b>…) –
+# text stránky je spojí také. <a> mezi nimi není, aby telefon nespolkl následující odkaz mailto: / tel:.
+_INLINE_TAG = r"</?(?:span|b|i|strong|em|small|u|font|mark|abbr|bdi|bdo|nobr|wbr)\b[^>]*>"
+_INLINE_TAG_RE = re.compile(_INLINE_TAG, re.IGNORECASE)
+
+# V HTML se navíc přeskočí komentáře, <script>, <style> a značky (e-mail v atributu není kontakt),
+# z <a> se vezme href s mailto: / tel:, mezera v telefonu smí být i entita &nbsp; a číslice smí
+# oddělovat řádkové značky.
+_HTML_RE = re.compile(
+    r"[<@\[({&+\d](?:"
+    r"(?<=<)(?:!--.*?(?:-->|\Z)"
+    r"|(script|style)\b[^>]*>.*?(?:</\1\s*>|\Z)"
+    r"|a\s[^>]*?(?<![\w-])href\s*=\s*[\"']?\s*(?P<scheme>mailto:|tel:)(?P<href>[^\"'>\s]*)[^>]*>"
+    r"|/?[a-zA-Z!?][^>]*>)|"
+    + _CONTACT_BRANCHES +
+    r"|(?:(?<=\+)\d|(?<=\d))(?P<phone>(?:" + _INLINE_TAG + r")*"
+    r"(?:(?:[\d\s\-]|&nbsp;|&\#160;|&\#xa0;)(?:" + _INLINE_TAG + r")*){8,15})"
+    r")",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_OBFUSCATED_DOT = re.compile(_DOT, re.IGNORECASE)
+_PLAIN_EMAIL = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+# Oddělovače číslic, které se z telefonu zahodí (včetně zápisů v tel: odkazech).
+_PHONE_SEPARATORS = str.maketrans("", "", " \t\n\r\f\v\xa0-./()")
+
+
+def normalize_phone(raw: str) -> str | None:
+    """Telefon ve tvaru +420XXXXXXXXX, None pro číslo, které není české (9 číslic, +420…, 00420…)."""
+    if "&" in raw:
+        raw = html_lib.unescape(raw)
+    num = raw.translate(_PHONE_SEPARATORS)
+
+    if num.startswith("+420") and len(num) == 13 and num[1:].isdigit():
+        return num
+    if num.startswith("00420") and len(num) == 14 and num.isdigit():
+        return "+" + num[2:]
+    if len(num) == 9 and num.isdigit():
+        return "+420" + num
+    return None
+
+
+def _local_part(source: str, end: int, skip_spaces: bool) -> str:
+    """Jméno e-mailu končící na pozici end (před zavináčem, u [at] i přes mezery)."""
+    if skip_spaces:
+        while end > 0 and source[end - 1].isspace():
+            end -= 1
+    start = end
+    while start > 0 and source[start - 1] in EMAIL_LOCAL_CHARS:
+        start -= 1
+    return source[start:end]
+
+
+def _mailto(value: str) -> list[str]:
+    """Adresy z hodnoty mailto: (bez ?subject=…, více adres oddělených čárkou)."""
+    value = unquote(html_lib.unescape(value)).split("?", 1)[0]
+    return [a.strip() for a in value.split(",") if _PLAIN_EMAIL.fullmatch(a.strip())]
+
+
+def _scan(pattern: re.Pattern, source: str) -> tuple[list[str], list[str]]:
+    # Pořadí prvního výskytu, bez duplicit. lastgroup je pojmenovaná skupina větve, která se shodovala
+    # (u komentářů, skriptů a ostatních značek None).
+    emails = {}
+    phones = {}
+
+    for m in pattern.finditer(source or ""):
+        kind = m.lastgroup
+        if kind is None:
+            continue
+        if kind == "email":
+            local = _local_part(source, m.start(), False)
+            if local:
+                emails[local + "@" + m.group("email")] = None
+        elif kind == "obfuscated":
+            local = _local_part(source, m.start(), True)
+            if local:
+                emails[local + "@" + _OBFUSCATED_DOT.sub(".", m.group("obfuscated"))] = None
+        elif kind == "phone":
+            raw = m.group()
+            if "<" in raw:
+                raw = _INLINE_TAG_RE.sub("", raw)
+            num = normalize_phone(raw)
+            if num:
+                phones[num] = None
+        elif m.group("scheme").lower() == "mailto:":
+            emails.update(dict.fromkeys(_mailto(m.group("href"))))
+        else:
+            num = normalize_phone(unquote(m.group("href")))
+            if num:
+                phones[num] = None
+
+    return list(emails), list(phones)
+
+
+def scan_contacts(html: str) -> tuple[list[str], list[str]]:
+    """
+    E-maily a česká telefonní čísla (+420XXXXXXXXX) ze surového HTML jedním
+    průchodem: text stránky, odkazy mailto: / tel: a zápisy typu [at] / [dot].
+    Vrací (emails, phones) v pořadí prvního výskytu.
+    """
+    return _scan(_HTML_RE, html)
+
+
+def scan_text(text: str) -> tuple[list[str], list[str]]:
+    """Totéž nad textem stránky (bez značek), např. z HtmlDocument.clean_text()."""
+    return _scan(_TEXT_RE, text)
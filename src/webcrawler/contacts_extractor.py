@@ -2,27 +2,43 @@
 # Autor: Martin Šilar
 # Extraktor kontaktů – emaily a telefonní čísla
 
-import re
 from .base_extractor import BaseExtractor
+from .contact_scanner import scan_contacts
+from .priority import NAVIGATION_PENALTIES, UrlScorer
+
+CONTACT_HINTS = {
+    "kontakt": 10.0,
+    "contact": 10.0,
+    "o-nas": 5.0,
+    "about": 5.0,
+    "impressum": 5.0,
+    "pobock": 3.0,
+    "tym": 2.0,
+    "team": 2.0,
+}
 
 
 class ContactsExtractor(BaseExtractor):
     """
     Extrahuje e-maily a česká telefonní čísla.
     Ukládá pouze stránky, kde se objevuje alespoň jeden email nebo telefon.
+
+    Kontakty se hledají jedním průchodem surového HTML (contact_scanner),
+    strom dokumentu se kvůli nim nestaví.
+
+    Při crawl_order = best_first jdou dopředu stránky s kontaktem v adrese
+    (kontakt, o-nas, impressum…).
     """
 
-    EMAIL_REGEX = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    PHONE_CANDIDATE_REGEX = r"(?:\+?\d[\d\s\-]{8,15})"
+    uses_tree = False
+    url_scorer = UrlScorer({**CONTACT_HINTS, **NAVIGATION_PENALTIES})
 
-    def extract(self, url: str, html: str):
-        if not html:
+    def extract(self, url: str, doc):
+        doc = self._document(doc)
+        if doc.is_empty():
             return None
 
-        text = self._strip_html(html)
-
-        emails = self._extract_emails(text)
-        phones = self._extract_phones(text)
+        emails, phones = scan_contacts(doc.html)
 
         if not emails and not phones:
             return None
@@ -32,28 +48,3 @@ class ContactsExtractor(BaseExtractor):
             "emails": emails,
             "phones": phones
         }
-
-    def _extract_emails(self, text: str):
-        emails = re.findall(self.EMAIL_REGEX, text)
-        return list(set(emails))
-
-    def _extract_phones(self, text: str):
-        raw_candidates = re.findall(self.PHONE_CANDIDATE_REGEX, text)
-        cleaned = []
-
-        for raw in raw_candidates:
-            num = re.sub(r"[^\d+]", "", raw)
-
-            if num.startswith("+420") and len(num) == 13:
-                cleaned.append(num)
-                continue
-
-            if num.startswith("00420") and len(num) == 14:
-                cleaned.append("+" + num[2:])
-                continue
-
-            if num.isdigit() and len(num) == 9:
-                cleaned.append("+420" + num)
-                continue
-
-        return list(set(cleaned))
@@ -2,14 +2,25 @@
 # Autor: Martin Šilar
 # Extraktor textového obsahu – odstavce, hlavní text
 
-from bs4 import BeautifulSoup
 from .base_extractor import BaseExtractor
+from .priority import NAVIGATION_PENALTIES, UrlScorer
+
+ARTICLE_HINTS = {
+    "clan": 5.0,
+    "article": 5.0,
+    "blog": 3.0,
+    "novink": 3.0,
+    "news": 3.0,
+}
 
 
 class ContentExtractor(BaseExtractor):
-    def extract(self, url, html):
-        soup = BeautifulSoup(html, "html.parser")
-        text = soup.get_text(separator="\n", strip=True)
+    # best_first: články a blogy před navigací.
+    url_scorer = UrlScorer({**ARTICLE_HINTS, **NAVIGATION_PENALTIES})
+
+    def extract(self, url, doc):
+        doc = self._document(doc)
+        text = doc.text(separator="\n", strip=True)
 
         if not text:
             return None
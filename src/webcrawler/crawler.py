@@ -5,45 +5,225 @@
 import threading
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse, urlsplit
 
 import requests
-from bs4 import BeautifulSoup
 
+from .archive import HTML_STORES, PageArchive, ResponseMeta
 from .base_extractor import BaseExtractor
+from .canonical import UrlCanonicalizer
+from .charset import decode_html, detect_encoding
+from .dedup import DEDUP_MODES, DuplicateDetector
+from .extraction import ExtractionPool, PageAnalysis, analyze_page
+from .extractor import profile_names
+from .http_client import HTTP_CLIENTS, BodyRejected, ConnectionStats, DnsCache, HttpClient
+from .parsers import resolve_parser
+from .politeness import HostScheduler
+from .priority import CRAWL_ORDERS, DEFAULT_SCORER
+from .recrawl import CachedPage, RecrawlCache, page_fingerprint
+from .seeds import DomainScope, Seed, domain_dir, load_seed_file
+from .sink import RESULT_FORMATS, SUFFIXES, ResultSink
+from .spill import SpillQueue
+from .state_store import CrawlStateStore
+from .visited import ShardedVisited
 
 
 JOB_SENTINEL = object()
 LOG_SENTINEL = object()
 
+TIMING_STAGES = ("fetch", "parse", "extract", "links", "save")
+
+LINK_EXTRACTION_MODES = ("dom", "fast")
+
+
+def should_save(profile: str, data: dict | None) -> bool:
+    """Zda výsledek extrakce stojí za uložení (stránka bez kontaktů, titulku či textu ne)."""
+    if not data:
+        return False
+
+    if profile == "contacts":
+        return bool(data.get("emails")) or bool(data.get("phones"))
+
+    if profile == "seo":
+        return bool(data.get("title")) or bool(data.get("meta_description"))
+
+    if profile == "content":
+        text = data.get("text", "").strip()
+        return len(text) > 20
+
+    return True
+
+
+def results_to_save(profiles: list[str], data: dict | None) -> list[tuple[str, dict]]:
+    """
+    Výsledky stránky k uložení jako dvojice (profil, výsledek). U jednoho
+    profilu je data výsledek extraktoru, u více profilů slovník profil →
+    výsledek (CompositeExtractor); should_save se použije na každý profil zvlášť.
+    """
+    if len(profiles) == 1:
+        return [(profiles[0], data)] if should_save(profiles[0], data) else []
+    data = data or {}
+    return [(profile, data[profile]) for profile in profiles if should_save(profile, data.get(profile))]
+
 
 class WebCrawler:
-    def __init__(self, config):
+    def __init__(self, config, resume=False):
         self.config = config
+        self.resume = resume
 
-        self.task_queue = Queue(maxsize=self.config.queue_maxsize)
         self.log_queue = Queue()
 
-        self.visited = set()
-        self.visited_lock = threading.Lock()
+        # visited rozdělený na visited_shards částí s vlastními zámky – odkazy se filtrují
+        # bez zámku a do visited se přijímají dávkou za celou stránku.
+        self.visited = ShardedVisited(
+            self.config.visited_store,
+            self.config.visited_capacity,
+            self.config.visited_error_rate,
+            self.config.visited_shards,
+        )
+
+        self.canonicalizer = (
+            UrlCanonicalizer(self.config.canonicalize, self.config.canonical_strip_params)
+            if self.config.canonicalize else None
+        )
+        # Statistiky kanonizace (pod canonical_lock): přepsané odkazy a různé surové URL,
+        # které prošly filtry – rozdíl proti přijatým kanonickým URL jsou ušetřená stažení.
+        self.canonical_rewritten = 0
+        self.canonical_raw_urls = 0
+        self.canonical_admitted = 0
+        self.canonical_lock = threading.Lock()
+        self._raw_seen = (
+            ShardedVisited("fingerprint", 1024, shards=self.config.visited_shards)
+            if self.canonicalizer else None
+        )
 
         self.page_count = 0
         self.page_count_lock = threading.Lock()
 
-        self.active_workers = 0
-        self.active_workers_lock = threading.Lock()
-
         self.finished_early = False
+        self.interrupted = False
+        self.stop_event = threading.Event()
 
-        self.results = []
+        self.timings = dict.fromkeys(TIMING_STAGES, 0.0)
+        self.timed_pages = 0
+        self.timings_lock = threading.Lock()
+
+        # profile může vyjmenovat více profilů – stránka se pak stáhne a naparsuje jednou
+        # a každý profil má vlastní výsledky a výstupní soubor <profil>_data.
+        self.profiles = profile_names(self.config.profile)
+        self.profile_results = {profile: [] for profile in self.profiles}
         self.extractor: BaseExtractor | None = None
+        self.extract_pool: ExtractionPool | None = None
+        self.state = CrawlStateStore(self.config.state_file) if self.config.state_file else None
+
+        # result_format json drží výsledky v self.profile_results, ostatní formáty je průběžně zapisují na disk.
+        if self.config.result_format not in RESULT_FORMATS:
+            raise ValueError(f"Unknown result_format: {self.config.result_format}")
+        self.sink = (
+            ResultSink(self.config.result_format, self.config.result_fsync)
+            if self.config.result_format != "json" else None
+        )
+
+        # save_html: HTML po souborech (files), nebo do komprimovaného archivu WARC (archive).
+        if self.config.html_store not in HTML_STORES:
+            raise ValueError(f"Unknown html_store: {self.config.html_store}")
+        self.archive: PageArchive | None = None
+
+        # Jeden HTTP klient (pool spojení po hostech) pro všechny workery, vytváří se v run().
+        if self.config.http_client not in HTTP_CLIENTS:
+            raise ValueError(f"Unknown http_client: {self.config.http_client}")
+        self.http: HttpClient | None = None
+        self.http_stats = ConnectionStats()
+        self.dns_cache = (
+            DnsCache(self.config.dns_cache_ttl, self.http_stats)
+            if self.config.dns_cache_ttl > 0 else None
+        )
+
+        # Inkrementální recrawl: validátory a výsledky minulých běhů pro podmíněný GET.
+        self.recrawl = (
+            RecrawlCache(self.config.recrawl_cache, ",".join(self.profiles))
+            if self.config.recrawl_cache else None
+        )
 
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
         self.config.log_file.parent.mkdir(parents=True, exist_ok=True)
 
-        self.domain = self.config.allowed_domain
-        self.disallowed_paths, self.crawl_delay = self._load_robots_txt()
+        self.parser = resolve_parser(self.config.parser)
+        if self.parser != self.config.parser:
+            self.log(f"[CRAWLER] Parser '{self.config.parser}' není dostupný, používám '{self.parser}'.")
+
+        if self.config.link_extraction not in LINK_EXTRACTION_MODES:
+            raise ValueError(f"Unknown link_extraction: {self.config.link_extraction}")
+
+        if self.config.crawl_order not in CRAWL_ORDERS:
+            raise ValueError(f"Unknown crawl_order: {self.config.crawl_order}")
+
+        if self.config.dedup not in DEDUP_MODES:
+            raise ValueError(f"Unknown dedup: {self.config.dedup}")
+        self.duplicates = (
+            DuplicateDetector(self.config.dedup, self.config.dedup_threshold)
+            if self.config.dedup != "off" else None
+        )
+        self.dedup_counts = {"checked": 0, "exact": 0, "near": 0}
+        self.dedup_lock = threading.Lock()
+
+        # Jeden web (start_url + allowed_domain), nebo seznam seedů ze seed_file.
+        self.multi_domain = self.config.seed_file is not None
+        if self.multi_domain:
+            self.seeds = load_seed_file(self.config.seed_file)
+        else:
+            self.seeds = [Seed(self.config.start_url, self.config.allowed_domain)]
+        self.domain = self.seeds[0].domain
+        self.scope = DomainScope(seed.domain for seed in self.seeds)
+
+        self.robots_disallowed = {}
+        self.robots_delay = {}
+        self._load_all_robots()
+
+        # Fronta URL s plánováním po hostech: mezi požadavky na jeden host je
+        # aspoň host_delay / Crawl-delay z robots.txt a nejvýše
+        # max_connections_per_host souběžných spojení.
+        self.task_queue = self._new_scheduler(HostScheduler)
+
+    @property
+    def results(self) -> list[dict]:
+        """Výsledky (prvního) profilu při result_format = json."""
+        return self.profile_results[self.profiles[0]]
+
+    @results.setter
+    def results(self, value: list[dict]):
+        self.profile_results[self.profiles[0]] = value
+
+    @property
+    def disallowed_paths(self) -> list[str]:
+        """Pravidla Disallow hlavní domény (u seznamu seedů první z nich)."""
+        return self.robots_disallowed.get(self.domain, [])
+
+    @disallowed_paths.setter
+    def disallowed_paths(self, rules):
+        self.robots_disallowed[self.domain] = rules
+
+    def _new_scheduler(self, scheduler_cls):
+        # Odkazy nad queue_maxsize přetečou na disk (frontier_spill_dir, jinak dočasný adresář).
+        self.frontier_spill = SpillQueue(self.config.frontier_spill_dir)
+        scheduler = scheduler_cls(
+            self.config.host_delay,
+            self.config.max_connections_per_host,
+            self.config.queue_maxsize,
+            spill=self.frontier_spill,
+            score=self._score_url if self.config.crawl_order == "best_first" else None,
+        )
+        for domain, delay in self.robots_delay.items():
+            if delay > self.config.host_delay:
+                scheduler.set_delay(domain, delay)
+        return scheduler
+
+    def _score_url(self, url: str) -> float:
+        """Priorita URL pro best-first frontier podle profilu (extraktoru)."""
+        extractor = self.extractor
+        return extractor.score_url(url) if extractor else DEFAULT_SCORER(url)
 
     def set_extractor(self, extractor: BaseExtractor):
         self.extractor = extractor
@@ -68,94 +248,347 @@ class WebCrawler:
     def worker_thread(self, wid: int):
         self.log(f"[WORKER-{wid}] Start worker")
 
-        session = requests.Session()
-        session.headers.update({"User-Agent": self.config.user_agent})
-
         while True:
             url = self.task_queue.get()
 
             if url is JOB_SENTINEL:
-                self.task_queue.task_done()
                 break
 
-            with self.active_workers_lock:
-                self.active_workers += 1
-
+            # Stránku předanou do poolu procesů označí za hotovou až zpětné volání poolu.
+            handed_off = False
             try:
-                if self.crawl_delay > 0:
-                    time.sleep(self.crawl_delay)
+                index = self._claim_page()
+                if index is None:
+                    self.task_queue.release(url)
+                    continue
 
-                with self.page_count_lock:
-                    if self.page_count >= self.config.max_pages:
-                        continue
-                    self.page_count += 1
-                    index = self.page_count
+                cached = self.recrawl.get(url) if self.recrawl else None
+                page = html = meta = None
 
+                t0 = time.perf_counter()
                 try:
-                    resp = session.get(url, timeout=self.config.request_timeout)
-                    resp.raise_for_status()
-                    html = resp.text
+                    page = self.http.fetch(
+                        url,
+                        timeout=self.config.request_timeout,
+                        headers=cached.conditional_headers() if cached else None,
+                        max_bytes=self.config.max_body_bytes,
+                    )
+                    if not (cached and page.status_code == 304):
+                        html = page.body
+                        meta = ResponseMeta(page.status_code, page.headers)
+                except BodyRejected as e:
+                    self.log(f"[WORKER-{wid}] SKIP {url}: {e}")
+                    self._page_done(url)
+                    continue
                 except Exception as e:
                     self.log(f"[WORKER-{wid}] ERROR {url}: {e}")
+                    self._page_done(url)
                     continue
+                finally:
+                    self.task_queue.release(url)
+                fetch_seconds = time.perf_counter() - t0
 
-                if self.extractor:
-                    extracted = None
-                    try:
-                        extracted = self.extractor.extract(url, html)
-                    except Exception as e:
-                        self.log(f"[WORKER-{wid}] EXTRACT ERROR {url}: {e}")
-
-                    if self._should_save(extracted):
-                        self.results.append(extracted)
-
-                if self.config.save_html:
-                    self._save_page(index, url, html)
-
-                links = self._extract_links(url, html)
-
-                with self.visited_lock:
-                    for link in links:
-                        if link in self.visited:
-                            continue
-                        if not self._same_domain(link):
-                            continue
-                        if not self._allowed_by_robots(link):
-                            continue
-                        self.visited.add(link)
-                        try:
-                            self.task_queue.put_nowait(link)
-                        except:
-                            pass
+                if cached and self._reuse_cached(url, cached, html, meta):
+                    for link in self._finish_cached(wid, url, cached, fetch_seconds):
+                        self._enqueue(link)
+                    continue
+
+                if self.duplicates and self._is_duplicate(wid, url, page.body, page.encoding):
+                    self._page_done(url)
+                    continue
+
+                if self.extract_pool:
+                    handed_off = self._submit_to_pool(wid, index, url, html, fetch_seconds, meta, page.encoding)
+                    continue
+
+                for link in self._process_page(wid, index, url, html, fetch_seconds, meta, page.encoding):
+                    self._enqueue(link)
 
             finally:
-                with self.active_workers_lock:
-                    self.active_workers -= 1
-                self.task_queue.task_done()
+                if not handed_off:
+                    self.task_queue.task_done()
 
-        session.close()
         self.log(f"[WORKER-{wid}] Ukončen.")
 
-    def _should_save(self, data: dict | None) -> bool:
-        if not data:
+    def _claim_page(self) -> int | None:
+        """
+        Zarezervuje pořadové číslo stránky, nebo vrátí None po dosažení max_pages
+        či po přerušení běhu (URL pak zůstane ve frontieru uloženého stavu).
+        Fronta se zavře hned s poslední povolenou stránkou – zbytek se zahodí
+        a nové odkazy se už nepřijímají, takže běh skončí s rozpracovanými
+        stránkami a workery neprocházejí frontu URL po URL.
+        """
+        if self.stop_event.is_set():
+            self.task_queue.close()
+            return None
+        with self.page_count_lock:
+            if self.page_count >= self.config.max_pages:
+                self.task_queue.close()
+                return None
+            self.page_count += 1
+            index = self.page_count
+        if index >= self.config.max_pages:
+            self.task_queue.close()
+        return index
+
+    def _is_duplicate(self, wid, url, html, encoding=None) -> bool:
+        """
+        Kopie už zpracované stránky (stejné tělo, v režimu near i téměř stejný
+        text) se přeskočí celá – bez extrakce, ukládání i rozšiřování odkazů.
+        """
+        if not self.duplicates:
             return False
 
-        profile = self.config.profile
-
-        if profile == "contacts":
-            return bool(data.get("emails")) or bool(data.get("phones"))
-
-        if profile == "seo":
-            return bool(data.get("title")) or bool(data.get("meta_description"))
+        found = self.duplicates.check(url, html, encoding)
+        with self.dedup_lock:
+            self.dedup_counts["checked"] += 1
+            if found:
+                self.dedup_counts[found[0]] += 1
+
+        if found:
+            self.log(f"[WORKER-{wid}] DUPLICATE ({found[0]}) {url} = {found[1]}")
+            return True
+        return False
+
+    def dedup_summary(self) -> dict:
+        """Počty zkontrolovaných a duplicitních stránek a podíl duplicit."""
+        with self.dedup_lock:
+            counts = dict(self.dedup_counts)
+        duplicates = counts["exact"] + counts["near"]
+        counts["rate"] = duplicates / counts["checked"] if counts["checked"] else 0.0
+        return counts
+
+    def _process_page(self, wid, index, url, html, fetch_seconds=0.0, meta=None, encoding=None) -> list[str]:
+        """
+        Zpracuje stažené HTML (extrakce, uložení, odkazy) v aktuálním vlákně.
+        Stránka se naparsuje nejvýše jednou a strom sdílí extraktor i hledání
+        odkazů; v režimu link_extraction = fast se odkazy hledají regulárním
+        výrazem a strom se staví jen tehdy, když ho potřebuje extraktor.
+        html je text, nebo stažené tělo v bajtech s kódováním encoding –
+        backendy lxml a selectolax pak parsují přímo bajty.
+        Vrací nově přijaté URL, které má volající zařadit do fronty.
+        """
+        analysis = analyze_page(self.extractor, url, html, self.parser, self.config.link_extraction, encoding)
+        save_seconds = self._save_page_timed(index, url, html, meta, encoding)
+        self._remember(url, html, meta, analysis)
+        return self._finish_page(wid, url, analysis, fetch_seconds, save_seconds)
+
+    def _submit_to_pool(self, wid, index, url, html, fetch_seconds, meta=None, encoding=None):
+        """
+        Předá HTML do poolu procesů (extract_processes > 0). URL zůstává
+        nedokončenou prací fronty, dokud se výsledek nevrátí a odkazy
+        nezařadí – task_done() pak volá zpětné volání poolu, ne worker.
+        Vrací False, když se stránku do poolu předat nepodařilo.
+        """
+        save_seconds = self._save_page_timed(index, url, html, meta, encoding)
+
+        def done(future):
+            try:
+                analysis = future.result()
+            except Exception as e:
+                analysis = PageAnalysis(error=f"process pool: {e}")
+            try:
+                self._remember(url, html, meta, analysis)
+                for link in self._finish_page(wid, url, analysis, fetch_seconds, save_seconds):
+                    self._enqueue(link)
+            finally:
+                self.task_queue.task_done()
 
-        if profile == "content":
-            text = data.get("text", "").strip()
-            return len(text) > 20
+        try:
+            future = self.extract_pool.submit(url, html, encoding)
+        except Exception as e:
+            self.log(f"[WORKER-{wid}] EXTRACT ERROR {url}: {e}")
+            self._page_done(url)
+            return False
+        future.add_done_callback(done)
+        return True
 
+    def _save_page_timed(self, index, url, html, meta=None, encoding=None) -> float:
+        if not self.config.save_html:
+            return 0.0
+        t0 = time.perf_counter()
+        if isinstance(html, bytes) and not self.archive:
+            # Archiv ukládá původní bajty, na text se dekóduje jen pro soubory.
+            html = decode_html(html, encoding or detect_encoding(html))
+        self._save_page(index, url, html, meta)
+        return time.perf_counter() - t0
+
+    def _finish_page(self, wid, url, analysis: PageAnalysis, fetch_seconds=0.0, save_seconds=0.0) -> list[str]:
+        """Zapíše výsledek extrakce a přijme nalezené odkazy (sdílený stav crawleru)."""
+        if analysis.error:
+            self.log(f"[WORKER-{wid}] EXTRACT ERROR {url}: {analysis.error}")
+
+        saved = results_to_save(self.profiles, analysis.extracted) if self.extractor else []
+        for profile, data in saved:
+            self._store_result(url, data, profile)
+        if saved and self.state:
+            # Do stavu jde celý výsledek stránky – u více profilů slovník profil → výsledek.
+            self.state.add_result(url, dict(saved) if len(self.profiles) > 1 else saved[0][1])
+
+        t0 = time.perf_counter()
+        admitted = self._admit_links(analysis.links)
+        admit_seconds = time.perf_counter() - t0
+
+        self._record_timing(wid, url, {
+            "fetch": fetch_seconds,
+            "parse": analysis.parse_seconds,
+            "extract": analysis.extract_seconds,
+            "links": analysis.links_seconds + admit_seconds,
+            "save": save_seconds,
+        })
+        self._page_done(url)
+        return admitted
+
+    def _reuse_cached(self, url, cached: CachedPage, html, meta) -> bool:
+        """
+        Zda jde stránku převzít z minulého běhu: server vrátil 304 (html None),
+        nebo poslal stejné tělo (validátory nepodporuje či je mění zbytečně).
+        U stejného těla se jen obnoví uložené validátory.
+        """
+        if html is None:
+            self.recrawl.record_reuse("not_modified", cached)
+            return True
+
+        digest, size = page_fingerprint(html)
+        if digest != cached.content_hash:
+            return False
+        self.recrawl.record_reuse("unchanged", cached)
+        self.recrawl.put(url, meta.headers, digest, size, cached.cpu_seconds, cached.result, cached.links)
         return True
 
-    def _load_robots_txt(self):
-        root = f"https://{self.domain}/robots.txt"
+    def _finish_cached(self, wid, url, cached: CachedPage, fetch_seconds=0.0) -> list[str]:
+        """Uložený výsledek a odkazy projdou stejnou cestou jako čerstvě zpracovaná stránka."""
+        return self._finish_page(wid, url, PageAnalysis(extracted=cached.result, links=cached.links), fetch_seconds)
+
+    def _remember(self, url, html, meta, analysis: PageAnalysis):
+        """Zapíše validátory, otisk a výsledek zpracování stránky pro příští běh."""
+        if not self.recrawl or meta is None or analysis.error:
+            return
+        digest, size = page_fingerprint(html)
+        cpu_seconds = analysis.parse_seconds + analysis.extract_seconds + analysis.links_seconds
+        self.recrawl.put(url, meta.headers, digest, size, cpu_seconds, analysis.extracted, analysis.links)
+
+    def recrawl_summary(self) -> dict | None:
+        """Kolik stránek se převzalo z minulého běhu a kolik přenosu a CPU to ušetřilo."""
+        return self.recrawl.summary() if self.recrawl else None
+
+    def _store_result(self, url, data: dict, profile: str | None = None):
+        profile = profile or self.profiles[0]
+        if self.sink:
+            self.sink.add(self._result_path(url, profile), data)
+        else:
+            self.profile_results[profile].append(data)
+
+    def _result_path(self, url: str, profile: str | None = None):
+        suffix = SUFFIXES[self.config.result_format]
+        return self._domain_dir(url) / f"{profile or self.profiles[0]}_data{suffix}"
+
+    def _page_done(self, url):
+        """Stránka je zpracovaná – po navázání běhu se už znovu nestahuje."""
+        if self.state:
+            self.state.mark_done(url)
+
+    def _record_timing(self, wid, url, timing: dict):
+        with self.timings_lock:
+            for stage, seconds in timing.items():
+                self.timings[stage] += seconds
+            self.timed_pages += 1
+
+        parts = " ".join(f"{stage}={timing[stage] * 1000:.1f}ms" for stage in TIMING_STAGES)
+        self.log(f"[WORKER-{wid}] TIMING {url} {parts}")
+
+    def timing_summary(self) -> dict:
+        """Průměrný čas jednotlivých fází na stránku v milisekundách."""
+        with self.timings_lock:
+            pages = self.timed_pages
+            totals = dict(self.timings)
+        if not pages:
+            return dict.fromkeys(TIMING_STAGES, 0.0)
+        return {stage: totals[stage] * 1000 / pages for stage in TIMING_STAGES}
+
+    def _canonical(self, url: str) -> str:
+        return self.canonicalizer.canonicalize(url) if self.canonicalizer else url
+
+    def _admit_links(self, links) -> list[str]:
+        """
+        Přijme nové odkazy stránky: kanonizace a filtr domény a robots.txt
+        běží bez zámku, deduplikace proti visited jednou dávkou (každý shard
+        se zamkne jednou za stránku). Vrací kanonické URL, které se mají stáhnout.
+        """
+        canonicalizer = self.canonicalizer
+        candidates = []
+        raws = []
+        rewritten = 0
+        for raw in links:
+            link = canonicalizer.canonicalize(raw) if canonicalizer else raw
+            if not self._admissible(link):
+                continue
+            candidates.append(link)
+            if canonicalizer:
+                raws.append(raw)
+                rewritten += link != raw
+
+        admitted = self.visited.add_new(candidates)
+        if canonicalizer:
+            new_raw = len(self._raw_seen.add_new(raws))
+            with self.canonical_lock:
+                self.canonical_rewritten += rewritten
+                self.canonical_raw_urls += new_raw
+                self.canonical_admitted += len(admitted)
+        if self.state:
+            self.state.add_urls(admitted)
+        return admitted
+
+    def admission_summary(self) -> dict:
+        """
+        Souběh při přijímání odkazů do visited: počet částí, zamčení a kolik
+        z nich čekalo, čekání celkem a průměrně / nejvýše na vlákno v ms.
+        """
+        summary = self.visited.lock_summary()
+        per_thread = summary.pop("wait_per_thread")
+        summary["wait_per_worker_ms"] = summary["wait"] * 1000 / max(1, len(per_thread))
+        summary["max_wait_worker_ms"] = max(per_thread.values(), default=0.0) * 1000
+        return summary
+
+    def canonical_summary(self) -> dict:
+        """
+        Kolik odkazů kanonizace přepsala a kolik stažení ušetřila: různé surové
+        URL, které by bez ní prošly filtry, minus přijaté kanonické URL.
+        """
+        with self.canonical_lock:
+            return {
+                "rewritten": self.canonical_rewritten,
+                "raw_urls": self.canonical_raw_urls,
+                "admitted": self.canonical_admitted,
+                "saved": max(0, self.canonical_raw_urls - self.canonical_admitted),
+            }
+
+    def _enqueue(self, url):
+        # Nad queue_maxsize URL přetečou na disk, takže Full tu nenastane – kdyby ano, je to chyba, ne zahozená URL.
+        self.task_queue.put_nowait(url)
+
+    def frontier_summary(self) -> dict:
+        """Kolik URL přeteklo z paměťové fronty na disk a kolik se jich vrátilo zpět."""
+        return self.frontier_spill.summary()
+
+    def _should_save(self, data: dict | None) -> bool:
+        return should_save(self.config.profile, data)
+
+    def _load_all_robots(self):
+        """robots.txt všech domén – u seznamu seedů souběžně, ne web po webu."""
+        domains = [seed.domain for seed in self.seeds]
+        if len(domains) == 1:
+            results = [self._load_robots_txt(domains[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, len(domains))) as pool:
+                results = list(pool.map(self._load_robots_txt, domains))
+
+        for domain, (disallowed, delay) in zip(domains, results):
+            self.robots_disallowed[domain] = disallowed
+            self.robots_delay[domain] = delay
+
+    def _load_robots_txt(self, domain=None):
+        root = f"https://{domain or self.domain}/robots.txt"
         disallowed = []
         delay = 0
 
@@ -183,25 +616,32 @@ class WebCrawler:
         except Exception:
             return [], 0
 
+    def _admissible(self, url: str) -> bool:
+        """_same_domain a _allowed_by_robots nad jediným rozborem URL."""
+        parts = urlsplit(url)
+        domain = self.scope.match_host(parts.netloc)
+        if domain is None:
+            return False
+        path = parts.path
+        for rule in self.robots_disallowed.get(domain, ()):
+            if rule == "/" or path.startswith(rule):
+                return False
+        return True
+
     def _allowed_by_robots(self, url: str) -> bool:
-        path = urlparse(url).path
-        for rule in self.disallowed_paths:
+        parsed = urlparse(url)
+        path = parsed.path
+        for rule in self.robots_disallowed.get(self.scope.match_host(parsed.netloc), ()):
             if rule == "/" or path.startswith(rule):
                 return False
         return True
 
     def _same_domain(self, url: str) -> bool:
-        host = urlparse(url).netloc
-        return host == self.domain or host.endswith("." + self.domain)
-
-    def _extract_links(self, base, html):
-        soup = BeautifulSoup(html, "html.parser")
-        out = []
-        for a in soup.find_all("a", href=True):
-            abs_url = urljoin(base, a["href"])
-            cleaned = urlparse(abs_url)._replace(fragment="").geturl()
-            out.append(cleaned)
-        return out
+        return self.scope.match(url) is not None
+
+    def _domain_dir(self, url: str):
+        """Výstupní adresář stránky – u seznamu seedů podadresář její domény."""
+        return domain_dir(self.config.output_dir, self.scope if self.multi_domain else None, url)
 
     def _safe_filename(self, index, url):
         parsed = urlparse(url)
@@ -209,36 +649,168 @@ class WebCrawler:
         path = path.replace("/", "_")[:50]
         return f"{index:04d}_{path}.html"
 
-    def _save_page(self, index, url, html):
-        fpath = self.config.output_dir / self._safe_filename(index, url)
+    def _save_page(self, index, url, html, meta=None):
+        if self.archive:
+            try:
+                self.archive.add(url, html, meta)
+            except Exception as e:
+                self.log(f"[CRAWLER] ARCHIVE ERROR {url}: {e}")
+            return
+
+        fpath = self._domain_dir(url) / self._safe_filename(index, url)
         try:
+            fpath.parent.mkdir(parents=True, exist_ok=True)
             with fpath.open("w", encoding="utf-8") as f:
                 f.write(f"<!-- URL: {url} -->\n")
                 f.write(html)
         except:
             pass
 
+    def _start_extract_pool(self):
+        if self.config.extract_processes > 0:
+            self.extract_pool = ExtractionPool(
+                self.config.extract_processes,
+                self.extractor,
+                self.parser,
+                self.config.link_extraction,
+            )
+            self.log(f"[CRAWLER] Extrakce v {self.config.extract_processes} procesech.")
+
+    def _stop_extract_pool(self):
+        if self.extract_pool:
+            self.extract_pool.shutdown()
+            self.extract_pool = None
+
+    def _seed_urls(self) -> list[str]:
+        """
+        Počáteční obsah fronty: start_url (u seznamu seedů startovní URL všech
+        webů), nebo při --resume uložený frontier.
+        Při novém běhu s perzistencí se starý stav smaže.
+        """
+        if self.state and self.resume and self.state.exists():
+            visited, frontier, done, results = self.state.load()
+            self.visited.update(visited)
+            with self.page_count_lock:
+                self.page_count = done
+            for result in results:
+                saved = result.items() if len(self.profiles) > 1 else [(self.profiles[0], result)]
+                for profile, data in saved:
+                    self._store_result(data.get("url", ""), data, profile)
+            self.state.start()
+            self.log(f"[CRAWLER] Navazuji běh: {done} hotových stránek, {len(frontier)} URL ve frontieru.")
+            return frontier
+
+        start_urls = self.visited.add_new([self._canonical(seed.start_url) for seed in self.seeds])
+        if self._raw_seen is not None:
+            self._raw_seen.update(seed.start_url for seed in self.seeds)
+
+        if self.state:
+            self.state.reset()
+            self.state.start()
+            self.state.add_urls(start_urls)
+
+        return start_urls
+
+    def _close_state(self):
+        if self.state:
+            self.state.close()
+
+    def _open_sink(self):
+        if self.sink:
+            self.sink.start()
+            if not self.multi_domain:
+                for profile in self.profiles:
+                    self.sink.open(self._result_path(self.config.start_url, profile))
+
+    def _close_sink(self):
+        if self.sink:
+            self.sink.close()
+
+    def _open_archive(self):
+        """Archiv stránek v output_dir/archive; při --resume se pokračuje dalším segmentem."""
+        if self.config.save_html and self.config.html_store == "archive":
+            self.archive = PageArchive(
+                self.config.output_dir / "archive",
+                self.config.archive_compression,
+                self.config.archive_segment_mb * 2**20,
+                append=self.resume,
+            )
+
+    def _close_archive(self):
+        if self.archive:
+            self.archive.close()
+
+    def _open_http(self):
+        self.http = HttpClient(
+            self.config.http_client,
+            self.config.user_agent,
+            pool_size=self.config.http_pool_size,
+            pool_hosts=self.config.http_pool_hosts,
+            keepalive=self.config.http_keepalive,
+            http2=self.config.http2,
+            stats=self.http_stats,
+            dns=self.dns_cache,
+        )
+        if self.dns_cache and self.http.dns is None:
+            self.log(
+                f"[CRAWLER] DNS cache není s nainstalovanou verzí {self.config.http_client} dostupná, "
+                "používám resolver systému."
+            )
+
+    def _close_http(self):
+        if self.http:
+            self.http.close()
+
+    def connection_summary(self) -> dict:
+        """Požadavky, nová spojení, TLS handshaky a DNS dotazy; podíl znovupoužitých spojení."""
+        return self.http_stats.summary()
+
+    def _open_recrawl(self):
+        if self.recrawl:
+            self.recrawl.start()
+
+    def _close_recrawl(self):
+        if self.recrawl:
+            self.recrawl.close()
+
+    def _wait_until_done(self):
+        """Čeká, až je zpracovaná každá URL přijatá do fronty (bez dotazování)."""
+        self.task_queue.join()
+
+    def _interrupt(self):
+        """
+        Ctrl+C: workery dokončí rozpracované stránky, zbytek fronty se jen
+        vyprázdní (v uloženém stavu zůstává jako frontier pro --resume).
+        """
+        self.interrupted = True
+        self.stop_event.set()
+        self.task_queue.close()
+        self.log("[CRAWLER] Přerušeno uživatelem, ukládám stav.")
+        self._wait_until_done()
+
     def run(self):
         logger = threading.Thread(target=self.logger_thread, daemon=False)
         logger.start()
 
+        self._start_extract_pool()
+        self._open_sink()
+        self._open_archive()
+        self._open_recrawl()
+        self._open_http()
+
         workers = []
         for i in range(self.config.max_workers):
             t = threading.Thread(target=self.worker_thread, args=(i + 1,), daemon=False)
             t.start()
             workers.append(t)
 
-        with self.visited_lock:
-            self.visited.add(self.config.start_url)
-
-        self.task_queue.put(self.config.start_url)
+        for url in self._seed_urls():
+            self.task_queue.put(url)
 
-        while True:
-            time.sleep(0.2)
-            with self.active_workers_lock:
-                active = self.active_workers
-            if self.task_queue.empty() and active == 0:
-                break
+        try:
+            self._wait_until_done()
+        except KeyboardInterrupt:
+            self._interrupt()
 
         if self.page_count < self.config.max_pages:
             self.finished_early = True
@@ -249,12 +821,37 @@ class WebCrawler:
         for t in workers:
             t.join()
 
+        self._stop_extract_pool()
+        self._close_state()
+        self._close_sink()
+        self._close_archive()
+        self._close_recrawl()
+        self._close_http()
+
         self.log_queue.put(LOG_SENTINEL)
         self.log_queue.join()
         logger.join()
 
     def save_results(self):
-        output_path = self.config.output_dir / f"{self.config.profile}_data.json"
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
-        return output_path
+        """
+        Uloží výsledky do JSON. U seznamu seedů má každá doména vlastní soubor
+        output_dir/<doména>/<profil>_data.json, u více profilů má každý profil
+        vlastní soubor; v obou případech se vrací output_dir.
+        Při průběžném zápisu (result_format jiný než json) jsou výsledky už
+        na disku a jen se vrátí cesta k nim.
+        """
+        single_file = not self.multi_domain and len(self.profiles) == 1
+        if self.sink:
+            return self._result_path(self.config.start_url) if single_file else self.config.output_dir
+
+        for profile, results in self.profile_results.items():
+            by_dir = {} if self.multi_domain else {self.config.output_dir: []}
+            for result in results:
+                by_dir.setdefault(self._domain_dir(result.get("url", "")), []).append(result)
+
+            for directory, items in by_dir.items():
+                directory.mkdir(parents=True, exist_ok=True)
+                with (directory / f"{profile}_data.json").open("w", encoding="utf-8") as f:
+                    json.dump(items, f, indent=2, ensure_ascii=False)
+
+        return self._result_path(self.config.start_url) if single_file else self.config.output_dir
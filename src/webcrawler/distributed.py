@@ -0,0 +1,393 @@
+# src/webcrawler/distributed.py
+# Autor: Martin Šilar
+# Distribuovaný crawl – koordinátor se sdíleným frontierem a visited, workery v dalších procesech/strojích
+
+import json
+import threading
+import time
+import zlib
+from collections import deque
+from multiprocessing.managers import BaseManager
+
+from .canonical import UrlCanonicalizer
+from .crawler import JOB_SENTINEL, LOG_SENTINEL, WebCrawler
+from .extractor import profile_names
+from .politeness import url_host
+from .seeds import DomainScope, Seed, domain_dir, load_seed_file
+from .sink import SUFFIXES, ResultSink
+from .visited import make_visited_set
+
+
+# Jak často se worker ozve koordinátorovi, když nemá co dělat (s.).
+SYNC_INTERVAL = 0.05
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def host_partition(url: str, partitions: int) -> int:
+    """Oddíl podle hashe hostu – crc32 je na rozdíl od hash() stejný ve všech procesech."""
+    return zlib.crc32(url_host(url).encode("utf-8")) % partitions
+
+
+class Coordinator:
+    """
+    Sdílený stav distribuovaného crawlu: visited (deduplikace napříč uzly),
+    frontier rozdělený na oddíly podle hashe hostu – jeden oddíl na
+    registrovaného workera, takže každý host obsluhuje jediný uzel a jeho
+    zdvořilost se dá hlídat lokálně – a výsledky.
+
+    Worker si URL půjčuje (lease); nenahlásí-li je do lease_timeout jako hotové,
+    vrátí se do fronty. Worker, který se tak dlouho neozval, se odhlásí a jeho
+    oddíl se rozdělí mezi ostatní.
+
+    Všechny veřejné metody volají workery přes TCP (BaseManager), proto se
+    posílá vše v dávkách – jedno volání sync() na mnoho stránek.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.lease_timeout = config.lease_timeout
+        self.visited = make_visited_set(config.visited_store, config.visited_capacity, config.visited_error_rate)
+        self.backlog = deque()
+        self.queues = {}
+        self.workers = []
+        self.last_seen = {}
+        self.leases = {}
+        self.profiles = profile_names(config.profile)
+        self.results = []
+        self.result_count = 0
+        self.page_count = 0
+        self.done_count = 0
+        self.duplicates_dropped = 0
+        self.requeued = 0
+        self.registered_total = 0
+        self.byes = 0
+        self.finished = threading.Event()
+        self.lock = threading.Lock()
+        self._next_id = 0
+
+        canonicalizer = (
+            UrlCanonicalizer(config.canonicalize, config.canonical_strip_params) if config.canonicalize else None
+        )
+        self.multi_domain = config.seed_file is not None
+        if self.multi_domain:
+            self.seeds = load_seed_file(config.seed_file)
+        else:
+            self.seeds = [Seed(config.start_url, config.allowed_domain)]
+        self.scope = DomainScope(seed.domain for seed in self.seeds)
+
+        self.sink = None
+        if config.result_format != "json":
+            self.sink = ResultSink(config.result_format, config.result_fsync)
+            self.sink.start()
+
+        for seed in self.seeds:
+            url = canonicalizer.canonicalize(seed.start_url) if canonicalizer else seed.start_url
+            if url not in self.visited:
+                self.visited.add(url)
+                self.backlog.append(url)
+
+    # --- volání z workerů ---
+
+    def register(self) -> int:
+        with self.lock:
+            self._next_id += 1
+            wid = self._next_id
+            self.workers.append(wid)
+            self.queues[wid] = deque()
+            self.last_seen[wid] = time.monotonic()
+            self.registered_total += 1
+            self._rebalance()
+            return wid
+
+    def sync(self, wid: int, links=(), done=(), results=(), want=0, bye=False):
+        """
+        Jedno kolo komunikace workera: nové odkazy, hotové URL a výsledky
+        dovnitř, nejvýše want URL z jeho oddílu ven. Vrací (dávka, hotovo).
+        Odkazy se zpracují před hotovými URL, aby koordinátor nikdy neviděl
+        stránku hotovou dřív než její odkazy.
+        """
+        now = time.monotonic()
+        with self.lock:
+            if wid in self.last_seen:
+                self.last_seen[wid] = now
+
+            for url in links:
+                if url in self.visited:
+                    self.duplicates_dropped += 1
+                    continue
+                self.visited.add(url)
+                self._queue_for(url).append(url)
+
+            for url in done:
+                if self.leases.pop(url, None) is not None:
+                    self.done_count += 1
+
+            self._store_results(results)
+            self._expire(now)
+
+            batch = []
+            queue = self.queues.get(wid)
+            while queue and len(batch) < want and self.page_count < self.config.max_pages:
+                url = queue.popleft()
+                self.leases[url] = now + self.lease_timeout
+                self.page_count += 1
+                batch.append(url)
+
+            if bye and wid in self.queues:
+                self.byes += 1
+                self._remove_worker(wid)
+
+            self._check_finished()
+            return batch, self.finished.is_set()
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "workers": len(self.workers),
+                "registered": self.registered_total,
+                "pages": self.page_count,
+                "done": self.done_count,
+                "queued": len(self.backlog) + sum(len(q) for q in self.queues.values()),
+                "leased": len(self.leases),
+                "results": self.result_count,
+                "duplicates_dropped": self.duplicates_dropped,
+                "requeued": self.requeued,
+                "finished": self.finished.is_set(),
+            }
+
+    # --- vnitřní logika (pod self.lock) ---
+
+    def _store_results(self, results):
+        # Výsledek je slovník (jediný profil), u více profilů dvojice (profil, slovník).
+        self.result_count += len(results)
+        for result in results:
+            profile, data = result if isinstance(result, tuple) else (self.profiles[0], result)
+            if self.sink:
+                self.sink.add(self._result_path(data.get("url", ""), profile=profile), data)
+            else:
+                self.results.append((profile, data))
+
+    def _result_dir(self, url):
+        return domain_dir(self.config.output_dir, self.scope if self.multi_domain else None, url)
+
+    def _result_path(self, url, suffix=None, profile=None):
+        suffix = suffix or SUFFIXES[self.config.result_format]
+        return self._result_dir(url) / f"{profile or self.profiles[0]}_data{suffix}"
+
+    def _queue_for(self, url):
+        if not self.workers:
+            return self.backlog
+        return self.queues[self.workers[host_partition(url, len(self.workers))]]
+
+    def _rebalance(self):
+        """Po změně počtu workerů rozdělí čekající URL podle nového počtu oddílů."""
+        pending = list(self.backlog)
+        self.backlog.clear()
+        for queue in self.queues.values():
+            pending.extend(queue)
+            queue.clear()
+        for url in pending:
+            self._queue_for(url).append(url)
+
+    def _remove_worker(self, wid):
+        self.workers.remove(wid)
+        self.last_seen.pop(wid, None)
+        queue = self.queues.pop(wid)
+        self.backlog.extend(queue)
+        self._rebalance()
+
+    def _expire(self, now):
+        for wid, seen in list(self.last_seen.items()):
+            if now - seen > self.lease_timeout:
+                self._remove_worker(wid)
+
+        expired = [url for url, deadline in self.leases.items() if deadline < now]
+        for url in expired:
+            del self.leases[url]
+            self.page_count -= 1
+            self.requeued += 1
+            self._queue_for(url).append(url)
+
+    def _check_finished(self):
+        if self.finished.is_set() or not self.registered_total or self.leases:
+            return
+        queued = self.backlog or any(self.queues.values())
+        if not queued or self.page_count >= self.config.max_pages:
+            self.finished.set()
+
+    # --- výstup ---
+
+    def save_results(self):
+        """Uloží výsledky všech workerů stejně jako WebCrawler.save_results()."""
+        single_file = not self.multi_domain and len(self.profiles) == 1
+        if self.sink:
+            if not self.multi_domain:
+                for profile in self.profiles:
+                    self.sink.open(self._result_path(self.config.start_url, profile=profile))
+            self.sink.close()
+            return self._result_path(self.config.start_url) if single_file else self.config.output_dir
+
+        with self.lock:
+            results = list(self.results)
+
+        by_file = {}
+        if not self.multi_domain:
+            for profile in self.profiles:
+                by_file[self._result_path(self.config.start_url, ".json", profile)] = []
+        for profile, data in results:
+            by_file.setdefault(self._result_path(data.get("url", ""), ".json", profile), []).append(data)
+
+        for path, items in by_file.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("w", encoding="utf-8") as f:
+                json.dump(items, f, indent=2, ensure_ascii=False)
+
+        return self._result_path(self.config.start_url, ".json") if single_file else self.config.output_dir
+
+
+def _authkey(authkey: str) -> bytes:
+    # Bez sdíleného klíče by se ke koordinátoru (a přes pickle k jeho procesu) mohl připojit kdokoli.
+    if not authkey:
+        raise ValueError("Chybí coordinator_authkey – nastavte v configu sdílený tajný klíč koordinátora a workerů.")
+    return authkey.encode("utf-8")
+
+
+def serve_coordinator(coordinator: Coordinator, address: str, authkey: str):
+    """
+    Spustí TCP server koordinátora ve vlákně na pozadí. Vrací server
+    (server.address je skutečná adresa, i když byl zadán port 0);
+    zastaví se přes server.stop_event.set(). Bez authkey ValueError.
+    """
+    class _Manager(BaseManager):
+        pass
+
+    _Manager.register("coordinator", callable=lambda: coordinator)
+    manager = _Manager(address=parse_address(address), authkey=_authkey(authkey))
+    server = manager.get_server()
+
+    def serve():
+        try:
+            server.serve_forever()
+        except SystemExit:
+            # serve_forever() po zastavení volá sys.exit(), je-li přesměrovaný stdout.
+            pass
+        finally:
+            server.listener.close()
+
+    threading.Thread(target=serve, daemon=True).start()
+    return server
+
+
+def connect_coordinator(address: str, authkey: str):
+    class _Client(BaseManager):
+        pass
+
+    _Client.register("coordinator")
+    client = _Client(address=parse_address(address), authkey=_authkey(authkey))
+    client.connect()
+    return client.coordinator()
+
+
+class DistributedCrawler(WebCrawler):
+    """
+    Worker distribuovaného crawlu (python -m src.main --worker). Stahuje a
+    extrahuje stejně jako WebCrawler, ale URL si bere po dávkách z oddílu
+    u koordinátora a nalezené odkazy, hotové stránky a výsledky mu posílá
+    zpět. Lokální visited slouží jen jako cache, aby se stejné odkazy
+    neposílaly opakovaně – rozhoduje visited koordinátora.
+    """
+
+    def __init__(self, config, coordinator=None):
+        super().__init__(config)
+        # Výsledky ukládá koordinátor, worker je drží jen do další synchronizace.
+        self.state = None
+        self.sink = None
+        self.coordinator = coordinator or connect_coordinator(config.coordinator, config.coordinator_authkey)
+        self.worker_id = self.coordinator.register()
+        self._out_links = []
+        self._out_done = []
+        self._out_results = []
+        self._outbox_lock = threading.Lock()
+        self.log(f"[CRAWLER] Registrován u koordinátora {config.coordinator} jako worker {self.worker_id}.")
+
+    def _admit_links(self, links) -> list[str]:
+        admitted = super()._admit_links(links)
+        with self._outbox_lock:
+            self._out_links.extend(admitted)
+        return []
+
+    def _store_result(self, url, data: dict, profile: str | None = None):
+        result = (profile, data) if len(self.profiles) > 1 else data
+        with self._outbox_lock:
+            self._out_results.append(result)
+
+    def _page_done(self, url):
+        with self._outbox_lock:
+            self._out_done.append(url)
+
+    def _sync(self, want=0, bye=False):
+        with self._outbox_lock:
+            links, self._out_links = self._out_links, []
+            done, self._out_done = self._out_done, []
+            results, self._out_results = self._out_results, []
+        return self.coordinator.sync(self.worker_id, links, done, results, want, bye)
+
+    def _sync_loop(self):
+        while True:
+            want = max(0, self.config.distributed_batch - self.task_queue.qsize())
+            batch, finished = self._sync(want)
+            for url in batch:
+                self.task_queue.put(url)
+            if finished:
+                return
+            if not batch:
+                time.sleep(SYNC_INTERVAL)
+
+    def run(self):
+        logger = threading.Thread(target=self.logger_thread, daemon=False)
+        logger.start()
+
+        self._start_extract_pool()
+        self._open_recrawl()
+        self._open_http()
+
+        workers = []
+        for i in range(self.config.max_workers):
+            t = threading.Thread(target=self.worker_thread, args=(i + 1,), daemon=False)
+            t.start()
+            workers.append(t)
+
+        synced = False
+        try:
+            try:
+                self._sync_loop()
+            except KeyboardInterrupt:
+                # Rozpůjčené URL vrátí koordinátor po lease_timeout do fronty.
+                self.interrupted = True
+                self.stop_event.set()
+                self.task_queue.close()
+            synced = True
+        finally:
+            if not synced:
+                # Spojení s koordinátorem spadlo – workery se zastaví a výjimka jde dál.
+                self.stop_event.set()
+                self.task_queue.close()
+            for _ in workers:
+                self.task_queue.put(JOB_SENTINEL)
+            for t in workers:
+                t.join()
+
+            self._stop_extract_pool()
+            self._close_recrawl()
+            self._close_http()
+            try:
+                if synced:
+                    self._sync(bye=True)
+            finally:
+                self.log_queue.put(LOG_SENTINEL)
+                self.log_queue.join()
+                logger.join()
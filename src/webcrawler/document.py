@@ -0,0 +1,128 @@
+# src/webcrawler/document.py
+# Autor: Martin Šilar
+# Jednou naparsovaný HTML dokument sdílený hledáním odkazů i extraktory
+
+import re
+import time
+
+from bs4 import BeautifulSoup
+
+from .charset import decode_html, detect_encoding
+
+
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+# Obsah těchto tagů BeautifulSoup do get_text() nepočítá – ostatní backendy také ne.
+NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+class HtmlDocument:
+    """
+    Obal nad HTML stránkou, který ji naparsuje nejvýše jednou.
+    Strom se vytvoří líně při prvním dotazu; výsledky dotazů
+    (text, odkazy) se cachují, takže je může sdílet více konzumentů.
+
+    Tato třída je referenční backend (BeautifulSoup + html.parser);
+    rychlejší backendy v parsers.py přepisují metody _parse, _text,
+    _links, base_href, title, meta_content a headings se stejnou sémantikou.
+
+    Stránku lze předat i jako bajty staženého těla (s kódováním, jinak se
+    určí z <meta charset>): backendy, které umí parsovat bajty, je dostanou
+    přímo a text (html) se dekóduje až při prvním použití.
+    """
+
+    parser_name = "html.parser"
+
+    def __init__(self, html: str | bytes, encoding: str | None = None):
+        if isinstance(html, bytes):
+            self.body = html
+            self.encoding = encoding or detect_encoding(html)
+            self._html = None
+        else:
+            self.body = None
+            self.encoding = "utf-8"
+            self._html = html or ""
+        self.parse_seconds = 0.0
+        self._tree = None
+        self._parsed = False
+        self._text_cache = {}
+        self._links_cache = None
+
+    @property
+    def html(self) -> str:
+        if self._html is None:
+            self._html = decode_html(self.body, self.encoding)
+        return self._html
+
+    def is_empty(self) -> bool:
+        return not (self.body if self._html is None else self._html)
+
+    @property
+    def tree(self):
+        """Naparsovaný strom daného backendu (u výchozího backendu BeautifulSoup)."""
+        if not self._parsed:
+            t0 = time.perf_counter()
+            self._tree = self._parse()
+            self.parse_seconds = time.perf_counter() - t0
+            self._parsed = True
+        return self._tree
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        return self.tree
+
+    def parse(self) -> "HtmlDocument":
+        """Vynutí parsování (např. kvůli měření času) a vrátí sebe."""
+        _ = self.tree
+        return self
+
+    def text(self, separator: str = " ", strip: bool = False) -> str:
+        key = (separator, strip)
+        if key not in self._text_cache:
+            self._text_cache[key] = self._text(separator, strip)
+        return self._text_cache[key]
+
+    def clean_text(self) -> str:
+        """Text stránky se sloučenými bílými znaky."""
+        return re.sub(r"\s+", " ", self.text(" ")).strip()
+
+    def links(self) -> list[str]:
+        """Hodnoty href všech odkazů <a> v pořadí výskytu (neabsolutizované)."""
+        if self._links_cache is None:
+            self._links_cache = self._links()
+        return self._links_cache
+
+    def base_href(self) -> str | None:
+        """Hodnota href prvního <base href=...>, None pokud stránka base nemá."""
+        tag = self.soup.find("base", href=True)
+        return tag["href"] if tag else None
+
+    def title(self) -> str:
+        tag = self.soup.find("title")
+        return tag.text.strip() if tag else ""
+
+    def meta_content(self, name: str) -> str | None:
+        """Obsah <meta name=... content=...>, None pokud meta chybí."""
+        tag = self.soup.find("meta", attrs={"name": name})
+        if tag is None:
+            return None
+        return tag.get("content", "")
+
+    def headings(self) -> list[str]:
+        """Neprázdné texty nadpisů, seřazené podle úrovně (všechny h1, pak h2, …)."""
+        out = []
+        for h in HEADING_TAGS:
+            for tag in self.soup.find_all(h):
+                text = tag.get_text(strip=True)
+                if text:
+                    out.append(text)
+        return out
+
+    def _parse(self):
+        return BeautifulSoup(self.html, "html.parser")
+
+    def _text(self, separator: str, strip: bool) -> str:
+        return self.soup.get_text(separator=separator, strip=strip)
+
+    def _links(self) -> list[str]:
+        return [a["href"] for a in self.soup.find_all("a", href=True)]
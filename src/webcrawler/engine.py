@@ -0,0 +1,18 @@
+# src/webcrawler/engine.py
+# Autor: Martin Šilar
+# Výběr enginu crawleru podle konfigurace (threads / async)
+
+from .crawler import WebCrawler
+
+
+def build_crawler(config, resume=False):
+    name = config.engine.lower()
+
+    if name == "threads":
+        return WebCrawler(config, resume=resume)
+
+    if name == "async":
+        from .async_crawler import AsyncWebCrawler
+        return AsyncWebCrawler(config, resume=resume)
+
+    raise ValueError(f"Unknown engine: {config.engine}")
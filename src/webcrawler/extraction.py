@@ -0,0 +1,119 @@
+# src/webcrawler/extraction.py
+# Autor: Martin Šilar
+# Zpracování stránky (parse → extrakce → odkazy) a volitelný pool procesů pro CPU práci
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from .link_scanner import resolve_links, scan_links
+from .parsers import create_document
+
+
+@dataclass
+class PageAnalysis:
+    """Výsledek CPU části zpracování jedné stránky."""
+    extracted: dict | None = None
+    error: str | None = None
+    links: list[str] = field(default_factory=list)
+    parse_seconds: float = 0.0
+    extract_seconds: float = 0.0
+    links_seconds: float = 0.0
+
+
+def analyze_page(extractor, url: str, html: str | bytes, parser: str, link_extraction: str | None,
+                 encoding: str | None = None) -> PageAnalysis:
+    """
+    Naparsuje stránku (nejvýše jednou), spustí extraktor a najde odkazy
+    (link_extraction None = odkazy nehledat, např. při reextrakci).
+    html může být i stažené tělo v bajtech s kódováním encoding.
+    Nesahá na sdílený stav crawleru, takže může běžet ve vlákně i v jiném procesu.
+    """
+    result = PageAnalysis()
+    doc = create_document(html, parser, encoding)
+
+    if extractor:
+        if extractor.uses_tree:
+            doc.parse()
+        t0 = time.perf_counter()
+        try:
+            result.extracted = extractor.extract(url, doc)
+        except Exception as e:
+            result.error = str(e)
+        result.extract_seconds = time.perf_counter() - t0
+
+    if link_extraction is None:
+        result.parse_seconds = doc.parse_seconds
+        return result
+
+    if link_extraction != "fast":
+        # Strom se postaví mimo měření odkazů, jinak by se parsování počítalo dvakrát.
+        doc.parse()
+    t0 = time.perf_counter()
+    if link_extraction == "fast":
+        base_href, hrefs = scan_links(doc.html)
+    else:
+        base_href, hrefs = doc.base_href(), doc.links()
+    result.links = resolve_links(url, base_href, hrefs)
+    result.links_seconds = time.perf_counter() - t0
+
+    result.parse_seconds = doc.parse_seconds
+    return result
+
+
+# Stav pracovního procesu – nastaví ho _init_process při startu poolu.
+_process_state = {}
+
+
+def _init_process(extractor, parser, link_extraction):
+    _process_state["extractor"] = extractor
+    _process_state["parser"] = parser
+    _process_state["link_extraction"] = link_extraction
+
+
+def _analyze_in_process(url: str, html: str | bytes, encoding: str | None) -> PageAnalysis:
+    return analyze_page(
+        _process_state["extractor"], url, html,
+        _process_state["parser"], _process_state["link_extraction"], encoding,
+    )
+
+
+class ExtractionPool:
+    """
+    Pool procesů pro CPU náročnou část zpracování stránek (obchází GIL).
+
+    submit() blokuje, dokud je rozpracováno max_inflight stránek – tím je
+    shora omezená paměť držená HTML čekajícím na zpracování.
+    Procesy se startují metodou spawn (bezpečné při běžících vláknech, funguje i na Windows).
+    """
+
+    def __init__(self, processes: int, extractor, parser: str, link_extraction: str | None, max_inflight: int | None = None):
+        if extractor is not None:
+            # Odkaz na crawler (zámky, fronty) do jiného procesu přenést nejde a není potřeba.
+            extractor = extractor.without_crawler()
+
+        self.processes = processes
+        self.max_inflight = max_inflight or processes * 4
+        self._slots = threading.BoundedSemaphore(self.max_inflight)
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_process,
+            initargs=(extractor, parser, link_extraction),
+        )
+
+    def submit(self, url: str, html: str | bytes, encoding: str | None = None):
+        """html může být i tělo v bajtech – dekóduje se až v pracovním procesu (a jen když je potřeba)."""
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(_analyze_in_process, url, html, encoding)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
@@ -2,13 +2,27 @@
 # Autor: Martin Šilar
 # Původní extraktor – nahrazen specializovanými extraktory
 
+from .composite_extractor import CompositeExtractor
 from .contacts_extractor import ContactsExtractor
 from .seo_extractor import SEOExtractor
 from .content_extractor import ContentExtractor
 
 
+def profile_names(profile: str) -> list[str]:
+    """Profily jednoho crawlu – hodnota profile může jich vyjmenovat více, oddělených čárkou."""
+    names = [p.strip().lower() for p in (profile or "").split(",") if p.strip()]
+    return list(dict.fromkeys(names)) or [profile]
+
+
 def build_extractor(profile_name: str):
-    name = profile_name.lower()
+    names = profile_names(profile_name)
+
+    if len(names) > 1:
+        if "raw" in names:
+            raise ValueError("Profil raw nejde kombinovat s dalšími profily.")
+        return CompositeExtractor({name: build_extractor(name) for name in names})
+
+    name = names[0]
 
     if name == "contacts":
         return ContactsExtractor()
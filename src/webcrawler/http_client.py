@@ -0,0 +1,377 @@
+# src/webcrawler/http_client.py
+# Autor: Martin Šilar
+# Sdílený HTTP klient workerů – pool spojení po hostech, keep-alive, volitelně HTTP/2 (httpx), DNS cache,
+# streamované stahování s limitem velikosti a kontrolou Content-Type, metriky spojení
+
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from functools import cached_property
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from .charset import decode_html, detect_encoding
+
+try:
+    from urllib3.exceptions import NameResolutionError
+except ImportError:
+    # urllib3 < 2 – chyba překladu se hlásí jako obecná NewConnectionError.
+    NameResolutionError = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+HTTP_CLIENTS = ("requests", "httpx")
+
+# Stahují se jen HTML stránky; odpověď bez Content-Type se bere jako HTML.
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+CHUNK_SIZE = 64 * 1024
+
+
+class BodyRejected(Exception):
+    """
+    Tělo odpovědi se nestahuje (reason content_type) nebo se čtení přerušilo
+    (reason too_large). avoided = nestažené bajty podle Content-Length
+    (0, když ho server neposlal).
+    """
+
+    def __init__(self, reason: str, detail: str, avoided: int = 0):
+        super().__init__(f"{reason}: {detail}")
+        self.reason = reason
+        self.avoided = avoided
+
+
+@dataclass
+class FetchedPage:
+    """
+    Stažená stránka – stav, hlavičky, tělo v bajtech a jeho kódování
+    (u 304 prázdné). Text se dekóduje až při prvním přístupu.
+    """
+    status_code: int
+    headers: dict
+    body: bytes = b""
+    encoding: str = "utf-8"
+
+    @cached_property
+    def text(self) -> str:
+        return decode_html(self.body, self.encoding)
+
+
+def declared_length(headers) -> int | None:
+    try:
+        return int(headers.get("Content-Length"))
+    except (TypeError, ValueError):
+        return None
+
+
+def check_headers(headers, max_bytes: int) -> int | None:
+    """
+    Ověří Content-Type a Content-Length ještě před čtením těla
+    (BodyRejected, když stránka není HTML nebo je větší než max_bytes;
+    0 = bez limitu). Vrací ohlášenou délku těla.
+    """
+    length = declared_length(headers)
+    ctype = (headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+    if ctype and ctype not in HTML_CONTENT_TYPES:
+        raise BodyRejected("content_type", ctype, length or 0)
+    if max_bytes and length is not None and length > max_bytes:
+        raise BodyRejected("too_large", f"Content-Length {length} B", length)
+    return length
+
+
+def check_size(read: int, length: int | None, max_bytes: int):
+    """Limit během čtení – pro servery, které Content-Length neposílají nebo ho podhodnotí."""
+    if max_bytes and read > max_bytes:
+        raise BodyRejected("too_large", f"přes {max_bytes} B", max(0, (length or 0) - read))
+
+
+class ConnectionStats:
+    """
+    Počty požadavků, nově otevřených spojení, TLS handshaků, DNS dotazů,
+    přečtených bajtů a odmítnutých těl (sdílené všemi workery).
+    """
+
+    FIELDS = (
+        "requests", "connections", "tls_handshakes", "dns_lookups", "dns_cached",
+        "bytes_read", "skipped_content_type", "skipped_too_large", "bytes_avoided",
+    )
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = dict.fromkeys(self.FIELDS, 0)
+
+    def add(self, **counts):
+        with self.lock:
+            for name, value in counts.items():
+                self.counts[name] += value
+
+    def summary(self) -> dict:
+        """Počty a z nich podíl znovupoužitých spojení a TLS handshaky na požadavek."""
+        with self.lock:
+            counts = dict(self.counts)
+        requests_ = counts["requests"]
+        counts["reuse_rate"] = max(0.0, 1 - counts["connections"] / requests_) if requests_ else 0.0
+        counts["handshakes_per_page"] = counts["tls_handshakes"] / requests_ if requests_ else 0.0
+        return counts
+
+    def record_rejected(self, error: BodyRejected):
+        self.add(**{f"skipped_{error.reason}": 1}, bytes_avoided=error.avoided)
+
+
+class DnsCache:
+    """
+    Cache výsledků socket.getaddrinfo s platností ttl sekund. Používá ji jen
+    klient, kterému se předá (HttpClient(dns=...)) – spojení urllib3 i httpx
+    se pak otevírají na adresy z cache; globální socket.getaddrinfo zůstává
+    beze změny.
+    """
+
+    def __init__(self, ttl: float, stats: ConnectionStats | None = None):
+        self.ttl = ttl
+        self.stats = stats
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def getaddrinfo(self, host, port, *args, **kwargs):
+        key = (host, port, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            if self.stats:
+                self.stats.add(dns_cached=1)
+            return entry[1]
+
+        result = socket.getaddrinfo(host, port, *args, **kwargs)
+        if self.stats:
+            self.stats.add(dns_lookups=1)
+        with self._lock:
+            self._entries[key] = (now + self.ttl, result)
+        return result
+
+    def resolve(self, host: str, port: int) -> list[str]:
+        """Adresy hostu v pořadí od resolveru, každá jednou."""
+        addresses = []
+        for *_, sockaddr in self.getaddrinfo(host.strip("[]"), port, 0, socket.SOCK_STREAM):
+            if sockaddr[0] not in addresses:
+                addresses.append(sockaddr[0])
+        if not addresses:
+            raise socket.gaierror(f"{host}: getaddrinfo nevrátil žádnou adresu")
+        return addresses
+
+
+def _new_conn_cached(conn, dns: DnsCache, new_conn):
+    """
+    Socket spojení urllib3 na adresy z DnsCache: _dns_host se dočasně nahradí
+    IP adresou (getaddrinfo na ni DNS nevolá), host pro SNI a ověření
+    certifikátu zůstává původní. Nedostupná adresa → zkusí se další.
+    """
+    host = conn._dns_host
+    try:
+        addresses = dns.resolve(host, conn.port)
+    except socket.gaierror as e:
+        if NameResolutionError is None:
+            raise NewConnectionError(conn, f"Failed to resolve '{conn.host}' ({e})") from e
+        raise NameResolutionError(conn.host, conn, e) from e
+
+    try:
+        for n, address in enumerate(addresses, 1):
+            conn._dns_host = address
+            try:
+                return new_conn()
+            except ConnectTimeoutError:
+                if n == len(addresses):
+                    raise
+    finally:
+        conn._dns_host = host
+
+
+def _urllib3_dns_hook() -> bool:
+    """
+    DNS cache u requests stojí na neveřejném API urllib3 (HTTPConnection._new_conn
+    a atribut _dns_host). Když je jiná verze nemá, cache se vypne – nespadne import ani spojení.
+    """
+    try:
+        conn = HTTPConnection("localhost")
+    except Exception:
+        return False
+    return callable(getattr(conn, "_new_conn", None)) and isinstance(getattr(conn, "_dns_host", None), str)
+
+
+def _counting_pool_classes(stats: ConnectionStats, dns: DnsCache | None = None) -> dict:
+    """
+    Třídy poolů urllib3, jejichž spojení započítají každé otevření (a u HTTPS
+    handshake) a s dns adresu hostu přeloží přes DnsCache.
+    """
+
+    class CountingConnection(HTTPConnection):
+        def connect(self):
+            stats.add(connections=1)
+            super().connect()
+
+        def _new_conn(self):
+            if dns and hasattr(self, "_dns_host"):
+                return _new_conn_cached(self, dns, super()._new_conn)
+            return super()._new_conn()
+
+    class CountingTlsConnection(HTTPSConnection):
+        def connect(self):
+            stats.add(connections=1, tls_handshakes=1)
+            super().connect()
+
+        def _new_conn(self):
+            if dns and hasattr(self, "_dns_host"):
+                return _new_conn_cached(self, dns, super()._new_conn)
+            return super()._new_conn()
+
+    class CountingPool(HTTPConnectionPool):
+        ConnectionCls = CountingConnection
+
+    class CountingTlsPool(HTTPSConnectionPool):
+        ConnectionCls = CountingTlsConnection
+
+    return {"http": CountingPool, "https": CountingTlsPool}
+
+
+def _cached_dns_backend(dns: DnsCache):
+    """
+    Síťový backend httpcore (pod httpx), který TCP spojení otevírá na adresy
+    z DnsCache. None, když httpcore SyncBackend nemá (jiná verze).
+    """
+    try:
+        import httpcore
+        base = httpcore.SyncBackend
+    except (ImportError, AttributeError):
+        return None
+
+    class CachedDnsBackend(base):
+        def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+            try:
+                addresses = dns.resolve(host, port)
+            except socket.gaierror as e:
+                raise httpcore.ConnectError(str(e)) from e
+            for n, address in enumerate(addresses, 1):
+                try:
+                    return super().connect_tcp(address, port, timeout, local_address, socket_options)
+                except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                    if n == len(addresses):
+                        raise
+
+    return CachedDnsBackend()
+
+
+class HttpClient:
+    """
+    Jeden klient sdílený všemi workery – spojení na host se tak znovu
+    používají napříč workery místo jednoho poolu na vlákno.
+
+    requests: pool urllib3 drží spojení pro nejvýše pool_hosts hostů,
+    na každý z nich nejvýše pool_size nečinných spojení.
+    httpx: stejné limity pro keep-alive, volitelně HTTP/2 (více požadavků
+    na host po jediném spojení; vyžaduje balíček h2 a server s ALPN h2).
+    keepalive = False posílá Connection: close (každý požadavek nové spojení).
+    dns = DnsCache, přes kterou se překládají adresy hostů (None = resolver systému).
+    Napojení cache jde přes neveřejné API urllib3 / httpcore; když ho nainstalovaná
+    verze nemá, klient použije resolver systému a self.dns je None.
+    """
+
+    def __init__(self, client: str, user_agent: str, pool_size: int = 10, pool_hosts: int = 100,
+                 keepalive: bool = True, http2: bool = False, stats: ConnectionStats | None = None,
+                 dns: DnsCache | None = None):
+        if client not in HTTP_CLIENTS:
+            raise ValueError(f"Unknown http_client: {client}")
+        if http2 and client != "httpx":
+            raise ValueError("http2 vyžaduje http_client = httpx.")
+
+        self.client = client
+        self.stats = stats or ConnectionStats()
+        self.dns = dns
+        headers = {"User-Agent": user_agent}
+        if not keepalive:
+            headers["Connection"] = "close"
+
+        if client == "requests":
+            self._session = requests.Session()
+            self._session.headers.update(headers)
+            adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size)
+            if dns and not _urllib3_dns_hook():
+                self.dns = None
+            adapter.poolmanager.pool_classes_by_scheme = _counting_pool_classes(self.stats, self.dns)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            return
+
+        if httpx is None:
+            raise ImportError("http_client = httpx vyžaduje balíček httpx (pip install httpx).")
+        try:
+            transport = httpx.HTTPTransport(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=None,
+                    max_keepalive_connections=pool_size * pool_hosts,
+                ),
+            )
+        except ImportError:
+            raise ImportError("http2 vyžaduje balíček h2 (pip install httpx[http2]).")
+        if dns:
+            # httpx nemá veřejný parametr pro resolver – backend se vymění v poolu transportu.
+            pool = getattr(transport, "_pool", None)
+            backend = _cached_dns_backend(dns) if hasattr(pool, "_network_backend") else None
+            if backend is None:
+                self.dns = None
+            else:
+                pool._network_backend = backend
+        self._session = httpx.Client(headers=headers, follow_redirects=True, transport=transport)
+        self._extensions = {"trace": self._trace}
+
+    def _trace(self, event: str, info: dict):
+        if event == "connection.connect_tcp.complete":
+            self.stats.add(connections=1)
+        elif event == "connection.start_tls.complete":
+            self.stats.add(tls_handshakes=1)
+
+    def fetch(self, url: str, timeout: float, headers: dict | None = None, max_bytes: int = 0) -> FetchedPage:
+        """
+        Streamovaný GET: nejdřív hlavičky (check_headers), pak tělo po blocích
+        s limitem max_bytes. Chybový stav vyhodí výjimku klienta, nestažené
+        tělo BodyRejected; spojení se pak zavře, ne vrací do poolu.
+        """
+        self.stats.add(requests=1)
+        if self.client == "requests":
+            with self._session.get(url, timeout=timeout, headers=headers, stream=True) as resp:
+                return self._read(resp, resp.iter_content(CHUNK_SIZE), max_bytes)
+        with self._session.stream("GET", url, timeout=timeout, headers=headers, extensions=self._extensions) as resp:
+            return self._read(resp, resp.iter_bytes(CHUNK_SIZE), max_bytes)
+
+    def _read(self, resp, chunks, max_bytes: int) -> FetchedPage:
+        if resp.status_code == 304:
+            # Prázdné tělo se dočte, jinak by se spojení zavřelo místo návratu do poolu.
+            for _ in chunks:
+                pass
+            return FetchedPage(304, dict(resp.headers))
+        resp.raise_for_status()
+
+        try:
+            length = check_headers(resp.headers, max_bytes)
+            body = bytearray()
+            for chunk in chunks:
+                body += chunk
+                check_size(len(body), length, max_bytes)
+        except BodyRejected as e:
+            self.stats.record_rejected(e)
+            raise
+
+        self.stats.add(bytes_read=len(body))
+        body = bytes(body)
+        encoding = detect_encoding(body, resp.headers.get("Content-Type"))
+        return FetchedPage(resp.status_code, dict(resp.headers), body, encoding)
+
+    def close(self):
+        self._session.close()
@@ -0,0 +1,75 @@
+# src/webcrawler/link_scanner.py
+# Autor: Martin Šilar
+# Rychlé hledání odkazů regulárním výrazem nad surovým HTML (bez stavby stromu)
+
+import html as html_lib
+import re
+from urllib.parse import urljoin, urlparse
+
+
+# Jeden průchod dokumentem: komentáře, <script> a <style> se přeskočí celé
+# (html.parser jejich obsah také nebere jako značky), zajímají nás jen <a> a <base>.
+_TOKEN_RE = re.compile(
+    r"<!--.*?(?:-->|\Z)"
+    r"|<(script|style)\b[^>]*>.*?(?:</\1\s*>|\Z)"
+    r"|<(a|base)(\s(?:[^>\"']|\"[^\"]*\"|'[^']*')*)?>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Jeden atribut: jméno a volitelná hodnota v uvozovkách, apostrofech nebo bez nich.
+# Hodnoty se konzumují celé, takže "href=" uvnitř jiného atributu nezmate.
+_ATTR_RE = re.compile(
+    r"([^\s\"'>/=]+)(?:\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+)))?"
+)
+
+
+def _href(attrs: str | None) -> str | None:
+    if not attrs:
+        return None
+    for m in _ATTR_RE.finditer(attrs):
+        if m.group(1).lower() != "href":
+            continue
+        value = m.group(2)
+        if value is None:
+            value = m.group(3)
+        if value is None:
+            value = m.group(4) or ""
+        return html_lib.unescape(value) if "&" in value else value
+    return None
+
+
+def scan_links(html: str) -> tuple[str | None, list[str]]:
+    """
+    Najde hodnoty href všech <a> a první <base href> v surovém HTML.
+    Vrací (base_href, hrefs) se stejnou sémantikou jako HtmlDocument.base_href()
+    a HtmlDocument.links(): hodnoty jsou odentitované, neabsolutizované.
+    """
+    base_href = None
+    hrefs = []
+
+    for m in _TOKEN_RE.finditer(html or ""):
+        tag = m.group(2)
+        if tag is None:
+            continue
+
+        value = _href(m.group(3))
+        if value is None:
+            continue
+
+        if tag.lower() == "a":
+            hrefs.append(value)
+        elif base_href is None:
+            base_href = value
+
+    return base_href, hrefs
+
+
+def resolve_links(page_url: str, base_href: str | None, hrefs) -> list[str]:
+    """Absolutizuje hodnoty href vůči stránce (případně jejímu <base href>) a odstraní fragment."""
+    base = urljoin(page_url, base_href) if base_href else page_url
+    out = []
+    for href in hrefs:
+        abs_url = urljoin(base, href)
+        cleaned = urlparse(abs_url)._replace(fragment="").geturl()
+        out.append(cleaned)
+    return out
@@ -0,0 +1,204 @@
+# src/webcrawler/parsers.py
+# Autor: Martin Šilar
+# Volitelné rychlé HTML backendy (lxml / selectolax) a výběr backendu podle configu
+
+from .document import HtmlDocument, HEADING_TAGS, NON_TEXT_TAGS
+
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_etree = None
+    lxml_html = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+
+# Názvy kodeků Pythonu, které libxml2 (iconv) nezná pod stejným jménem.
+LIBXML_ENCODINGS = {"cp1250": "windows-1250", "cp1252": "windows-1252", "iso8859-2": "iso-8859-2"}
+
+
+def _join(strings, separator: str, strip: bool) -> str:
+    """Spojí textové uzly stejně jako BeautifulSoup.get_text()."""
+    if strip:
+        strings = (s.strip() for s in strings)
+        strings = (s for s in strings if s)
+    return separator.join(strings)
+
+
+class LxmlDocument(HtmlDocument):
+    """Backend nad lxml.html (libxml2) – výrazně rychlejší než html.parser."""
+
+    parser_name = "lxml"
+
+    def _parse(self):
+        # Parsujeme bajty, aby nevadila deklarace <?xml encoding=...?> v XHTML;
+        # stažené tělo jde do libxml2 rovnou v původním kódování.
+        if self.body is not None:
+            body, encoding = self.body, self.encoding
+        else:
+            body, encoding = self.html.encode("utf-8"), "utf-8"
+        if not body.strip():
+            return None
+        parser = lxml_html.HTMLParser(encoding=LIBXML_ENCODINGS.get(encoding, encoding))
+        try:
+            return lxml_etree.fromstring(body, parser=parser)
+        except lxml_etree.ParserError:
+            return None
+
+    @staticmethod
+    def _strings(el):
+        """Textové uzly podstromu v pořadí dokumentu (iterativně – hluboké stránky)."""
+        skip = 0
+        for event, node in lxml_etree.iterwalk(el, events=("start", "end", "comment", "pi")):
+            if event == "start":
+                if node.tag in NON_TEXT_TAGS:
+                    skip += 1
+                elif not skip and node.text:
+                    yield node.text
+                continue
+            if event == "end" and node.tag in NON_TEXT_TAGS:
+                skip -= 1
+            if node is not el and not skip and node.tail:
+                yield node.tail
+
+    def _iter(self, tag):
+        root = self.tree
+        return iter(()) if root is None else root.iter(tag)
+
+    def _text(self, separator: str, strip: bool) -> str:
+        if self.tree is None:
+            return ""
+        return _join(self._strings(self.tree), separator, strip)
+
+    def _links(self) -> list[str]:
+        return [a.get("href") for a in self._iter("a") if a.get("href") is not None]
+
+    def base_href(self) -> str | None:
+        for el in self._iter("base"):
+            if el.get("href") is not None:
+                return el.get("href")
+        return None
+
+    def title(self) -> str:
+        for el in self._iter("title"):
+            return "".join(self._strings(el)).strip()
+        return ""
+
+    def meta_content(self, name: str) -> str | None:
+        for el in self._iter("meta"):
+            if el.get("name") == name:
+                return el.get("content", "")
+        return None
+
+    def headings(self) -> list[str]:
+        out = []
+        for h in HEADING_TAGS:
+            for el in self._iter(h):
+                text = _join(self._strings(el), "", True)
+                if text:
+                    out.append(text)
+        return out
+
+
+class SelectolaxDocument(HtmlDocument):
+    """Backend nad selectolax (lexbor, HTML5 parser v C) – nejrychlejší varianta."""
+
+    parser_name = "selectolax"
+
+    def _parse(self):
+        # Bajty lexbor bere jako UTF-8, jiné kódování se nejdřív dekóduje.
+        if self.body is not None and self.encoding == "utf-8":
+            return LexborHTMLParser(self.body)
+        return LexborHTMLParser(self.html)
+
+    @staticmethod
+    def _strings(node):
+        for n in node.traverse(include_text=True):
+            if n.tag == "-text" and n.parent.tag not in NON_TEXT_TAGS:
+                yield n.text_content
+
+    def _text(self, separator: str, strip: bool) -> str:
+        root = self.tree.root
+        if root is None:
+            return ""
+        return _join(self._strings(root), separator, strip)
+
+    def _links(self) -> list[str]:
+        out = []
+        for a in self.tree.css("a[href]"):
+            href = a.attributes.get("href")
+            out.append(href if href is not None else "")
+        return out
+
+    def base_href(self) -> str | None:
+        el = self.tree.css_first("base[href]")
+        if el is None:
+            return None
+        return el.attributes.get("href") or ""
+
+    def title(self) -> str:
+        el = self.tree.css_first("title")
+        return "".join(self._strings(el)).strip() if el is not None else ""
+
+    def meta_content(self, name: str) -> str | None:
+        for el in self.tree.css("meta"):
+            if el.attributes.get("name") == name:
+                return el.attributes.get("content") or ""
+        return None
+
+    def headings(self) -> list[str]:
+        out = []
+        for h in HEADING_TAGS:
+            for el in self.tree.css(h):
+                text = _join(self._strings(el), "", True)
+                if text:
+                    out.append(text)
+        return out
+
+
+PARSERS = {
+    "html.parser": HtmlDocument,
+    "lxml": LxmlDocument,
+    "selectolax": SelectolaxDocument,
+}
+
+# Pořadí, ve kterém se zkouší náhradní backend, když požadovaný není nainstalovaný.
+FALLBACK_ORDER = ("selectolax", "lxml", "html.parser")
+
+
+def is_available(name: str) -> bool:
+    if name == "lxml":
+        return lxml_html is not None
+    if name == "selectolax":
+        return LexborHTMLParser is not None
+    return name == "html.parser"
+
+
+def available_parsers() -> list[str]:
+    return [name for name in PARSERS if is_available(name)]
+
+
+def resolve_parser(name: str) -> str:
+    """
+    Vrátí název použitelného backendu. Pokud požadovaný není nainstalovaný,
+    zkouší se další (pomalejší) backendy podle FALLBACK_ORDER až po html.parser.
+    """
+    name = (name or "html.parser").lower()
+    if name not in PARSERS:
+        raise ValueError(f"Unknown parser: {name}")
+    if is_available(name):
+        return name
+
+    start = FALLBACK_ORDER.index(name)
+    for candidate in FALLBACK_ORDER[start:]:
+        if is_available(candidate):
+            return candidate
+    return "html.parser"
+
+
+def create_document(html: str | bytes, parser: str = "html.parser", encoding: str | None = None) -> HtmlDocument:
+    return PARSERS[resolve_parser(parser)](html, encoding)
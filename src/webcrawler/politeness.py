@@ -0,0 +1,431 @@
+# src/webcrawler/politeness.py
+# Autor: Martin Šilar
+# Plánovač zdvořilosti po hostech – workery dostávají URL jen z hostů, na které už se smí
+
+import asyncio
+import heapq
+import threading
+import time
+from collections import deque
+from queue import Full
+from urllib.parse import urlsplit
+
+
+def url_host(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+class HostFrontier:
+    """
+    Fronta URL rozdělená podle hostů. Každý host má vlastní FIFO, čas, kdy
+    na něj smí jít další požadavek (předchozí start + delay), a počet
+    rozběhnutých požadavků. Hosty, které mají co nabídnout a nejsou na limitu
+    spojení, leží v haldě podle času připravenosti – pop() tak v O(log H)
+    vrátí URL z hostu, který je na řadě, a jinak řekne, za jak dlouho bude.
+
+    Čistá logika bez zámků a bez vlastních hodin (čas se předává jako now),
+    takže jde testovat s falešnými hodinami; zamykání řeší obálky níže.
+
+    Se spill (SpillQueue, nebo cokoli s append / popleft / clear / len)
+    je fronta dvouúrovňová: nad maxsize URL se přijímají na disk a po
+    každém pop() se odtud doplní uvolněné místo – nic se nezahazuje a paměť
+    zůstává omezená. len() počítá obě úrovně.
+
+    Se score (funkce URL → číslo, crawl_order = best_first) není fronta hostu
+    FIFO, ale halda: pop() vrátí nejlépe ohodnocenou URL hostu, který je na
+    řadě (při shodě dřív přijatou). Pořadí mezi hosty dál určuje zdvořilost.
+    Při plné frontě jde na disk nejhůře ohodnocená URL v paměti, pokud je
+    nová lepší – v paměti tak zůstávají nejlepší URL. Z disku se URL vrací
+    v pořadí odložení (jsou to ty nejhorší, pořadí mezi nimi se neřadí).
+    """
+
+    def __init__(self, default_delay: float = 0.0, max_per_host: int = 0, maxsize: int = 0, spill=None,
+                 score=None):
+        self.default_delay = default_delay
+        self.max_per_host = max_per_host
+        self.maxsize = maxsize
+        self.spill = spill if maxsize > 0 else None
+        self.score = score
+        self._url_seq = 0
+        # Best-first se spill: nejhůře ohodnocené URL v paměti (min-halda) a pořadová čísla
+        # URL, které už z paměti odešly, ale v jedné z hald ještě leží (mazání líně).
+        self._evict = score is not None and self.spill is not None
+        self._lowest = []
+        self._gone = set()
+        self._delays = {}
+        self._pending = {}
+        self._next_time = {}
+        self._active = {}
+        self._ready = []
+        self._scheduled = set()
+        self._seq = 0
+        self._count = 0
+
+    def set_delay(self, host: str, seconds: float):
+        self._delays[host.lower()] = seconds
+
+    def delay_for(self, host: str) -> float:
+        """Prodleva hostu – vlastní, jinak nejbližší nadřazené domény, jinak výchozí."""
+        if not self._delays:
+            return self.default_delay
+        delay = self._delays.get(host)
+        if delay is None:
+            delay = self.default_delay
+            parent = host
+            while "." in parent:
+                parent = parent.split(".", 1)[1]
+                if parent in self._delays:
+                    delay = self._delays[parent]
+                    break
+            self._delays[host] = delay
+        return delay
+
+    def __len__(self) -> int:
+        return self._count + (len(self.spill) if self.spill is not None else 0)
+
+    def has_ready(self, now: float) -> bool:
+        return bool(self._ready) and self._ready[0][0] <= now
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= self._count
+
+    def _at_limit(self, host) -> bool:
+        return 0 < self.max_per_host <= self._active.get(host, 0)
+
+    def _schedule(self, host):
+        if host in self._scheduled or host not in self._pending or self._at_limit(host):
+            return
+        self._seq += 1
+        heapq.heappush(self._ready, (self._next_time.get(host, 0.0), self._seq, host))
+        self._scheduled.add(host)
+
+    def push(self, url: str) -> bool:
+        """
+        Zařadí URL; při plné frontě ji odloží na disk (spill), bez něj vrátí
+        False. V best-first na disk místo ní jde hůře ohodnocená URL z paměti.
+        """
+        if self.full():
+            if self.spill is None:
+                return False
+            if self._evict:
+                score = self.score(url)
+                lowest = self._peek_lowest()
+                if lowest is not None and score > lowest[0]:
+                    self.spill.append(self._evict_lowest())
+                    self._push(url, score)
+                    return True
+            self.spill.append(url)
+            return True
+        self._push(url)
+        return True
+
+    def _push(self, url: str, score: float | None = None):
+        host = url_host(url)
+        if self.score is None:
+            self._pending.setdefault(host, deque()).append(url)
+        else:
+            if score is None:
+                score = self.score(url)
+            self._url_seq += 1
+            heapq.heappush(self._pending.setdefault(host, []), (-score, self._url_seq, url))
+            if self._evict:
+                heapq.heappush(self._lowest, (score, -self._url_seq, url))
+        self._count += 1
+        self._schedule(host)
+
+    def _peek_lowest(self):
+        lowest = self._lowest
+        while lowest and -lowest[0][1] in self._gone:
+            self._gone.discard(-heapq.heappop(lowest)[1])
+        return lowest[0] if lowest else None
+
+    def _evict_lowest(self) -> str:
+        """Vyjme z paměti nejhůře ohodnocenou URL (při shodě naposledy přijatou)."""
+        _, neg_seq, url = heapq.heappop(self._lowest)
+        self._gone.add(-neg_seq)
+        self._count -= 1
+        host = url_host(url)
+        self._drop_gone(host)
+        self._compact()
+        return url
+
+    def _drop_gone(self, host):
+        # Na vrcholu haldy hostu musí být URL, která v paměti opravdu je.
+        queue = self._pending.get(host)
+        while queue and queue[0][1] in self._gone:
+            self._gone.discard(heapq.heappop(queue)[1])
+        if queue is not None and not queue:
+            del self._pending[host]
+
+    def _compact(self):
+        # Líně mazané záznamy by haldy nafukovaly – jakmile jich je víc než URL v paměti
+        # (nebo je paměť prázdná), haldy se přestaví.
+        if self._count and len(self._gone) <= self._count + 1024:
+            return
+        self._lowest = []
+        for host, queue in self._pending.items():
+            queue[:] = [entry for entry in queue if entry[1] not in self._gone]
+            heapq.heapify(queue)
+            self._lowest.extend((-score, -seq, url) for score, seq, url in queue)
+        heapq.heapify(self._lowest)
+        self._gone.clear()
+
+    def _refill(self):
+        # Přednost mají URL z disku – nové odkazy jdou za ně, dokud disk nevyprázdní.
+        spill = self.spill
+        while spill and not self.full():
+            self._push(spill.popleft())
+
+    def pop(self, now: float) -> tuple[str | None, float | None]:
+        """
+        Vrátí (url, 0.0), je-li některý host připraven, jinak (None, za kolik
+        sekund bude nejbližší host připraven) – nebo (None, None), když není
+        na co čekat (prázdná fronta nebo všechny hosty na limitu spojení).
+        """
+        # Host, jehož poslední URL odešla na disk, zůstal v haldě připravených navíc.
+        while self._ready and self._ready[0][2] not in self._pending:
+            self._scheduled.discard(heapq.heappop(self._ready)[2])
+        if not self._ready:
+            return None, None
+
+        ready_at, _, host = self._ready[0]
+        if ready_at > now:
+            return None, ready_at - now
+
+        heapq.heappop(self._ready)
+        self._scheduled.discard(host)
+
+        queue = self._pending[host]
+        if self.score is None:
+            url = queue.popleft()
+        else:
+            _, seq, url = heapq.heappop(queue)
+        self._count -= 1
+        if self._evict:
+            self._gone.add(seq)
+            self._drop_gone(host)
+            self._compact()
+        elif not queue:
+            del self._pending[host]
+
+        self._active[host] = self._active.get(host, 0) + 1
+        self._next_time[host] = now + self.delay_for(host)
+        self._schedule(host)
+        self._refill()
+        return url, 0.0
+
+    def release(self, url: str):
+        """Požadavek na hosta URL skončil – uvolní spojení."""
+        host = url_host(url)
+        active = self._active.get(host, 0) - 1
+        if active > 0:
+            self._active[host] = active
+        else:
+            self._active.pop(host, None)
+        self._schedule(host)
+
+    def clear(self) -> int:
+        """Zahodí čekající URL (i na disku), vrátí jejich počet."""
+        dropped = self._count
+        self._pending.clear()
+        self._ready.clear()
+        self._scheduled.clear()
+        self._lowest.clear()
+        self._gone.clear()
+        self._count = 0
+        if self.spill is not None:
+            dropped += len(self.spill)
+            self.spill.clear()
+        return dropped
+
+
+class HostScheduler:
+    """
+    Vláknová obálka HostFrontier s rozhraním fronty, jaké používá WebCrawler:
+    put / put_nowait / get / task_done / join / empty. Worker po dokončení
+    požadavku volá release(url), po úplném zpracování URL (včetně zařazení
+    nalezených odkazů) task_done(). Položky, které nejsou URL (JOB_SENTINEL),
+    jdou mimo plánování i počítání práce a get() je vrací hned.
+
+    get() blokuje, dokud není některý host připraven – čekají tak jen workery,
+    pro které opravdu není práce, ne každý před každým požadavkem.
+    join() čeká, až je každá přijatá URL hotová; počet se zvyšuje už při
+    put(), takže URL mezi get() a zpracováním nikdy nevypadá jako hotová práce.
+    """
+
+    def __init__(self, default_delay=0.0, max_per_host=0, maxsize=0, clock=time.monotonic, spill=None, score=None):
+        self.frontier = HostFrontier(default_delay, max_per_host, maxsize, spill, score)
+        self.clock = clock
+        self.closed = False
+        self._control = deque()
+        self._unfinished = 0
+        # Dvě podmínky nad jedním zámkem (jako queue.Queue) – notify() pro workery
+        # tak nikdy nespotřebuje čekající join() a naopak.
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._all_done = threading.Condition(self._lock)
+
+    def set_delay(self, host: str, seconds: float):
+        with self._cond:
+            self.frontier.set_delay(host, seconds)
+
+    def put(self, item, block=True):
+        with self._cond:
+            if not isinstance(item, str):
+                self._control.append(item)
+                self._cond.notify()
+                return
+            if self.closed:
+                return
+            while not self.frontier.push(item):
+                if not block:
+                    raise Full
+                self._cond.wait()
+                if self.closed:
+                    return
+            self._unfinished += 1
+            self._cond.notify()
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def get(self):
+        with self._cond:
+            while True:
+                if self._control:
+                    return self._control.popleft()
+                url, wait = self.frontier.pop(self.clock())
+                if url is not None:
+                    # Uvolnilo se místo – probudí případný blokovaný put().
+                    self._cond.notify()
+                    return url
+                self._cond.wait(wait)
+
+    def release(self, url: str):
+        with self._cond:
+            self.frontier.release(url)
+            self._cond.notify()
+
+    def task_done(self):
+        """URL převzatá přes get() je zpracovaná."""
+        with self._lock:
+            self._finish(1)
+
+    def _finish(self, count: int):
+        self._unfinished -= count
+        if self._unfinished < 0:
+            raise ValueError("task_done() called too many times")
+        if self._unfinished == 0:
+            self._all_done.notify_all()
+
+    def join(self):
+        """Čeká, až jsou všechny přijaté URL zpracované (nebo zahozené při close())."""
+        with self._lock:
+            while self._unfinished:
+                self._all_done.wait()
+
+    def empty(self) -> bool:
+        with self._cond:
+            return len(self.frontier) == 0
+
+    def qsize(self) -> int:
+        with self._cond:
+            return len(self.frontier)
+
+    def close(self):
+        """Konec crawlu (max_pages, Ctrl+C): čekající URL se zahodí a nové se nepřijímají."""
+        with self._cond:
+            self.closed = True
+            self._finish(self.frontier.clear())
+            self._cond.notify_all()
+
+
+class AsyncHostScheduler:
+    """
+    Obálka HostFrontier pro engine async s rozhraním asyncio.Queue
+    (put / put_nowait / get / task_done / join) a navíc release(url).
+    Stejně jako asyncio.Queue budí při změně jen jednoho čekajícího – při
+    stovkách korutin by probouzení všech stálo víc než samotné stahování.
+    Smí se používat jen z jedné smyčky asyncio.
+    """
+
+    def __init__(self, default_delay=0.0, max_per_host=0, maxsize=0, clock=time.monotonic, spill=None, score=None):
+        self.frontier = HostFrontier(default_delay, max_per_host, maxsize, spill, score)
+        self.clock = clock
+        self.closed = False
+        self._getters = deque()
+        self._putters = deque()
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def set_delay(self, host: str, seconds: float):
+        self.frontier.set_delay(host, seconds)
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        while waiters:
+            fut = waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                return
+
+    @staticmethod
+    async def _sleep(waiters, timeout):
+        fut = asyncio.get_running_loop().create_future()
+        waiters.append(fut)
+        try:
+            await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def put_nowait(self, url: str):
+        if self.closed:
+            return
+        if not self.frontier.push(url):
+            raise asyncio.QueueFull
+        self._unfinished += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    async def put(self, url: str):
+        while True:
+            try:
+                self.put_nowait(url)
+                return
+            except asyncio.QueueFull:
+                await self._sleep(self._putters, None)
+
+    async def get(self) -> str:
+        while True:
+            now = self.clock()
+            url, wait = self.frontier.pop(now)
+            if url is not None:
+                self._wakeup_next(self._putters)
+                if self.frontier.has_ready(now):
+                    self._wakeup_next(self._getters)
+                return url
+            await self._sleep(self._getters, wait)
+
+    def release(self, url: str):
+        self.frontier.release(url)
+        self._wakeup_next(self._getters)
+
+    def task_done(self):
+        self._unfinished -= 1
+        if self._unfinished <= 0:
+            self._finished.set()
+
+    async def join(self):
+        await self._finished.wait()
+
+    def empty(self) -> bool:
+        return len(self.frontier) == 0
+
+    def close(self):
+        self.closed = True
+        dropped = self.frontier.clear()
+        for _ in range(dropped):
+            self.task_done()
+        while self._putters:
+            self._wakeup_next(self._putters)
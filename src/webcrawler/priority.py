@@ -0,0 +1,45 @@
+# src/webcrawler/priority.py
+# Autor: Martin Šilar
+# Skóre URL pro best-first frontier – klíčová slova v adrese a hloubka cesty
+
+from urllib.parse import urlsplit
+
+CRAWL_ORDERS = ("fifo", "best_first")
+
+# Navigace, která spotřebuje rozpočet max_pages a data obvykle nemá:
+# štítky, kategorie, stránkování a archivy výpisů.
+NAVIGATION_PENALTIES = {
+    "stitk": -5.0,
+    "/tag": -5.0,
+    "kategori": -3.0,
+    "categor": -3.0,
+    "page=": -3.0,
+    "strana=": -3.0,
+    "/archiv": -3.0,
+}
+
+
+class UrlScorer:
+    """
+    Skóre URL – vyšší znamená dřív ke stažení. Sečtou se váhy klíčových
+    slov, která se vyskytují v cestě nebo dotazu (podřetězec, malými
+    písmeny), a odečte se depth_weight × počet neprázdných segmentů cesty.
+    Počítá se jen z adresy, takže funguje i pro URL odložené na disk.
+    """
+
+    def __init__(self, keywords: dict[str, float] | None = None, depth_weight: float = 1.0):
+        self.keywords = dict(keywords or {})
+        self.depth_weight = depth_weight
+
+    def __call__(self, url: str) -> float:
+        parts = urlsplit(url)
+        target = (parts.path + "?" + parts.query).lower() if parts.query else parts.path.lower()
+        score = -self.depth_weight * sum(1 for segment in parts.path.split("/") if segment)
+        for keyword, weight in self.keywords.items():
+            if keyword in target:
+                score += weight
+        return score
+
+
+# Bez extraktoru (profil raw) a pro profily bez vlastních klíčových slov: mělké stránky dřív, navigace později.
+DEFAULT_SCORER = UrlScorer(NAVIGATION_PENALTIES)
@@ -0,0 +1,176 @@
+# src/webcrawler/recrawl.py
+# Autor: Martin Šilar
+# Inkrementální recrawl – validátory (ETag / Last-Modified), hash obsahu a uložená extrakce pro podmíněný GET
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from .batch_writer import BatchWriter
+
+# Commit po BATCH_SIZE zápisech nebo nejpozději po FLUSH_INTERVAL sekundách.
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url            TEXT NOT NULL,
+    profile        TEXT NOT NULL,
+    etag           TEXT,
+    last_modified  TEXT,
+    content_hash   TEXT NOT NULL,
+    size           INTEGER NOT NULL,
+    cpu_seconds    REAL NOT NULL,
+    result         TEXT,
+    links          TEXT NOT NULL,
+    PRIMARY KEY (url, profile)
+);
+"""
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """Stránka z minulého běhu: validátory, otisk těla a výsledek jejího zpracování."""
+    etag: str | None
+    last_modified: str | None
+    content_hash: str
+    size: int
+    cpu_seconds: float
+    result: dict | None
+    links: list[str]
+
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def page_fingerprint(html: str | bytes) -> tuple[str, int]:
+    """(hash těla, velikost v bajtech) – z bajtů staženého těla, nebo z textu v UTF-8."""
+    data = html if isinstance(html, bytes) else html.encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(data, digest_size=16).hexdigest(), len(data)
+
+
+class RecrawlCache(BatchWriter):
+    """
+    Úložiště pro inkrementální recrawl (SQLite, WAL). Ke každé stažené URL
+    (zvlášť pro každý profil – výsledek extrakce na profilu závisí) drží
+    ETag, Last-Modified, hash těla, velikost, CPU čas zpracování, výsledek
+    extrakce a nalezené odkazy. Příští běh pošle podmíněný GET a na
+    304 (nebo 200 se stejným hashem) použije uložený výsledek a odkazy místo
+    parsování.
+
+    Čtení jde přes spojení vlastní každému vláknu, zápisy přes frontu do
+    jednoho zapisovacího vlákna, které commituje po dávkách.
+    """
+
+    batch_size = BATCH_SIZE
+    flush_interval = FLUSH_INTERVAL
+
+    def __init__(self, path: Path, profile: str):
+        super().__init__()
+        self.path = Path(path)
+        self.profile = profile
+        self._local = threading.local()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+        self._conn = None
+
+        self.stats_lock = threading.Lock()
+        self.stats = {"conditional": 0, "not_modified": 0, "unchanged": 0, "bytes_saved": 0, "cpu_saved": 0.0}
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def start(self):
+        # Schéma se založí dřív, než se workery začnou ptát.
+        self._connect().close()
+        super().start()
+
+    def close(self):
+        super().close()
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+
+    # --- čtení (z workerů) ---
+
+    def _reader(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def get(self, url: str) -> CachedPage | None:
+        row = self._reader().execute(
+            "SELECT etag, last_modified, content_hash, size, cpu_seconds, result, links "
+            "FROM pages WHERE url = ? AND profile = ?",
+            (url, self.profile),
+        ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, digest, size, cpu_seconds, result, links = row
+        page = CachedPage(
+            etag, last_modified, digest, size, cpu_seconds,
+            json.loads(result) if result else None,
+            json.loads(links),
+        )
+        if page.etag or page.last_modified:
+            with self.stats_lock:
+                self.stats["conditional"] += 1
+        return page
+
+    # --- zápis (z workerů, jen vkládá do fronty) ---
+
+    def put(self, url: str, headers: dict, digest: str, size: int, cpu_seconds: float, result, links):
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        self.ops.put((
+            url,
+            self.profile,
+            headers.get("etag"),
+            headers.get("last-modified"),
+            digest,
+            size,
+            cpu_seconds,
+            json.dumps(result, ensure_ascii=False) if result is not None else None,
+            json.dumps(links, ensure_ascii=False),
+        ))
+
+    def record_reuse(self, kind: str, page: CachedPage):
+        """Stránka se nezpracovávala – 304 ušetří i přenos těla, stejný hash jen CPU."""
+        with self.stats_lock:
+            self.stats[kind] += 1
+            self.stats["cpu_saved"] += page.cpu_seconds
+            if kind == "not_modified":
+                self.stats["bytes_saved"] += page.size
+
+    def summary(self) -> dict:
+        with self.stats_lock:
+            return dict(self.stats)
+
+    # --- zapisovací vlákno ---
+
+    def _writer_open(self):
+        self._conn = self._connect()
+
+    def _write_batch(self, batch):
+        self._conn.executemany("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+        self._conn.commit()
+
+    def _writer_close(self):
+        self._conn.close()
+        self._conn = None
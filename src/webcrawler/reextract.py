@@ -0,0 +1,141 @@
+# src/webcrawler/reextract.py
+# Autor: Martin Šilar
+# Opakovaná extrakce nad uloženým HTML (soubory NNNN_cesta.html nebo archiv) bez nového stahování
+
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from itertools import chain
+from pathlib import Path
+
+from .archive import INDEX_NAME, ArchiveReader
+from .crawler import results_to_save
+from .extraction import ExtractionPool, PageAnalysis, analyze_page
+from .extractor import build_extractor, profile_names
+from .seeds import DomainScope, domain_dir, load_seed_file
+from .sink import SUFFIXES, ResultSink
+
+# Výsledky reextrakce jdou do output_dir/reextract/, aby nepřepsaly výsledky crawlu.
+REEXTRACT_DIR = "reextract"
+
+HTML_NAME_RE = re.compile(r"^\d{4,}_.*\.html$")
+URL_HEADER_RE = re.compile(r"<!-- URL: (.*?) -->\n?")
+
+
+@dataclass
+class ReextractStats:
+    pages: int = 0
+    results: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+
+
+def iter_html_files(output_dir: Path):
+    """
+    Stránky uložené s html_store = files: (adresář, URL, HTML) ze souborů
+    NNNN_cesta.html v output_dir i v podadresářích domén. URL je v úvodním
+    komentáři, který zapisuje WebCrawler._save_page.
+    """
+    output_dir = Path(output_dir)
+    for path in sorted(chain(output_dir.glob("*.html"), output_dir.glob("*/*.html"))):
+        if not HTML_NAME_RE.match(path.name):
+            continue
+        text = path.read_text(encoding="utf-8", errors="replace")
+        m = URL_HEADER_RE.match(text)
+        if m:
+            yield path.parent, m.group(1), text[m.end():]
+
+
+def iter_saved_pages(output_dir: Path, scope: DomainScope | None = None):
+    """
+    Všechny uložené stránky – z archivu (html_store = archive) i ze souborů,
+    každá URL jednou. Stránkám z archivu se adresář přiřadí stejně jako při
+    crawlu (u seznamu seedů, tj. se scope, podadresář domény).
+    """
+    output_dir = Path(output_dir)
+    archive_dir = output_dir / "archive"
+    pages = iter_html_files(output_dir)
+    if (archive_dir / INDEX_NAME).exists():
+        archived = ((domain_dir(output_dir, scope, r.url), r.url, r.body) for r in ArchiveReader(archive_dir))
+        pages = chain(archived, pages)
+
+    seen = set()
+    for directory, url, html in pages:
+        if url in seen:
+            continue
+        seen.add(url)
+        yield directory, url, html
+
+
+def reextract(output_dir: Path, profile: str, parser: str = "html.parser", processes: int = 0,
+              result_format: str = "jsonl", fsync: str = "close", progress=None,
+              seed_file: Path | None = None) -> ReextractStats:
+    """
+    Spustí extraktor profilu nad uloženými stránkami a výsledky průběžně
+    zapisuje do output_dir/reextract/<adresář stránky>/<profil>_data.<formát>
+    (výsledky crawlu zůstanou, předchozí reextrakce se přepíše). profile může
+    vyjmenovat více profilů oddělených čárkou – každá stránka se pak
+    naparsuje jednou pro všechny. seed_file je seznam seedů crawlu – podle
+    něj se stránky z archivu rozdělí do adresářů domén.
+
+    Extrakce běží v processes procesech (0 = počet jader), čtení z disku
+    a zápis výsledků souběžně s ní. progress(stats) se volá po každé
+    zpracované stránce.
+    """
+    profiles = profile_names(profile)
+    if profiles == ["raw"]:
+        raise ValueError("Profil raw nic neextrahuje.")
+    extractor = build_extractor(profile)
+    processes = processes or os.cpu_count() or 1
+
+    output_dir = Path(output_dir)
+    target_dir = output_dir / REEXTRACT_DIR
+    scope = DomainScope(seed.domain for seed in load_seed_file(seed_file)) if seed_file else None
+    stats = ReextractStats()
+    lock = threading.Lock()
+    suffix = SUFFIXES[result_format]
+
+    sink = ResultSink(result_format, fsync)
+    sink.start()
+    if scope is None:
+        for name in profiles:
+            sink.open(target_dir / f"{name}_data{suffix}")
+
+    def handle(directory, url, analysis):
+        with lock:
+            stats.pages += 1
+            if analysis.error:
+                stats.errors += 1
+            else:
+                for name, data in results_to_save(profiles, analysis.extracted):
+                    stats.results += 1
+                    sink.add(target_dir / directory.relative_to(output_dir) / f"{name}_data{suffix}", data)
+            if progress:
+                progress(stats)
+
+    t0 = time.perf_counter()
+    pool = ExtractionPool(processes, extractor, parser, None) if processes > 1 else None
+    try:
+        for directory, url, html in iter_saved_pages(output_dir, scope):
+            if pool is None:
+                handle(directory, url, analyze_page(extractor, url, html, parser, None))
+                continue
+            pool.submit(url, html).add_done_callback(_on_done(handle, directory, url))
+    finally:
+        if pool:
+            pool.shutdown()
+        sink.close()
+    stats.seconds = time.perf_counter() - t0
+    return stats
+
+
+def _on_done(handle, directory, url):
+    def done(future):
+        try:
+            analysis = future.result()
+        except Exception as e:
+            analysis = PageAnalysis(error=f"process pool: {e}")
+        handle(directory, url, analysis)
+    return done
@@ -0,0 +1,85 @@
+# src/webcrawler/seeds.py
+# Autor: Martin Šilar
+# Seznam startovních URL pro crawl více webů najednou a rozsah domén
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+@dataclass(frozen=True)
+class Seed:
+    start_url: str
+    domain: str
+
+
+def seed_domain(url: str) -> str:
+    """Výchozí doména seedu: host startovní URL bez úvodního www. (včetně portu)."""
+    netloc = urlsplit(url).netloc.lower()
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+def load_seed_file(path: Path) -> list[Seed]:
+    """
+    Načte soubor se seedy – na řádku startovní URL a volitelně doména, v níž
+    se smí crawlovat (jinak host URL bez www.). Prázdné řádky a řádky
+    začínající # se přeskočí, opakovaná doména se bere jen poprvé.
+    """
+    seeds = []
+    domains = set()
+
+    with Path(path).open(encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            parts = re.split(r"[\s,;]+", line)
+            start_url = parts[0]
+            if not urlsplit(start_url).netloc:
+                raise ValueError(f"Neplatná URL v seznamu seedů ({path}:{lineno}): {start_url}")
+            domain = parts[1].lower() if len(parts) > 1 else seed_domain(start_url)
+
+            if domain in domains:
+                continue
+            domains.add(domain)
+            seeds.append(Seed(start_url, domain))
+
+    if not seeds:
+        raise ValueError(f"Seznam seedů {path} je prázdný.")
+    return seeds
+
+
+class DomainScope:
+    """
+    Množina povolených domén. match() vrátí doménu, do které URL patří
+    (host je doména sama nebo její subdoména), jinak None. Hledá se po
+    nadřazených doménách hostu, takže cena nezávisí na počtu domén.
+    """
+
+    def __init__(self, domains):
+        self.domains = frozenset(d.lower() for d in domains)
+
+    def match_host(self, host: str) -> str | None:
+        host = host.lower()
+        while host:
+            if host in self.domains:
+                return host
+            dot = host.find(".")
+            if dot < 0:
+                return None
+            host = host[dot + 1:]
+        return None
+
+    def match(self, url: str) -> str | None:
+        return self.match_host(urlsplit(url).netloc)
+
+
+def domain_dir(output_dir: Path, scope: DomainScope | None, url: str) -> Path:
+    """Výstupní adresář stránky – output_dir, u seznamu seedů (scope) podadresář její domény."""
+    output_dir = Path(output_dir)
+    if scope is None:
+        return output_dir
+    domain = scope.match(url) or "_other"
+    return output_dir / domain.replace(":", "_")
@@ -2,32 +2,24 @@
 # Autor: Martin Šilar
 # SEO extractor – získává title, description, keywords a headings
 
-from bs4 import BeautifulSoup
 from .base_extractor import BaseExtractor
 
 
 class SEOExtractor(BaseExtractor):
-    def extract(self, url: str, html: str):
-        soup = BeautifulSoup(html, "html.parser")
+    def extract(self, url: str, doc):
+        doc = self._document(doc)
 
-        title_tag = soup.find("title")
-        title = title_tag.text.strip() if title_tag else ""
+        title = doc.title()
 
-        desc_tag = soup.find("meta", attrs={"name": "description"})
-        meta_description = desc_tag.get("content", "").strip() if desc_tag else ""
+        meta_description = (doc.meta_content("description") or "").strip()
 
-        keywords_tag = soup.find("meta", attrs={"name": "keywords"})
-        if keywords_tag and keywords_tag.get("content"):
-            meta_keywords = [k.strip() for k in keywords_tag["content"].split(",")]
+        keywords = doc.meta_content("keywords")
+        if keywords:
+            meta_keywords = [k.strip() for k in keywords.split(",")]
         else:
             meta_keywords = []
 
-        headings = []
-        for h in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            for tag in soup.find_all(h):
-                text = tag.get_text(strip=True)
-                if text:
-                    headings.append(text)
+        headings = doc.headings()
 
         result = {
             "url": url,
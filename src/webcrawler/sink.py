@@ -0,0 +1,266 @@
+# src/webcrawler/sink.py
+# Autor: Martin Šilar
+# Průběžný zápis výsledků na disk (JSON Lines / CSV / SQLite / Parquet) a převod do původního JSON
+
+import csv
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+from .batch_writer import BatchWriter
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+# json = výsledky v paměti a jeden JSON na konci (původní chování), ostatní se zapisují průběžně.
+RESULT_FORMATS = ("json", "jsonl", "csv", "sqlite", "parquet")
+
+# never = fsync nikdy (data jsou po každé dávce v OS, přežijí pád procesu),
+# close = fsync při uzavření, batch = fsync po každé dávce (přežije i výpadek systému).
+FSYNC_POLICIES = ("never", "close", "batch")
+
+# Zápis po BATCH_SIZE výsledcích nebo nejpozději po FLUSH_INTERVAL sekundách.
+BATCH_SIZE = 200
+FLUSH_INTERVAL = 0.5
+
+SUFFIXES = {"json": ".json", "jsonl": ".jsonl", "csv": ".csv", "sqlite": ".sqlite", "parquet": ".parquet"}
+
+
+def _encode(value) -> str:
+    """Hodnota do buňky CSV/Parquet – řetězce beze změny, seznamy a slovníky jako JSON."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _decode(value):
+    if value and value[0] in "[{":
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _fsync(f):
+    f.flush()
+    os.fsync(f.fileno())
+
+
+class JsonLinesWriter:
+    def __init__(self, path: Path):
+        self.f = path.open("w", encoding="utf-8")
+
+    def write(self, records):
+        self.f.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records))
+
+    def flush(self, fsync: bool):
+        if fsync:
+            _fsync(self.f)
+        else:
+            self.f.flush()
+
+    def close(self, fsync: bool):
+        self.flush(fsync)
+        self.f.close()
+
+
+class CsvWriter:
+    """Sloupce podle klíčů prvního výsledku (profil má pevnou sadu klíčů)."""
+
+    def __init__(self, path: Path):
+        self.f = path.open("w", encoding="utf-8", newline="")
+        self.writer = None
+
+    def write(self, records):
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.f, fieldnames=list(records[0]), extrasaction="ignore")
+            self.writer.writeheader()
+        self.writer.writerows({k: _encode(v) for k, v in r.items()} for r in records)
+
+    def flush(self, fsync: bool):
+        if fsync:
+            _fsync(self.f)
+        else:
+            self.f.flush()
+
+    def close(self, fsync: bool):
+        self.flush(fsync)
+        self.f.close()
+
+
+class SqliteWriter:
+    def __init__(self, path: Path):
+        if path.exists():
+            path.unlink()
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        # fsync řídí ResultSink podle result_fsync, ne SQLite při každém commitu.
+        self.conn.execute("PRAGMA synchronous=OFF")
+        self.conn.execute("CREATE TABLE results (id INTEGER PRIMARY KEY, url TEXT, data TEXT NOT NULL)")
+
+    def write(self, records):
+        self.conn.executemany(
+            "INSERT INTO results(url, data) VALUES (?, ?)",
+            ((r.get("url"), json.dumps(r, ensure_ascii=False)) for r in records),
+        )
+
+    def flush(self, fsync: bool):
+        self.conn.commit()
+        if fsync:
+            with self.path.open("rb") as f:
+                os.fsync(f.fileno())
+
+    def close(self, fsync: bool):
+        self.flush(fsync)
+        self.conn.close()
+
+
+class ParquetWriter:
+    """Každá dávka je jedna row group; sloupce jsou řetězce (seznamy jako JSON)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.writer = None
+        self.schema = None
+
+    def write(self, records):
+        if self.writer is None:
+            self.schema = pa.schema([(name, pa.string()) for name in records[0]])
+            self.writer = pq.ParquetWriter(self.path, self.schema)
+        columns = {name: [_encode(r.get(name)) for r in records] for name in self.schema.names}
+        self.writer.write_table(pa.table(columns, schema=self.schema))
+
+    def flush(self, fsync: bool):
+        # Row group je po write_table() zapsaná; fsync až při zavření (zápatí souboru).
+        pass
+
+    def close(self, fsync: bool):
+        if self.writer is not None:
+            self.writer.close()
+            if fsync:
+                with self.path.open("rb") as f:
+                    os.fsync(f.fileno())
+
+
+WRITERS = {"jsonl": JsonLinesWriter, "csv": CsvWriter, "sqlite": SqliteWriter, "parquet": ParquetWriter}
+
+
+class ResultSink(BatchWriter):
+    """
+    Průběžný zápis výsledků: workery jen vkládají (cesta, výsledek) do fronty,
+    jedno zapisovací vlákno je zapisuje po dávkách – paměť nezávisí na počtu
+    stránek a po pádu zůstane vše až po poslední dávku. Soubory se otevírají
+    při prvním výsledku pro danou cestu (u seznamu seedů jeden na doménu)
+    a nový běh je přepíše.
+    """
+
+    batch_size = BATCH_SIZE
+    flush_interval = FLUSH_INTERVAL
+
+    def __init__(self, fmt: str, fsync: str = "close"):
+        super().__init__()
+        if fmt not in WRITERS:
+            raise ValueError(f"Unknown result_format: {fmt}")
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown result_fsync: {fsync}")
+        if fmt == "parquet" and pq is None:
+            raise ImportError("Formát výsledků 'parquet' vyžaduje balíček pyarrow (pip install pyarrow).")
+        self.format = fmt
+        self.fsync = fsync
+        self.written = 0
+        self._writers = {}
+
+    def open(self, path: Path):
+        """Založí soubor hned, aby existoval i při běhu bez výsledků."""
+        self.ops.put((path, None))
+
+    def add(self, path: Path, record: dict):
+        self.ops.put((path, record))
+
+    @property
+    def paths(self) -> list[Path]:
+        return list(self._writers)
+
+    def _write_batch(self, batch):
+        pending = {}
+        for path, record in batch:
+            records = pending.setdefault(path, [])
+            if record is not None:
+                records.append(record)
+
+        for path, records in pending.items():
+            writer = self._writers.get(path)
+            if writer is None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                writer = self._writers[path] = WRITERS[self.format](path)
+            if not records:
+                continue
+            writer.write(records)
+            writer.flush(self.fsync == "batch")
+            self.written += len(records)
+
+    def _writer_close(self):
+        for writer in self._writers.values():
+            writer.close(self.fsync != "never")
+
+
+def read_results(path: Path):
+    """Postupně čte výsledky ze souboru zapsaného ResultSink (formát podle přípony)."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == ".jsonl":
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    elif suffix == ".csv":
+        with path.open(encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                yield {k: _decode(v) for k, v in row.items()}
+
+    elif suffix == ".sqlite":
+        conn = sqlite3.connect(path)
+        try:
+            for (data,) in conn.execute("SELECT data FROM results ORDER BY id"):
+                yield json.loads(data)
+        finally:
+            conn.close()
+
+    elif suffix == ".parquet":
+        if pq is None:
+            raise ImportError("Čtení Parquet vyžaduje balíček pyarrow (pip install pyarrow).")
+        for batch in pq.ParquetFile(path).iter_batches():
+            for row in batch.to_pylist():
+                yield {k: _decode(v) for k, v in row.items()}
+
+    else:
+        raise ValueError(f"Neznámý formát výsledků: {path}")
+
+
+def compact_to_json(path: Path) -> Path:
+    """
+    Převede soubor výsledků na původní {profil}_data.json vedle něj. Zapisuje
+    po záznamech, takže ani velký výstup se nenačítá celý do paměti.
+    """
+    path = Path(path)
+    output_path = path.with_suffix(".json")
+    with output_path.open("w", encoding="utf-8") as f:
+        f.write("[")
+        empty = True
+        for record in read_results(path):
+            f.write("\n  " if empty else ",\n  ")
+            f.write(json.dumps(record, indent=2, ensure_ascii=False).replace("\n", "\n  "))
+            empty = False
+        f.write("]" if empty else "\n]")
+    return output_path
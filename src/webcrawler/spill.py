@@ -0,0 +1,113 @@
+# src/webcrawler/spill.py
+# Autor: Martin Šilar
+# Přetečení frontieru na disk – FIFO URL v segmentových souborech místo zahazování odkazů
+
+import shutil
+import tempfile
+from pathlib import Path
+
+
+class SpillQueue:
+    """
+    FIFO fronta URL na disku pro odkazy, které se nevejdou do paměťového
+    frontieru (queue_maxsize). URL se připisují po řádcích do segmentů
+    frontier-NNNNN.spill o segment_size řádcích, čtou se od nejstaršího
+    a přečtený segment se smaže – na disku tak leží jen nepřečtené URL
+    a v paměti nic kromě dvou otevřených souborů.
+
+    Bez directory vznikne při prvním přetečení dočasný adresář; jakmile se
+    fronta vyprázdní (nebo clear()), segmenty i dočasný adresář se smažou.
+    Není vláknově bezpečná – používá ji HostFrontier pod zámkem plánovače.
+    """
+
+    def __init__(self, directory: Path | None = None, segment_size: int = 100_000):
+        self.directory = Path(directory) if directory else None
+        self.segment_size = segment_size
+        self.spilled = 0
+        self.refilled = 0
+        self._dir: Path | None = None
+        self._writer = None
+        self._write_segment = 0
+        self._write_lines = 0
+        self._reader = None
+        self._read_segment = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _path(self, segment: int) -> Path:
+        return self._dir / f"frontier-{segment:05d}.spill"
+
+    def append(self, url: str):
+        if self._dir is None:
+            if self.directory:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                self._dir = self.directory
+            else:
+                self._dir = Path(tempfile.mkdtemp(prefix="frontier-"))
+        if self._writer is None or self._write_lines >= self.segment_size:
+            if self._writer is not None:
+                self._writer.close()
+                self._write_segment += 1
+            self._writer = self._path(self._write_segment).open("w", encoding="utf-8")
+            self._write_lines = 0
+
+        # Konec řádku v URL by rozbil segment – v platné URL stejně být nemá.
+        self._writer.write(url.replace("\n", "%0A").replace("\r", "%0D") + "\n")
+        self._write_lines += 1
+        self._count += 1
+        self.spilled += 1
+
+    def popleft(self) -> str:
+        if not self._count:
+            raise IndexError("pop from an empty SpillQueue")
+        if self._read_segment == self._write_segment:
+            # Čte se segment, do kterého se ještě zapisuje.
+            self._writer.flush()
+
+        while True:
+            if self._reader is None:
+                self._reader = self._path(self._read_segment).open("r", encoding="utf-8")
+            line = self._reader.readline()
+            if line:
+                break
+            # Dočtený starší segment – smaže se a pokračuje se dalším.
+            self._reader.close()
+            self._reader = None
+            self._path(self._read_segment).unlink()
+            self._read_segment += 1
+            if self._read_segment == self._write_segment:
+                self._writer.flush()
+
+        self._count -= 1
+        self.refilled += 1
+        if not self._count:
+            self._reset()
+        return line[:-1]
+
+    def clear(self) -> int:
+        """Zahodí uložené URL, vrátí jejich počet."""
+        dropped = self._count
+        self._count = 0
+        self._reset()
+        return dropped
+
+    def _reset(self):
+        for f in (self._reader, self._writer):
+            if f is not None:
+                f.close()
+        self._reader = self._writer = None
+        if self._dir is not None:
+            if self._dir == self.directory:
+                for path in self._dir.glob("frontier-*.spill"):
+                    path.unlink()
+            else:
+                shutil.rmtree(self._dir, ignore_errors=True)
+        self._dir = None
+        self._write_segment = self._read_segment = 0
+        self._write_lines = 0
+
+    def summary(self) -> dict:
+        """Kolik URL přeteklo na disk, kolik se vrátilo do paměti a kolik jich na disku čeká."""
+        return {"spilled": self.spilled, "refilled": self.refilled, "on_disk": self._count}
@@ -0,0 +1,134 @@
+# src/webcrawler/state_store.py
+# Autor: Martin Šilar
+# Perzistentní stav crawlu (frontier + visited + výsledky) v SQLite – umožňuje navázat přerušený běh
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+from .batch_writer import BatchWriter
+
+
+STATUS_QUEUED = 0
+STATUS_DONE = 1
+
+# Zápisy se dávkují: commit po BATCH_SIZE operacích nebo nejpozději po FLUSH_INTERVAL sekundách.
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    url     TEXT PRIMARY KEY,
+    status  INTEGER NOT NULL,
+    seq     INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS urls_status ON urls(status, seq);
+CREATE TABLE IF NOT EXISTS results (
+    url   TEXT PRIMARY KEY,
+    data  TEXT NOT NULL
+);
+"""
+
+
+class CrawlStateStore(BatchWriter):
+    """
+    Frontier a visited uložené v SQLite (WAL). Tabulka urls obsahuje všechny
+    přijaté URL (= visited); ty se stavem STATUS_QUEUED tvoří frontier.
+
+    Zápisy z workerů jdou přes frontu do jednoho zapisovacího vlákna, které je
+    commituje po dávkách – horká cesta crawleru tak jen vkládá do fronty.
+    Operace jedné stránky (nové odkazy, výsledek, označení hotovo) se zapisují
+    v pořadí, takže po pádu je hotová stránka vždy i s odkazy a výsledkem.
+    """
+
+    batch_size = BATCH_SIZE
+    flush_interval = FLUSH_INTERVAL
+
+    def __init__(self, path: Path):
+        super().__init__()
+        self.path = Path(path)
+        self._seq = 0
+        self._seq_lock = threading.Lock()
+        self._conn = None
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def reset(self):
+        for suffix in ("", "-wal", "-shm"):
+            p = Path(str(self.path) + suffix)
+            if p.exists():
+                p.unlink()
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def load(self):
+        """Vrátí (visited, frontier, hotových stránek, výsledky) z uloženého stavu."""
+        conn = self._connect()
+        try:
+            visited = {row[0] for row in conn.execute("SELECT url FROM urls")}
+            frontier = [row[0] for row in conn.execute(
+                "SELECT url FROM urls WHERE status = ? ORDER BY seq", (STATUS_QUEUED,)
+            )]
+            done = conn.execute(
+                "SELECT COUNT(*) FROM urls WHERE status = ?", (STATUS_DONE,)
+            ).fetchone()[0]
+            results = [json.loads(row[0]) for row in conn.execute("SELECT data FROM results ORDER BY rowid")]
+            self._seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM urls").fetchone()[0]
+        finally:
+            conn.close()
+        return visited, frontier, done, results
+
+    # --- operace volané z workerů (jen vkládají do fronty) ---
+
+    def add_urls(self, urls):
+        if not urls:
+            return
+        with self._seq_lock:
+            rows = []
+            for url in urls:
+                self._seq += 1
+                rows.append((url, STATUS_QUEUED, self._seq))
+        self.ops.put(("add", rows))
+
+    def mark_done(self, url: str):
+        self.ops.put(("done", url))
+
+    def add_result(self, url: str, data: dict):
+        self.ops.put(("result", (url, json.dumps(data, ensure_ascii=False))))
+
+    # --- zapisovací vlákno ---
+
+    def _writer_open(self):
+        self._conn = self._connect()
+
+    def _write_batch(self, batch):
+        for op in batch:
+            self._apply(self._conn, op)
+        self._conn.commit()
+
+    def _writer_close(self):
+        self._conn.commit()
+        self._conn.close()
+        self._conn = None
+
+    @staticmethod
+    def _apply(conn, op):
+        kind, payload = op
+        if kind == "add":
+            conn.executemany("INSERT OR IGNORE INTO urls(url, status, seq) VALUES (?, ?, ?)", payload)
+        elif kind == "done":
+            conn.execute(
+                "INSERT INTO urls(url, status, seq) VALUES (?, ?, 0) "
+                "ON CONFLICT(url) DO UPDATE SET status = excluded.status",
+                (payload, STATUS_DONE),
+            )
+        elif kind == "result":
+            conn.execute("INSERT OR REPLACE INTO results(url, data) VALUES (?, ?)", payload)
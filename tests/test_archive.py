@@ -0,0 +1,175 @@
+# tests/test_archive.py
+# Autor: Martin Šilar
+# Testy archivu stažených stránek (WARC segmenty s indexem)
+
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.archive import ArchiveReader, PageArchive, ResponseMeta, zstandard
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.engine import build_crawler
+
+
+def _page(n):
+    return f"<html><body><h1>Stránka {n}</h1>{'<p>Žluťoučký kůň úpěl ďábelské ódy.</p>' * 50}</body></html>"
+
+
+class TestPageArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name) / "archive"
+
+    def _write(self, compression="gzip", segment_size=2**20, pages=50, append=False):
+        archive = PageArchive(self.dir, compression, segment_size, append=append)
+        for n in range(pages):
+            meta = ResponseMeta(200, {"Content-Type": "text/html; charset=utf-8", "Content-Encoding": "gzip"})
+            archive.add(f"https://a.cz/{n}", _page(n), meta)
+        archive.close()
+        return archive
+
+    def test_round_trip_and_random_access(self):
+        compressions = ["gzip"] + (["zstd"] if zstandard is not None else [])
+        for compression in compressions:
+            with self.subTest(compression=compression):
+                self._write(compression)
+                reader = ArchiveReader(self.dir)
+
+                records = list(reader)
+                self.assertEqual(len(records), 50)
+                self.assertEqual([r.url for r in records], [f"https://a.cz/{n}" for n in range(50)])
+                self.assertEqual(records[7].body, _page(7))
+                self.assertEqual(records[7].status, 200)
+                self.assertEqual(records[7].headers, {"Content-Type": "text/html; charset=utf-8"})
+
+                self.assertEqual(reader.get("https://a.cz/42").body, _page(42))
+                self.assertIsNone(reader.get("https://a.cz/neni"))
+
+    def test_original_bytes_are_stored(self):
+        html = _page(3).replace("<html>", '<html><head><meta charset="windows-1250"></head>')
+        raw = html.encode("windows-1250")
+        archive = PageArchive(self.dir)
+        archive.add("https://a.cz/3", raw, ResponseMeta(200, {"Content-Type": "text/html; charset=windows-1250"}))
+        archive.add("https://a.cz/neni", b"nic", ResponseMeta(404, {}))
+        archive.close()
+
+        reader = ArchiveReader(self.dir)
+        record = reader.get("https://a.cz/3")
+        self.assertEqual(record.payload, raw)
+        self.assertEqual(record.body, html)
+        self.assertEqual(reader.get("https://a.cz/neni").status, 404)
+
+        data = gzip.decompress((self.dir / "pages-00000.warc.gz").read_bytes())
+        self.assertIn(b"HTTP/1.1 200 OK\r\n", data)
+        self.assertIn(b"HTTP/1.1 404 Not Found\r\n", data)
+
+    def test_segments_roll_over(self):
+        archive = self._write(segment_size=2000)
+        segments = sorted(self.dir.glob("pages-*.warc.gz"))
+        self.assertGreater(len(segments), 1)
+        self.assertEqual(sum(p.stat().st_size for p in segments), archive.bytes_written)
+        self.assertEqual(len(ArchiveReader(self.dir)), 50)
+
+    def test_segment_is_standard_warc_gz(self):
+        self._write(pages=3)
+        data = gzip.decompress((self.dir / "pages-00000.warc.gz").read_bytes())
+        self.assertEqual(data.count(b"WARC/1.1\r\nWARC-Type: response\r\n"), 3)
+        self.assertIn(b"WARC-Target-URI: https://a.cz/2\r\n", data)
+
+    def test_append_continues_in_new_segment(self):
+        self._write(pages=5)
+        archive = PageArchive(self.dir, append=True)
+        archive.add("https://a.cz/dalsi", _page(99))
+        archive.close()
+
+        reader = ArchiveReader(self.dir)
+        self.assertEqual(len(reader), 6)
+        self.assertEqual(reader.get("https://a.cz/dalsi").body, _page(99))
+        self.assertTrue((self.dir / "pages-00001.warc.gz").exists())
+
+        # Nový běh archiv přepíše.
+        self._write(pages=2)
+        self.assertEqual(len(ArchiveReader(self.dir)), 2)
+
+    def test_torn_index_line_is_skipped(self):
+        self._write(pages=3)
+        with (self.dir / "index.tsv").open("a", encoding="utf-8") as f:
+            f.write("pages-00000.warc.gz\t12")
+        self.assertEqual(len(list(ArchiveReader(self.dir))), 3)
+
+
+class TestCrawlerArchive(unittest.TestCase):
+    def setUp(self):
+        self.site = StubSite(pages=30, fanout=3)
+        self.site.start()
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.site.stop()
+        self.tmp.cleanup()
+
+    def test_crawl_into_archive(self):
+        for engine in ("threads", "async"):
+            with self.subTest(engine=engine):
+                output_dir = Path(self.tmp.name) / engine
+                config = CrawlerConfig(
+                    start_url=self.site.start_url,
+                    allowed_domain=self.site.domain,
+                    max_workers=4,
+                    max_pages=100,
+                    queue_maxsize=1000,
+                    request_timeout=5,
+                    user_agent="TestAgent",
+                    output_dir=output_dir,
+                    log_file=Path(self.tmp.name) / "logs" / "test.log",
+                    profile="raw",
+                    save_html=True,
+                    profiles=["raw"],
+                    engine=engine,
+                    html_store="archive",
+                )
+                build_crawler(config).run()
+
+                self.assertEqual(list(output_dir.glob("*.html")), [])
+                reader = ArchiveReader(output_dir / "archive")
+                self.assertEqual(len(reader), 30)
+                record = reader.get(self.site.base_url + "/page/5")
+                self.assertEqual(record.body, self.site.render(5))
+                self.assertEqual(record.status, 200)
+                self.assertIn("text/html", record.headers.get("Content-Type", ""))
+
+    def test_archive_keeps_page_encoding(self):
+        with StubSite(pages=5, fanout=2, encoding="windows-1250") as site:
+            output_dir = Path(self.tmp.name) / "cp1250"
+            config = CrawlerConfig(
+                start_url=site.start_url,
+                allowed_domain=site.domain,
+                max_workers=2,
+                max_pages=10,
+                queue_maxsize=100,
+                request_timeout=5,
+                user_agent="TestAgent",
+                output_dir=output_dir,
+                log_file=Path(self.tmp.name) / "logs" / "test.log",
+                profile="raw",
+                save_html=True,
+                profiles=["raw"],
+                html_store="archive",
+            )
+            build_crawler(config).run()
+
+            record = ArchiveReader(output_dir / "archive").get(site.base_url + "/page/2")
+            self.assertEqual(record.payload, site.render(2).encode("windows-1250"))
+            self.assertEqual(record.body, site.render(2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# tests/test_async_crawler.py
+# Autor: Martin Šilar
+# Integrační testy enginů threads / async (i s poolem procesů) proti lokálnímu stub serveru
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.engine import build_crawler
+
+
+def _make_config(tmpdir, site, engine, max_pages=100, extract_processes=0):
+    return CrawlerConfig(
+        start_url=site.start_url,
+        allowed_domain=site.domain,
+        max_workers=8,
+        max_pages=max_pages,
+        queue_maxsize=1000,
+        request_timeout=5,
+        user_agent="TestAgent",
+        output_dir=Path(tmpdir) / "data",
+        log_file=Path(tmpdir) / "logs" / "test.log",
+        profile="contacts",
+        save_html=False,
+        profiles=["contacts", "seo", "content"],
+        engine=engine,
+        extract_processes=extract_processes,
+    )
+
+
+class TestEngines(unittest.TestCase):
+    def setUp(self):
+        self.site = StubSite(pages=40, fanout=3)
+        self.site.start()
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.site.stop()
+        self.tmp.cleanup()
+
+    def _crawl(self, engine, max_pages=100, extract_processes=0):
+        crawler = build_crawler(_make_config(self.tmp.name, self.site, engine, max_pages, extract_processes))
+        crawler.set_extractor(ContactsExtractor())
+        crawler.run()
+        return crawler
+
+    def _assert_same_visited(self, crawler, reference):
+        self.assertEqual(len(crawler.visited), len(reference.visited))
+        for n in range(40):
+            url = f"{self.site.base_url}/page/{n}"
+            self.assertIn(url, crawler.visited)
+            self.assertIn(url, reference.visited)
+
+    def test_engines_produce_same_results(self):
+        threaded = self._crawl("threads")
+        asynced = self._crawl("async")
+
+        self.assertEqual(threaded.page_count, 40)
+        self.assertEqual(asynced.page_count, 40)
+        self._assert_same_visited(asynced, threaded)
+        self.assertEqual(
+            sorted(r["url"] for r in threaded.results),
+            sorted(r["url"] for r in asynced.results),
+        )
+
+    def test_process_pool_matches_in_thread_extraction(self):
+        reference = self._crawl("threads")
+        expected = sorted(r["url"] for r in reference.results)
+
+        for engine in ("threads", "async"):
+            with self.subTest(engine=engine):
+                crawler = self._crawl(engine, extract_processes=2)
+                self.assertEqual(crawler.page_count, 40)
+                self._assert_same_visited(crawler, reference)
+                self.assertEqual(sorted(r["url"] for r in crawler.results), expected)
+                self.assertIsNone(crawler.extract_pool)
+
+    def test_async_respects_max_pages(self):
+        crawler = self._crawl("async", max_pages=10)
+        self.assertEqual(crawler.page_count, 10)
+        self.assertFalse(crawler.finished_early)
+
+    def test_unknown_engine(self):
+        config = _make_config(self.tmp.name, self.site, "gevent")
+        with self.assertRaises(ValueError):
+            build_crawler(config)
+
+
+if __name__ == "__main__":
+    unittest.main()
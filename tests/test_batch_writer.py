@@ -0,0 +1,58 @@
+# tests/test_batch_writer.py
+# Autor: Martin Šilar
+# Testy společného zapisovacího vlákna – dávky podle velikosti, intervalu a zápis zbytku při close()
+
+import time
+import unittest
+
+from src.webcrawler.batch_writer import BatchWriter
+
+
+class ListWriter(BatchWriter):
+    batch_size = 3
+    flush_interval = 60.0
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+        self.closed = False
+
+    def _write_batch(self, batch):
+        self.batches.append(list(batch))
+
+    def _writer_close(self):
+        self.closed = True
+
+
+class TestBatchWriter(unittest.TestCase):
+    def test_batches_by_size_and_flushes_rest_on_close(self):
+        writer = ListWriter()
+        writer.start()
+        for i in range(7):
+            writer.ops.put(i)
+        writer.close()
+
+        self.assertEqual(writer.batches, [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertTrue(writer.closed)
+
+    def test_flushes_after_interval(self):
+        writer = ListWriter()
+        writer.flush_interval = 0.05
+        writer.start()
+        try:
+            writer.ops.put("a")
+            deadline = time.monotonic() + 2
+            while not writer.batches and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(writer.batches, [["a"]])
+        finally:
+            writer.close()
+
+    def test_close_without_start(self):
+        writer = ListWriter()
+        writer.close()
+        self.assertEqual(writer.batches, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
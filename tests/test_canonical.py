@@ -0,0 +1,140 @@
+# tests/test_canonical.py
+# Autor: Martin Šilar
+# Testy kanonizace URL a jejího použití při deduplikaci v crawleru
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.webcrawler.canonical import ALL_RULES, UrlCanonicalizer
+from src.webcrawler.config import CrawlerConfig, load_config
+from src.webcrawler.crawler import WebCrawler
+
+
+class TestUrlCanonicalizer(unittest.TestCase):
+    def setUp(self):
+        self.c = UrlCanonicalizer()
+
+    def test_default_rules(self):
+        cases = {
+            "HTTP://Example.COM/a": "http://example.com/a",
+            "https://example.com:443/a": "https://example.com/a",
+            "http://example.com:80/a": "http://example.com/a",
+            "http://example.com:8080/a": "http://example.com:8080/a",
+            "https://example.com": "https://example.com/",
+            "https://example.com/%7Euser/%c3%a1": "https://example.com/~user/%C3%A1",
+            "https://example.com/a/./b/../c": "https://example.com/a/c",
+            "https://example.com/a?b=2&a=1": "https://example.com/a?a=1&b=2",
+            "https://example.com/a?utm_source=x&id=5&fbclid=abc": "https://example.com/a?id=5",
+            "https://example.com/a?utm_source=x": "https://example.com/a",
+            "https://example.com/a#sekce": "https://example.com/a",
+        }
+        for url, expected in cases.items():
+            with self.subTest(url=url):
+                self.assertEqual(self.c.canonicalize(url), expected)
+
+    def test_default_rules_keep_distinct_pages(self):
+        self.assertNotEqual(self.c.canonicalize("https://example.com/a/"), self.c.canonicalize("https://example.com/a"))
+        self.assertNotEqual(self.c.canonicalize("https://example.com/A"), self.c.canonicalize("https://example.com/a"))
+        self.assertNotEqual(self.c.canonicalize("http://example.com/a"), self.c.canonicalize("https://example.com/a"))
+        self.assertEqual(self.c.canonicalize("https://example.com/a?q="), "https://example.com/a?q=")
+
+    def test_query_bytes_are_kept(self):
+        self.assertNotEqual(self.c.canonicalize("https://example.com/?q=%E9"), self.c.canonicalize("https://example.com/?q=%E8"))
+        self.assertEqual(self.c.canonicalize("https://example.com/?q=%e9"), "https://example.com/?q=%E9")
+        self.assertEqual(self.c.canonicalize("https://example.com/a?print"), "https://example.com/a?print")
+        self.assertEqual(self.c.canonicalize("https://example.com/a?x=1&print"), "https://example.com/a?print&x=1")
+        self.assertEqual(self.c.canonicalize("https://example.com/a?a%20b;c=d"), "https://example.com/a?a%20b;c=d")
+
+    def test_repeated_keys_keep_order(self):
+        self.assertEqual(self.c.canonicalize("https://example.com/a?b=1&a=1&a=0"), "https://example.com/a?a=1&a=0&b=1")
+        self.assertNotEqual(self.c.canonicalize("https://example.com/a?a=1&a=0"), self.c.canonicalize("https://example.com/a?a=0&a=1"))
+
+    def test_optional_rules(self):
+        c = UrlCanonicalizer(ALL_RULES)
+        self.assertEqual(c.canonicalize("http://www.Example.com:80/a/"), "https://example.com/a")
+        self.assertEqual(c.canonicalize("https://example.com/"), "https://example.com/")
+
+    def test_rules_can_be_disabled(self):
+        c = UrlCanonicalizer(["default_port"])
+        self.assertEqual(c.canonicalize("https://Example.com:443/b?z=1&a=2"), "https://Example.com/b?z=1&a=2")
+
+    def test_custom_strip_params(self):
+        c = UrlCanonicalizer(strip_params=["ref", "x_*"])
+        self.assertEqual(c.canonicalize("https://example.com/?ref=a&x_y=1&utm_source=z"), "https://example.com/?utm_source=z")
+
+    def test_invalid_url_is_returned_unchanged(self):
+        self.assertEqual(self.c.canonicalize("http://example.com:abc/"), "http://example.com:abc/")
+
+    def test_unknown_rule(self):
+        with self.assertRaises(ValueError):
+            UrlCanonicalizer(["lowercase_path"])
+
+
+class TestCanonicalAdmission(unittest.TestCase):
+    def _crawler(self, **overrides):
+        config = CrawlerConfig(
+            start_url="https://Example.com",
+            allowed_domain="example.com",
+            max_workers=1,
+            max_pages=5,
+            queue_maxsize=100,
+            request_timeout=5,
+            user_agent="TestAgent",
+            output_dir=Path("test_data"),
+            log_file=Path("logs/test.log"),
+            profile="contacts",
+            save_html=False,
+            profiles=["contacts"],
+            **overrides,
+        )
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            return WebCrawler(config)
+
+    LINKS = [
+        "https://example.com/a?b=2&a=1",
+        "https://EXAMPLE.com:443/a?a=1&b=2&utm_source=news",
+        "https://example.com/%61?a=1&b=2",
+        "https://example.com/x/../a?a=1&b=2",
+        "https://example.com/b",
+    ]
+
+    def test_duplicates_collapse_before_dedup(self):
+        crawler = self._crawler()
+        self.assertEqual(crawler._seed_urls(), ["https://example.com/"])
+        self.assertEqual(
+            crawler._admit_links(self.LINKS),
+            ["https://example.com/a?a=1&b=2", "https://example.com/b"],
+        )
+        self.assertEqual(crawler._admit_links(["https://example.com/"]), [])
+
+        summary = crawler.canonical_summary()
+        self.assertEqual(summary["admitted"], 2)
+        self.assertEqual(summary["saved"], 4)
+        self.assertEqual(summary["rewritten"], 4)
+
+    def test_disabled(self):
+        crawler = self._crawler(canonicalize=[])
+        self.assertIsNone(crawler.canonicalizer)
+        self.assertEqual(crawler._admit_links(self.LINKS), [self.LINKS[0], self.LINKS[2], self.LINKS[3], self.LINKS[4]])
+
+    def test_config_keys(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.ini"
+            base = "[crawler]\nstart_url = https://example.com\nallowed_domain = example.com\n"
+
+            path.write_text(base, encoding="utf-8")
+            self.assertIn("strip_params", load_config(path).canonicalize)
+
+            path.write_text(base + "canonicalize =\n", encoding="utf-8")
+            self.assertEqual(load_config(path).canonicalize, [])
+
+            path.write_text(base + "canonicalize = Case, https\ncanonical_strip_params = ref\n", encoding="utf-8")
+            config = load_config(path)
+            self.assertEqual(config.canonicalize, ["case", "https"])
+            self.assertEqual(config.canonical_strip_params, ["ref"])
+
+
+if __name__ == "__main__":
+    unittest.main()
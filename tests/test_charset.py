@@ -0,0 +1,104 @@
+# tests/test_charset.py
+# Autor: Martin Šilar
+# Testy určení kódování stránky a parsování přímo z bajtů
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.charset import SNIFF_BYTES, decode_html, detect_encoding, normalize_encoding, sniff_encoding
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.http_client import HttpClient
+from src.webcrawler.parsers import available_parsers, create_document
+from src.webcrawler.seo_extractor import SEOExtractor
+
+TEXT = "Příliš žluťoučký kůň úpěl ďábelské ódy. Šťastná Žofie."
+PAGE = f"<html><head><title>Kůň</title></head><body><a href='/dál'>{TEXT}</a></body></html>"
+
+
+class TestDetectEncoding(unittest.TestCase):
+    def test_sniff_czech_encodings(self):
+        for encoding in ("utf-8", "cp1250", "iso8859-2"):
+            with self.subTest(encoding=encoding):
+                body = PAGE.encode(encoding)
+                self.assertEqual(detect_encoding(body), encoding)
+                self.assertEqual(decode_html(body, detect_encoding(body)), PAGE)
+
+    def test_header_wins_over_meta(self):
+        body = b'<meta charset="windows-1250"><p>x</p>'
+        self.assertEqual(detect_encoding(body, "text/html; charset=ISO-8859-2"), "iso8859-2")
+        self.assertEqual(detect_encoding(body, "text/html"), "cp1250")
+
+    def test_meta_http_equiv(self):
+        body = b'<meta http-equiv="Content-Type" content="text/html; charset=iso-8859-2">'
+        self.assertEqual(detect_encoding(body), "iso8859-2")
+
+    def test_unknown_declaration_falls_back_to_sniffing(self):
+        body = b'<meta charset="x-neznamy">' + TEXT.encode("utf-8")
+        self.assertEqual(detect_encoding(body, "text/html; charset=bogus"), "utf-8")
+
+    def test_bom(self):
+        body = b"\xef\xbb\xbf<p>x</p>"
+        self.assertEqual(detect_encoding(body, "text/html; charset=windows-1250"), "utf-8")
+        self.assertEqual(decode_html(body, "utf-8"), "<p>x</p>")
+
+    def test_latin1_is_read_as_windows_1252(self):
+        self.assertEqual(normalize_encoding("ISO-8859-1"), "cp1252")
+        self.assertIsNone(normalize_encoding("x-neznamy"))
+
+    def test_sniffing_reads_bounded_prefix(self):
+        # Znak UTF-8 rozpůlený hranicí vzorku není chyba, cp1250 za hranicí se nečte.
+        body = b"a" * (SNIFF_BYTES - 1) + "ž".encode("utf-8") + "ž".encode("cp1250")
+        self.assertEqual(sniff_encoding(body), "utf-8")
+
+
+class TestParseBytes(unittest.TestCase):
+    def test_parsers_accept_bytes(self):
+        for parser in available_parsers():
+            for encoding in ("utf-8", "cp1250", "iso8859-2"):
+                with self.subTest(parser=parser, encoding=encoding):
+                    doc = create_document(PAGE.encode(encoding), parser, encoding)
+                    self.assertEqual(doc.title(), "Kůň")
+                    self.assertEqual(doc.links(), ["/dál"])
+                    self.assertEqual(doc.text(" ", True), f"Kůň {TEXT}")
+                    self.assertEqual(doc.html, PAGE)
+
+
+class TestCrawlEncodings(unittest.TestCase):
+    def test_meta_charset_pages(self):
+        for encoding in ("windows-1250", "iso-8859-2"):
+            with self.subTest(encoding=encoding), tempfile.TemporaryDirectory() as tmp, \
+                    StubSite(pages=20, fanout=3, encoding=encoding) as site:
+                config = CrawlerConfig(
+                    start_url=site.start_url,
+                    allowed_domain=site.domain,
+                    max_workers=4,
+                    max_pages=100,
+                    queue_maxsize=1000,
+                    request_timeout=5,
+                    user_agent="TestAgent",
+                    output_dir=Path(tmp) / "data",
+                    log_file=Path(tmp) / "logs" / "test.log",
+                    profile="seo",
+                    save_html=False,
+                    profiles=["seo"],
+                )
+                with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+                    crawler = WebCrawler(config)
+                crawler.set_extractor(SEOExtractor())
+                crawler.run()
+
+                self.assertEqual(crawler.page_count, 20)
+                titles = sorted(r["title"] for r in crawler.results)
+                self.assertEqual(titles, sorted(f"Stránka {n}" for n in range(20)))
+
+                page = HttpClient("requests", "TestAgent").fetch(site.start_url, 5)
+                self.assertEqual(page.encoding, normalize_encoding(encoding))
+                self.assertEqual(page.text, site.render(0))  # „Domů“ – ů se v latin-1 nedekóduje
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# tests/test_completion.py
+# Autor: Martin Šilar
+# Zátěžový test konce crawlu – stovky malých běhů nesmí skončit dřív, než je stažen celý web
+
+import tempfile
+import time
+import unittest
+from concurrent.futures import Future
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.engine import build_crawler
+from src.webcrawler.extraction import ExtractionPool
+from src.webcrawler.extractor import build_extractor
+
+
+class TestCompletion(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.site = StubSite(pages=6, fanout=2)
+        cls.site.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.site.stop()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _crawl(self, max_pages=100, extract_processes=0, engine="threads"):
+        crawler = build_crawler(CrawlerConfig(
+            start_url=self.site.start_url,
+            allowed_domain=self.site.domain,
+            max_workers=8,
+            max_pages=max_pages,
+            queue_maxsize=1000,
+            request_timeout=5,
+            user_agent="TestAgent",
+            output_dir=Path(self.tmp.name) / "data",
+            log_file=Path(self.tmp.name) / "logs" / "test.log",
+            profile="seo",
+            save_html=False,
+            profiles=["seo"],
+            extract_processes=extract_processes,
+            engine=engine,
+        ))
+        crawler.set_extractor(build_extractor("seo"))
+        hits = self.site.hits
+        crawler.run()
+        return crawler, self.site.hits - hits
+
+    def test_many_tiny_crawls_finish_complete(self):
+        # Každá stránka odkazuje dál až po zpracování – dřívější konec by přišel o zbytek webu.
+        runs = 200
+        t0 = time.perf_counter()
+        for i in range(runs):
+            crawler, hits = self._crawl()
+            self.assertEqual((crawler.page_count, hits, len(crawler.results)), (6, 6, 6), f"běh {i}")
+            self.assertTrue(crawler.finished_early)
+        # Dřívější čekání po 0.2 s by samo stálo runs * 0.2 s.
+        self.assertLess(time.perf_counter() - t0, runs * 0.2)
+
+    def test_crawls_with_process_pool_finish_complete(self):
+        for i in range(3):
+            crawler, hits = self._crawl(extract_processes=2)
+            self.assertEqual((crawler.page_count, hits, len(crawler.results)), (6, 6, 6), f"běh {i}")
+
+    def test_pool_failures_finish_the_page(self):
+        def failed_future(*args):
+            future = Future()
+            future.set_exception(RuntimeError("pool rozbitý"))
+            return future
+
+        def raise_on_submit(*args):
+            raise RuntimeError("pool rozbitý")
+
+        for engine in ("threads", "async"):
+            for submit in (failed_future, raise_on_submit):
+                with self.subTest(engine=engine, submit=submit.__name__), \
+                        patch.object(ExtractionPool, "submit", side_effect=submit), \
+                        patch.object(WebCrawler, "_page_done") as page_done:
+                    crawler, hits = self._crawl(extract_processes=1, engine=engine)
+                    self.assertEqual((crawler.page_count, hits), (1, 1))
+                    page_done.assert_called_once_with(self.site.start_url)
+
+    def test_max_pages_stops_at_once(self):
+        for max_pages in (1, 3, 5):
+            with self.subTest(max_pages=max_pages):
+                crawler, hits = self._crawl(max_pages=max_pages)
+                self.assertEqual((crawler.page_count, hits), (max_pages, max_pages))
+                self.assertTrue(crawler.task_queue.closed)
+                self.assertTrue(crawler.task_queue.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# tests/test_contact_scanner.py
+# Autor: Martin Šilar
+# Testy hledání kontaktů jedním průchodem (contact_scanner) proti textu stránky
+
+import unittest
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.contact_scanner import normalize_phone, scan_contacts, scan_text
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.extraction import analyze_page
+from src.webcrawler.parsers import create_document
+from tests.test_parsers import CORPUS
+
+
+OBFUSCATED = """<p>Pište na obchod [at] firma [dot] cz nebo jan(zavináč)novak.cz,
+podpora&#64;firma.cz, Servis {AT} firma.cz.</p>"""
+
+LINKS = """<a href="mailto:Prodej@Firma.cz?subject=Dotaz">napište</a>
+<a class="btn" href='tel:+420-608-111-222'>volejte</a>
+<a href="mailto:a@firma.cz,%20b@firma.cz">oba</a><a href="mailto:">prázdný</a>
+<a href="tel:12">krátké</a>"""
+
+NOT_CONTACTS = """<!-- komentar@example.com 777 111 222 -->
+<script>var e = "skryty@script.cz"; // 777 123 456</script>
+<style>a[href="x@y.cz"] { color: red }</style>
+<img alt="obrazek@example.com" data-tel="777 222 333"><p>a < b, cena 1 234 Kč, ID 12345678901234</p>"""
+
+SPLIT_PHONES = """<p>Tel.: <span>+420 123</span> <span>456 789</span></p>
+<p>Fax: +42<b>0</b>987654321, mobil <strong>608</strong>&nbsp;111 222 <a href="mailto:a@firma.cz">a</a></p>"""
+
+
+class TestContactScanner(unittest.TestCase):
+    def test_text_contacts(self):
+        emails, phones = scan_contacts(CORPUS["basic"])
+        self.assertEqual(emails, ["info@firma.cz"])
+        self.assertEqual(phones, ["+420777123456"])
+
+        _, phones = scan_contacts(CORPUS["no_head"])
+        self.assertEqual(phones, ["+420777888999"])
+
+    def test_obfuscated_emails(self):
+        emails, _ = scan_contacts(OBFUSCATED)
+        self.assertEqual(emails, ["obchod@firma.cz", "jan@novak.cz", "podpora@firma.cz", "Servis@firma.cz"])
+
+    def test_mailto_and_tel_links(self):
+        emails, phones = scan_contacts(LINKS)
+        self.assertEqual(emails, ["Prodej@Firma.cz", "a@firma.cz", "b@firma.cz"])
+        self.assertEqual(phones, ["+420608111222"])
+
+    def test_ignores_comments_scripts_and_attributes(self):
+        self.assertEqual(scan_contacts(NOT_CONTACTS), ([], []))
+
+    def test_phone_split_by_inline_tags(self):
+        emails, phones = scan_contacts(SPLIT_PHONES)
+        self.assertEqual(phones, ["+420123456789", "+420987654321", "+420608111222"])
+        self.assertEqual(emails, ["a@firma.cz"])
+
+    def test_duplicates_keep_first_occurrence(self):
+        html = "<p>b@x.cz a@x.cz b@x.cz 777 111 222 +420 777 111 222 00420777111222</p>"
+        self.assertEqual(scan_contacts(html), (["b@x.cz", "a@x.cz"], ["+420777111222"]))
+
+    def test_normalize_phone(self):
+        self.assertEqual(normalize_phone("+420 777 123 456"), "+420777123456")
+        self.assertEqual(normalize_phone("00420777123456"), "+420777123456")
+        self.assertEqual(normalize_phone("777-123-456 "), "+420777123456")
+        self.assertEqual(normalize_phone("777&nbsp;123&nbsp;456"), "+420777123456")
+        self.assertIsNone(normalize_phone("+421 777 123 456"))
+        self.assertIsNone(normalize_phone("12345678"))
+
+    def test_html_scan_matches_text_scan(self):
+        # Na stránkách bez zápisů, které vidí jen HTML (mailto:, tel:), dává průchod HTML totéž co text.
+        site = StubSite(pages=30, padding=2000)
+        pages = {f"stub_{n}": site.render(n) for n in range(30)}
+        pages["obfuscated"] = OBFUSCATED
+        pages["not_contacts"] = NOT_CONTACTS
+        pages["split_phones"] = SPLIT_PHONES.replace('<a href="mailto:a@firma.cz">a</a>', "")
+        for name, html in pages.items():
+            with self.subTest(page=name):
+                text = create_document(html, "html.parser").clean_text()
+                self.assertEqual(scan_contacts(html), scan_text(text))
+
+
+class TestContactsExtractorWithoutTree(unittest.TestCase):
+    def test_extract_does_not_parse(self):
+        with patch("src.webcrawler.document.BeautifulSoup") as bs:
+            analysis = analyze_page(ContactsExtractor(), "https://example.com/", LINKS, "html.parser", "fast")
+        bs.assert_not_called()
+        self.assertEqual(analysis.extracted["phones"], ["+420608111222"])
+
+
+if __name__ == "__main__":
+    unittest.main()
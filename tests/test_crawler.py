@@ -9,6 +9,7 @@ from pathlib import Path
 
 from src.webcrawler.crawler import WebCrawler
 from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.extraction import analyze_page
 
 
 def get_config(tmpdir):
@@ -52,7 +53,7 @@ class TestCrawlerInternal(unittest.TestCase):
             <a href="other/page3">C</a>
         </body></html>
         """
-        links = self.crawler._extract_links("https://example.com", html)
+        links = analyze_page(None, "https://example.com", html, self.crawler.parser, "dom").links
         self.assertIn("https://example.com/page1", links)
         self.assertIn("https://example.com/page2", links)
         self.assertIn("https://example.com/other/page3", links)
@@ -91,18 +92,14 @@ class TestCrawlerInternal(unittest.TestCase):
         mock_resp.text = "<a href='/next'></a>"
         mock_get.return_value = mock_resp
 
-        self.crawler.visited = set()
-        with self.crawler.visited_lock:
-            self.crawler.visited.add("https://example.com")
+        self.crawler.visited.add("https://example.com/")
 
         links = ["https://example.com", "https://example.com/next"]
 
-        with self.crawler.visited_lock:
-            for link in links:
-                if link not in self.crawler.visited:
-                    self.crawler.visited.add(link)
+        self.assertEqual(self.crawler._admit_links(links), ["https://example.com/next"])
+        self.assertEqual(self.crawler._admit_links(links), [])
 
-        self.assertIn("https://example.com", self.crawler.visited)
+        self.assertIn("https://example.com/", self.crawler.visited)
         self.assertIn("https://example.com/next", self.crawler.visited)
         self.assertEqual(len(self.crawler.visited), 2)
 
@@ -8,6 +8,7 @@ from unittest.mock import patch
 
 from src.webcrawler.config import CrawlerConfig
 from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.extraction import analyze_page
 
 
 def _make_test_config():
@@ -66,7 +67,7 @@ class TestCrawlerHelpers(unittest.TestCase):
           </body>
         </html>
         """
-        links = self.crawler._extract_links("https://example.com", html)
+        links = analyze_page(None, "https://example.com", html, self.crawler.parser, "dom").links
 
         self.assertIn("https://example.com/page1", links)
         self.assertIn("https://example.com/page2", links)
@@ -0,0 +1,139 @@
+# tests/test_dedup.py
+# Autor: Martin Šilar
+# Testy detekce duplicitních a téměř duplicitních stránek
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.dedup import DuplicateDetector, minhash, page_words, shingles, similarity
+from src.webcrawler.engine import build_crawler
+
+
+def _signature(html):
+    return minhash(shingles(page_words(html)))
+
+
+class TestMinHash(unittest.TestCase):
+    def setUp(self):
+        self.site = StubSite(pages=50, mirrors=True)
+
+    def test_page_words_skip_markup(self):
+        html = "<p>Ahoj&nbsp;<b>SVĚTE</b></p><script>var x = 1;</script><!-- skryto -->"
+        self.assertEqual(page_words(html), ["ahoj", "světe"])
+
+    def test_similarity(self):
+        page = _signature(self.site.render(7))
+        self.assertEqual(similarity(page, _signature(self.site.render(7))), 1.0)
+        self.assertGreaterEqual(similarity(page, _signature(self.site.render(7, print_view=True))), 0.85)
+        self.assertLess(similarity(page, _signature(self.site.render(8))), 0.3)
+
+
+class TestDuplicateDetector(unittest.TestCase):
+    def setUp(self):
+        self.site = StubSite(pages=50, mirrors=True)
+
+    def test_exact(self):
+        d = DuplicateDetector("exact")
+        self.assertIsNone(d.check("/page/1", self.site.render(1)))
+        self.assertEqual(d.check("/copy/1", self.site.render(1)), ("exact", "/page/1"))
+        self.assertIsNone(d.check("/print/1", self.site.render(1, print_view=True)))
+
+    def test_near(self):
+        d = DuplicateDetector("near")
+        for n in range(20):
+            self.assertIsNone(d.check(f"/page/{n}", self.site.render(n)))
+        self.assertEqual(d.check("/print/5", self.site.render(5, print_view=True)), ("near", "/page/5"))
+        self.assertEqual(d.check("/copy/5", self.site.render(5)), ("exact", "/page/5"))
+
+    def test_body_bytes(self):
+        d = DuplicateDetector("near")
+        for n in range(5):
+            self.assertIsNone(d.check(f"/page/{n}", self.site.render(n).encode("utf-8"), "utf-8"))
+        self.assertEqual(d.check("/copy/3", self.site.render(3).encode("utf-8"), "utf-8"), ("exact", "/page/3"))
+        print_view = self.site.render(3, print_view=True).encode("windows-1250")
+        self.assertEqual(d.check("/print/3", print_view, "windows-1250"), ("near", "/page/3"))
+
+        with patch("src.webcrawler.dedup.decode_html") as decode:
+            DuplicateDetector("exact").check("/page/1", self.site.render(1).encode("utf-8"), "utf-8")
+        decode.assert_not_called()
+
+    def test_short_pages_compared_exactly(self):
+        d = DuplicateDetector("near")
+        self.assertIsNone(d.check("/a", "<p>Stránka nenalezena</p>"))
+        self.assertIsNone(d.check("/b", "<p>Stránka nenalezena.</p>"))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            DuplicateDetector("fuzzy")
+
+
+class TestCrawlerDedup(unittest.TestCase):
+    def setUp(self):
+        self.site = StubSite(pages=30, fanout=3, mirrors=True)
+        self.site.start()
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.site.stop()
+        self.tmp.cleanup()
+
+    def _crawl(self, engine, dedup):
+        config = CrawlerConfig(
+            start_url=self.site.start_url,
+            allowed_domain=self.site.domain,
+            max_workers=4,
+            max_pages=1000,
+            queue_maxsize=1000,
+            request_timeout=5,
+            user_agent="TestAgent",
+            output_dir=Path(self.tmp.name) / "data",
+            log_file=Path(self.tmp.name) / "logs" / "test.log",
+            profile="contacts",
+            save_html=True,
+            profiles=["contacts"],
+            engine=engine,
+            dedup=dedup,
+        )
+        crawler = build_crawler(config)
+        crawler.set_extractor(ContactsExtractor())
+        crawler.run()
+        return crawler
+
+    def test_duplicates_skip_extraction_and_saving(self):
+        for engine in ("threads", "async"):
+            with self.subTest(engine=engine):
+                crawler = self._crawl(engine, "near")
+                self.assertEqual(crawler.page_count, 90)
+                self.assertEqual(crawler.timed_pages, 30)
+                self.assertEqual(len(crawler.results), 3)
+                self.assertEqual(len(list(crawler.config.output_dir.glob("*.html"))), 30)
+
+                summary = crawler.dedup_summary()
+                self.assertEqual((summary["checked"], summary["exact"], summary["near"]), (90, 30, 30))
+                self.assertAlmostEqual(summary["rate"], 60 / 90)
+
+                for f in crawler.config.output_dir.glob("*.html"):
+                    f.unlink()
+
+    def test_off(self):
+        crawler = self._crawl("threads", "off")
+        self.assertIsNone(crawler.duplicates)
+        self.assertEqual(crawler.timed_pages, 90)
+        self.assertEqual(len(crawler.results), 9)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            self._crawl("threads", "fuzzy")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+# tests/test_distributed.py
+# Autor: Martin Šilar
+# Testy distribuovaného crawlu – koordinátor a workery v samostatných procesech
+
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.distributed import Coordinator, DistributedCrawler, connect_coordinator, host_partition, serve_coordinator
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+def _config(tmp, **overrides):
+    values = dict(
+        start_url="http://a.cz/",
+        allowed_domain="a.cz",
+        max_workers=2,
+        max_pages=1000,
+        queue_maxsize=1000,
+        request_timeout=5,
+        user_agent="TestAgent",
+        output_dir=Path(tmp) / "data",
+        log_file=Path(tmp) / "logs" / "test.log",
+        profile="contacts",
+        save_html=False,
+        profiles=["contacts"],
+        coordinator_authkey="test-klic",
+    )
+    values.update(overrides)
+    return CrawlerConfig(**values)
+
+
+class TestCoordinator(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.clock = FakeClock()
+        patcher = patch("src.webcrawler.distributed.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_hosts_are_partitioned_between_workers(self):
+        coordinator = Coordinator(_config(self.tmp.name))
+        a = coordinator.register()
+        b = coordinator.register()
+        hosts = [f"h{i}.cz" for i in range(20)]
+        links = [f"http://{h}/{n}" for h in hosts for n in range(3)]
+
+        batch_a, _ = coordinator.sync(a, links=links, want=100)
+        batch_b, _ = coordinator.sync(b, want=100)
+
+        self.assertEqual(len(batch_a) + len(batch_b), len(links) + 1)
+        self.assertTrue(batch_a and batch_b)
+        hosts_a = {url.split("/")[2] for url in batch_a}
+        hosts_b = {url.split("/")[2] for url in batch_b}
+        self.assertFalse(hosts_a & hosts_b)
+        for url in batch_b:
+            self.assertEqual(host_partition(url, 2), 1)
+
+    def test_duplicates_across_workers(self):
+        coordinator = Coordinator(_config(self.tmp.name))
+        a = coordinator.register()
+        b = coordinator.register()
+
+        coordinator.sync(a, links=["http://a.cz/1", "http://a.cz/2"])
+        coordinator.sync(b, links=["http://a.cz/2", "http://a.cz/1", "http://a.cz/"])
+
+        self.assertEqual(coordinator.stats()["duplicates_dropped"], 3)
+        self.assertEqual(coordinator.stats()["queued"], 3)
+
+    def test_expired_lease_is_requeued(self):
+        coordinator = Coordinator(_config(self.tmp.name, lease_timeout=10))
+        a = coordinator.register()
+        batch, finished = coordinator.sync(a, want=5)
+        self.assertEqual(batch, ["http://a.cz/"])
+        self.assertFalse(finished)
+
+        # Worker a zmizel, b převezme jeho hosty i propadlou výpůjčku.
+        self.clock.now = 11.0
+        b = coordinator.register()
+        batch, finished = coordinator.sync(b, want=5)
+        self.assertEqual(batch, ["http://a.cz/"])
+        self.assertEqual(coordinator.stats()["requeued"], 1)
+        self.assertEqual(coordinator.stats()["workers"], 1)
+
+        _, finished = coordinator.sync(b, done=batch, results=[{"url": "http://a.cz/"}])
+        self.assertTrue(finished)
+        self.assertEqual(coordinator.stats()["pages"], 1)
+
+    def test_results_per_profile(self):
+        coordinator = Coordinator(_config(self.tmp.name, profile="contacts, seo"))
+        a = coordinator.register()
+        batch, _ = coordinator.sync(a, want=5)
+        coordinator.sync(a, done=batch, results=[
+            ("contacts", {"url": "http://a.cz/", "emails": ["x@a.cz"]}),
+            ("seo", {"url": "http://a.cz/", "title": "A"}),
+        ])
+
+        output = coordinator.save_results()
+        self.assertEqual(output, Path(self.tmp.name) / "data")
+        self.assertEqual(json.loads((output / "contacts_data.json").read_text("utf-8"))[0]["emails"], ["x@a.cz"])
+        self.assertEqual(json.loads((output / "seo_data.json").read_text("utf-8"))[0]["title"], "A")
+
+    def test_authkey_is_required(self):
+        coordinator = Coordinator(_config(self.tmp.name, coordinator_authkey=""))
+        with self.assertRaises(ValueError):
+            serve_coordinator(coordinator, "127.0.0.1:0", "")
+        with self.assertRaises(ValueError):
+            connect_coordinator("127.0.0.1:1", "")
+
+    def test_max_pages(self):
+        coordinator = Coordinator(_config(self.tmp.name, max_pages=2))
+        a = coordinator.register()
+        batch, _ = coordinator.sync(a, want=5)
+        batch, _ = coordinator.sync(a, links=[f"http://a.cz/{i}" for i in range(5)], done=batch, want=5)
+        self.assertEqual(len(batch), 1)
+        _, finished = coordinator.sync(a, done=batch, want=5)
+        self.assertTrue(finished)
+
+
+class LostCoordinator:
+    """Koordinátor, se kterým se spojení přeruší hned při první synchronizaci."""
+
+    def register(self):
+        return 1
+
+    def sync(self, *args):
+        raise EOFError("spojení s koordinátorem přerušeno")
+
+
+class TestLostCoordinator(unittest.TestCase):
+    def test_workers_stop_when_sync_fails(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.object(DistributedCrawler, "_load_robots_txt", return_value=([], 0)):
+                crawler = DistributedCrawler(_config(tmp), coordinator=LostCoordinator())
+            threads = threading.active_count()
+            with self.assertRaises(EOFError):
+                crawler.run()
+            self.assertEqual(threading.active_count(), threads)
+            self.assertTrue(crawler.task_queue.closed)
+
+
+class TestDistributedCrawl(unittest.TestCase):
+    def setUp(self):
+        self.sites = [StubSite(pages=30, fanout=3, latency=0.01) for _ in range(4)]
+        for site in self.sites:
+            site.start()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        for site in self.sites:
+            site.stop()
+        self.tmp.cleanup()
+
+    def test_workers_in_separate_processes(self):
+        tmp = Path(self.tmp.name)
+        seed_file = tmp / "seeds.txt"
+        seed_file.write_text("\n".join(site.start_url for site in self.sites), encoding="utf-8")
+
+        config = _config(tmp, seed_file=seed_file, coordinator="127.0.0.1:0", lease_timeout=30)
+        coordinator = Coordinator(config)
+        server = serve_coordinator(coordinator, config.coordinator, config.coordinator_authkey)
+        self.addCleanup(server.stop_event.set)
+        host, port = server.address
+
+        ini = tmp / "worker.ini"
+        ini.write_text(
+            "[crawler]\n"
+            f"seed_file = {seed_file}\n"
+            "max_workers = 2\n"
+            "max_pages = 1000\n"
+            "request_timeout = 5\n"
+            "user_agent = TestAgent\n"
+            f"output_dir = {tmp / 'worker'}\n"
+            f"log_file = {tmp / 'logs' / 'worker.log'}\n"
+            "state_file =\n"
+            "profile = contacts\n"
+            f"coordinator = {host}:{port}\n"
+            f"coordinator_authkey = {config.coordinator_authkey}\n",
+            encoding="utf-8",
+        )
+
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-m", "src.main", str(ini), "--worker"],
+                cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            )
+            for _ in range(3)
+        ]
+        for proc in workers:
+            _, err = proc.communicate(timeout=60)
+            self.assertEqual(proc.returncode, 0, err.decode("utf-8", "replace"))
+
+        self.assertTrue(coordinator.finished.is_set())
+        stats = coordinator.stats()
+        self.assertEqual(stats["registered"], 3)
+        self.assertEqual(stats["pages"], 4 * 30)
+        self.assertEqual(stats["leased"], 0)
+
+        # Každá stránka se stáhla právě jednou, přestože ji hledaly tři procesy.
+        for site in self.sites:
+            pages = {path: n for path, n in site.path_hits.items() if path.startswith("/page/")}
+            self.assertEqual(len(pages), 30)
+            self.assertEqual(set(pages.values()), {1})
+
+        output = coordinator.save_results()
+        for site in self.sites:
+            data = json.loads((output / site.domain.replace(":", "_") / "contacts_data.json").read_text("utf-8"))
+            self.assertEqual(len(data), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# tests/test_document.py
+# Autor: Martin Šilar
+# Unit testy sdíleného HtmlDocument (jedno parsování na stránku)
+
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.webcrawler import document
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.document import HtmlDocument
+from src.webcrawler.extraction import analyze_page
+from src.webcrawler.seo_extractor import SEOExtractor
+
+
+HTML = """
+<html>
+  <head>
+    <title> Titulek </title>
+    <meta name="description" content="Popis">
+    <meta name="keywords" content="a, b">
+  </head>
+  <body>
+    <h2>Druhý</h2>
+    <h1>První</h1>
+    <p>Kontakt: info@test.cz</p>
+    <a href="/a">A</a>
+    <a name="kotva">bez href</a>
+    <a href="https://example.com/b#x">B</a>
+  </body>
+</html>
+"""
+
+
+class TestHtmlDocument(unittest.TestCase):
+    def test_queries(self):
+        doc = HtmlDocument(HTML)
+        self.assertEqual(doc.title(), "Titulek")
+        self.assertEqual(doc.meta_content("description"), "Popis")
+        self.assertIsNone(doc.meta_content("robots"))
+        self.assertEqual(doc.headings(), ["První", "Druhý"])
+        self.assertEqual(doc.links(), ["/a", "https://example.com/b#x"])
+        self.assertIn("info@test.cz", doc.clean_text())
+
+    def test_page_is_parsed_once_for_links_and_extractors(self):
+        config = CrawlerConfig(
+            start_url="https://example.com",
+            allowed_domain="example.com",
+            max_workers=1,
+            max_pages=5,
+            queue_maxsize=100,
+            request_timeout=5,
+            user_agent="TestAgent",
+            output_dir=Path("test_data"),
+            log_file=Path("logs/test.log"),
+            profile="contacts",
+            save_html=False,
+            profiles=["contacts", "seo", "content"],
+        )
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(config)
+        crawler.set_extractor(ContactsExtractor())
+
+        with patch.object(document, "BeautifulSoup", wraps=document.BeautifulSoup) as bs:
+            links = crawler._process_page(1, 1, "https://example.com", HTML)
+
+        self.assertEqual(bs.call_count, 1)
+        self.assertIn("https://example.com/a", links)
+        self.assertEqual(crawler.results[0]["emails"], ["info@test.cz"])
+        self.assertEqual(crawler.timed_pages, 1)
+
+    def test_parse_is_not_counted_in_link_time(self):
+        # Extraktor bez stromu – DOM pro odkazy se staví až po extrakci, ale mimo měření odkazů.
+        soup = document.BeautifulSoup
+
+        def slow_soup(*args, **kwargs):
+            time.sleep(0.05)
+            return soup(*args, **kwargs)
+
+        with patch.object(document, "BeautifulSoup", side_effect=slow_soup) as bs:
+            analysis = analyze_page(ContactsExtractor(), "https://example.com", HTML, "html.parser", "dom")
+
+        self.assertEqual(bs.call_count, 1)
+        self.assertIn("https://example.com/a", analysis.links)
+        self.assertGreaterEqual(analysis.parse_seconds, 0.05)
+        self.assertLess(analysis.links_seconds, 0.05)
+
+    def test_extractors_accept_plain_html(self):
+        result = SEOExtractor().extract("https://example.com", HTML)
+        self.assertEqual(result["title"], "Titulek")
+        self.assertEqual(result["meta_keywords"], ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,8 @@ import unittest
 from src.webcrawler.contacts_extractor import ContactsExtractor
 from src.webcrawler.seo_extractor import SEOExtractor
 from src.webcrawler.content_extractor import ContentExtractor
+from src.webcrawler.composite_extractor import CompositeExtractor
+from src.webcrawler.extractor import build_extractor, profile_names
 
 
 class TestContactsExtractor(unittest.TestCase):
@@ -91,5 +93,31 @@ class TestContentExtractor(unittest.TestCase):
         self.assertNotIn("<p>", text)
 
 
+class TestCompositeExtractor(unittest.TestCase):
+    HTML = "<html><head><title>Kontakty</title></head><body><p>Pište na info@test.cz</p></body></html>"
+
+    def test_runs_every_profile_over_one_document(self):
+        ext = build_extractor("contacts, seo, content")
+        self.assertIsInstance(ext, CompositeExtractor)
+        self.assertEqual(ext.profiles, ["contacts", "seo", "content"])
+
+        result = ext.extract("http://test.com", self.HTML)
+        self.assertEqual(result["contacts"]["emails"], ["info@test.cz"])
+        self.assertEqual(result["seo"]["title"], "Kontakty")
+        self.assertIn("info@test.cz", result["content"]["text"])
+
+    def test_profiles_without_result_are_left_out(self):
+        ext = build_extractor("contacts, seo")
+        self.assertEqual(list(ext.extract("http://test.com", self.HTML)), ["contacts", "seo"])
+        self.assertEqual(list(ext.extract("http://test.com", "<title>Bez kontaktů</title>")), ["seo"])
+        self.assertIsNone(ext.extract("http://test.com", "<p>Nic</p>"))
+
+    def test_profile_names(self):
+        self.assertEqual(profile_names("Contacts, seo,contacts"), ["contacts", "seo"])
+        self.assertEqual(profile_names("raw"), ["raw"])
+        with self.assertRaises(ValueError):
+            build_extractor("contacts, raw")
+
+
 if __name__ == "__main__":
     unittest.main()
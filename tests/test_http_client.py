@@ -0,0 +1,247 @@
+# tests/test_http_client.py
+# Autor: Martin Šilar
+# Testy sdíleného HTTP klienta – pool spojení, keep-alive, DNS cache, streamované stahování a metriky
+
+import os
+import shutil
+import socket
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.async_crawler import AsyncWebCrawler
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.http_client import BodyRejected, ConnectionStats, DnsCache, HttpClient, check_headers, httpx
+
+
+@unittest.skipIf(shutil.which("openssl") is None, "chybí openssl pro certifikát testovacího serveru")
+class TestSharedPoolTls(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.site = StubSite(pages=40, fanout=3, tls=True)
+        cls.site.start()
+        env = {"REQUESTS_CA_BUNDLE": str(cls.site.cafile), "SSL_CERT_FILE": str(cls.site.cafile)}
+        cls.env = patch.dict(os.environ, env)
+        cls.env.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.env.stop()
+        cls.site.stop()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _crawl(self, **overrides):
+        values = dict(
+            start_url=self.site.start_url,
+            allowed_domain=self.site.domain,
+            max_workers=4,
+            max_pages=100,
+            queue_maxsize=1000,
+            request_timeout=5,
+            user_agent="TestAgent",
+            output_dir=Path(self.tmp.name) / "data",
+            log_file=Path(self.tmp.name) / "logs" / "test.log",
+            profile="raw",
+            save_html=False,
+            profiles=["raw"],
+        )
+        values.update(overrides)
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(CrawlerConfig(**values))
+        handshakes = self.site.handshakes
+        crawler.run()
+        return crawler, self.site.handshakes - handshakes
+
+    def test_shared_pool_reuses_connections(self):
+        clients = ["requests"] + (["httpx"] if httpx is not None else [])
+        for client in clients:
+            with self.subTest(client=client):
+                crawler, handshakes = self._crawl(http_client=client)
+                stats = crawler.connection_summary()
+
+                self.assertEqual(crawler.page_count, 40)
+                self.assertEqual(stats["requests"], 40)
+                self.assertEqual(stats["tls_handshakes"], handshakes)
+                self.assertLessEqual(stats["connections"], 4)
+                self.assertGreater(stats["reuse_rate"], 0.85)
+                self.assertLessEqual(stats["handshakes_per_page"], 0.1)
+
+    def test_without_keepalive_every_request_connects(self):
+        crawler, handshakes = self._crawl(http_keepalive=False)
+        stats = crawler.connection_summary()
+
+        self.assertEqual(stats["connections"], 40)
+        self.assertEqual(handshakes, 40)
+        self.assertEqual(stats["handshakes_per_page"], 1.0)
+
+
+class TestStreamingFetch(unittest.TestCase):
+    PDF_SIZE = 200_000
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _crawl(self, site, engine="threads"):
+        config = CrawlerConfig(
+            start_url=site.start_url,
+            allowed_domain=site.domain,
+            max_workers=4,
+            max_pages=200,
+            queue_maxsize=1000,
+            request_timeout=5,
+            user_agent="TestAgent",
+            output_dir=Path(self.tmp.name) / "data",
+            log_file=Path(self.tmp.name) / "logs" / "test.log",
+            profile="raw",
+            save_html=False,
+            profiles=["raw"],
+            engine=engine,
+            max_body_bytes=50_000,
+        )
+        cls = AsyncWebCrawler if engine == "async" else WebCrawler
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = cls(config)
+        crawler.run()
+        return crawler.connection_summary()
+
+    def test_non_html_and_oversized_bodies_are_skipped(self):
+        # Stránka 4 je přes limit, její podstránky 13–15 se tak vůbec nenajdou.
+        for engine in ("threads", "async"):
+            for send_length in (True, False):
+                with self.subTest(engine=engine, send_length=send_length), StubSite(
+                    pages=30, fanout=3, attachments=self.PDF_SIZE, oversized={4}, send_length=send_length,
+                ) as site:
+                    oversized = len(site.render(4).encode("utf-8"))
+                    stats = self._crawl(site, engine)
+
+                    self.assertEqual(stats["skipped_content_type"], 26)
+                    self.assertEqual(stats["skipped_too_large"], 1)
+                    self.assertLess(stats["bytes_read"], 26 * 5000)
+                    if send_length:
+                        self.assertEqual(stats["bytes_avoided"], 26 * self.PDF_SIZE + oversized)
+                    else:
+                        self.assertEqual(stats["bytes_avoided"], 0)
+
+    def test_check_headers(self):
+        self.assertEqual(check_headers({"Content-Type": "text/html; charset=utf-8", "Content-Length": "10"}, 100), 10)
+        self.assertIsNone(check_headers({}, 100))
+        with self.assertRaises(BodyRejected) as ctx:
+            check_headers({"Content-Type": "image/png", "Content-Length": "500"}, 0)
+        self.assertEqual((ctx.exception.reason, ctx.exception.avoided), ("content_type", 500))
+        with self.assertRaises(BodyRejected) as ctx:
+            check_headers({"Content-Type": "application/xhtml+xml", "Content-Length": "500"}, 100)
+        self.assertEqual(ctx.exception.reason, "too_large")
+
+
+class TestNotModified(unittest.TestCase):
+    def test_304_keeps_connection_in_pool(self):
+        clients = ["requests"] + (["httpx"] if httpx is not None else [])
+        for client in clients:
+            with self.subTest(client=client), StubSite(pages=5, validators=True) as site:
+                http = HttpClient(client, "TestAgent")
+                url = site.base_url + "/page/1"
+                headers = http.fetch(url, timeout=5).headers
+                etag = next(value for name, value in headers.items() if name.lower() == "etag")
+                for _ in range(5):
+                    self.assertEqual(http.fetch(url, timeout=5, headers={"If-None-Match": etag}).status_code, 304)
+                http.close()
+
+                stats = http.stats.summary()
+                self.assertEqual(site.not_modified, 5)
+                self.assertEqual(stats["requests"], 6)
+                self.assertEqual(stats["connections"], 1)
+
+
+class TestDnsCache(unittest.TestCase):
+    def test_cached_until_ttl(self):
+        stats = ConnectionStats()
+        cache = DnsCache(60, stats)
+        answer = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 80))]
+        with patch("socket.getaddrinfo", return_value=answer) as resolve:
+            for _ in range(3):
+                self.assertEqual(cache.getaddrinfo("priklad.cz", 80, 0, socket.SOCK_STREAM), answer)
+            self.assertEqual(cache.resolve("jiny.cz", 80), ["10.0.0.1"])
+
+        self.assertEqual(resolve.call_count, 2)
+        self.assertEqual(stats.summary()["dns_lookups"], 2)
+        self.assertEqual(stats.summary()["dns_cached"], 2)
+
+    def test_expired_entry_is_resolved_again(self):
+        cache = DnsCache(0)
+        with patch("socket.getaddrinfo", return_value=[]) as resolve:
+            cache.getaddrinfo("priklad.cz", 80)
+            cache.getaddrinfo("priklad.cz", 80)
+            with self.assertRaises(socket.gaierror):
+                cache.resolve("priklad.cz", 80)
+        self.assertEqual(resolve.call_count, 3)
+
+    def test_clients_resolve_through_their_own_cache(self):
+        # Bez keep-alive otevírá každý požadavek nové spojení – host se přeloží jednou, pak z cache.
+        getaddrinfo = socket.getaddrinfo
+        clients = ["requests"] + (["httpx"] if httpx is not None else [])
+        with StubSite(pages=5) as site:
+            for client in clients:
+                with self.subTest(client=client):
+                    caches = [DnsCache(60, ConnectionStats()) for _ in range(2)]
+                    https = [HttpClient(client, "TestAgent", keepalive=False, dns=cache) for cache in caches]
+                    for http in https:
+                        for n in range(4):
+                            self.assertEqual(http.fetch(f"{site.base_url}/page/{n}", timeout=5).status_code, 200)
+                        self.assertIs(socket.getaddrinfo, getaddrinfo)
+                    for http in https:
+                        http.close()
+
+                    for cache in caches:
+                        summary = cache.stats.summary()
+                        self.assertEqual(summary["dns_lookups"], 1)
+                        self.assertEqual(summary["dns_cached"], 3)
+        self.assertIs(socket.getaddrinfo, getaddrinfo)
+
+    def test_cache_disabled_without_private_hooks(self):
+        # Verze urllib3 / httpcore bez použitých neveřejných atributů – klient jede přes resolver systému.
+        hooks = {
+            "requests": patch("src.webcrawler.http_client._urllib3_dns_hook", return_value=False),
+            "httpx": patch("src.webcrawler.http_client._cached_dns_backend", return_value=None),
+        }
+        clients = ["requests"] + (["httpx"] if httpx is not None else [])
+        with StubSite(pages=5) as site:
+            for client in clients:
+                with self.subTest(client=client), hooks[client]:
+                    cache = DnsCache(60, ConnectionStats())
+                    http = HttpClient(client, "TestAgent", keepalive=False, dns=cache)
+                    self.assertIsNone(http.dns)
+                    self.assertEqual(http.fetch(f"{site.base_url}/page/0", timeout=5).status_code, 200)
+                    http.close()
+                    self.assertEqual(cache.stats.summary()["dns_lookups"], 0)
+
+    def test_resolution_error_without_name_resolution_error(self):
+        # urllib3 < 2 nemá NameResolutionError – selhání překladu je pak obecná chyba spojení.
+        with patch("src.webcrawler.http_client.NameResolutionError", None), \
+                patch("socket.getaddrinfo", side_effect=socket.gaierror("neznámý host")):
+            http = HttpClient("requests", "TestAgent", dns=DnsCache(60))
+            with self.assertRaises(requests.ConnectionError):
+                http.fetch("http://neexistuje.invalid/", timeout=5)
+            http.close()
+
+
+class TestHttpClientOptions(unittest.TestCase):
+    def test_http2_requires_httpx(self):
+        with self.assertRaises(ValueError):
+            HttpClient("requests", "TestAgent", http2=True)
+
+    def test_unknown_client(self):
+        with self.assertRaises(ValueError):
+            HttpClient("curl", "TestAgent")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+# tests/test_link_scanner.py
+# Autor: Martin Šilar
+# Testy rychlého hledání odkazů (link_extraction = fast) proti cestě přes BeautifulSoup
+
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.extraction import analyze_page
+from src.webcrawler.link_scanner import scan_links
+from tests.test_parsers import CORPUS
+
+
+TRICKY = {
+    "quoting": """<a href="/dvojite">1</a><a href='/jednoduche'>2</a><a href=/bez-uvozovek>3</a>
+<A HREF="/VELKA">4</A><a
+   class="x"
+   href = "/na-vice-radcich" >5</a>""",
+    "entities": """<a href="/hledat?q=a&amp;page=2">1</a><a href="&#47;cesta&#x2F;x">2</a>
+<a href=/x?a=1&amp;b=2>3</a><a href="/p&aacute;n">4</a>""",
+    "base": """<html><head><base href="https://cdn.example.com/sekce/"><base href="/druhy/"></head>
+<body><a href="clanek">1</a><a href="/koren">2</a><a href="#kotva">3</a></body></html>""",
+    "relative_base": """<base href="podadresar/"><a href="a.html">a</a>""",
+    "not_links": """<!-- <a href="/v-komentari">x</a> -->
+<script>document.write('<a href="/ve-skriptu">x</a>');</script>
+<style>a[href="/ve-stylu"] { color: red }</style>
+<abbr href="/abbr">x</abbr><area href="/area"><link href="/style.css">
+<a data-href="/data" title="href=/v-titulku">bez href</a><a name="kotva"></a>""",
+    "attr_values": """<a title="a > b" href="/gt-v-atributu">1</a><a href="" >prazdny</a>
+<a onclick="x='y'" href='/po-apostrofech'>2</a><a href>bez hodnoty</a>""",
+}
+
+
+def _make_crawler():
+    config = CrawlerConfig(
+        start_url="https://example.com",
+        allowed_domain="example.com",
+        max_workers=1,
+        max_pages=5,
+        queue_maxsize=100,
+        request_timeout=5,
+        user_agent="TestAgent",
+        output_dir=Path("test_data"),
+        log_file=Path("logs/test.log"),
+        profile="contacts",
+        save_html=False,
+        profiles=["contacts", "seo", "content"],
+        link_extraction="fast",
+    )
+    with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+        return WebCrawler(config)
+
+
+class TestLinkScanner(unittest.TestCase):
+    def setUp(self):
+        self.crawler = _make_crawler()
+
+    def test_matches_beautifulsoup_path(self):
+        pages = dict(CORPUS)
+        pages.update(TRICKY)
+        site = StubSite(pages=5, fanout=4)
+        pages.update({f"stub_{n}": site.render(n) for n in range(5)})
+
+        for name, html in pages.items():
+            with self.subTest(page=name):
+                url = "https://example.com/adresar/stranka.html"
+                self.assertEqual(
+                    analyze_page(None, url, html, "html.parser", "fast").links,
+                    analyze_page(None, url, html, "html.parser", "dom").links,
+                )
+
+    def test_base_href_and_entities(self):
+        base, hrefs = scan_links(TRICKY["base"] + TRICKY["entities"])
+        self.assertEqual(base, "https://cdn.example.com/sekce/")
+        self.assertIn("/hledat?q=a&page=2", hrefs)
+        self.assertIn("/cesta/x", hrefs)
+
+        links = analyze_page(None, "https://example.com/", TRICKY["base"], "html.parser", "fast").links
+        self.assertEqual(links, [
+            "https://cdn.example.com/sekce/clanek",
+            "https://cdn.example.com/koren",
+            "https://cdn.example.com/sekce/",
+        ])
+
+    def test_ignores_comments_scripts_and_other_tags(self):
+        _, hrefs = scan_links(TRICKY["not_links"])
+        self.assertEqual(hrefs, [])
+
+    def test_fast_mode_without_extractor_does_not_parse(self):
+        html = TRICKY["quoting"]
+        with patch("src.webcrawler.document.BeautifulSoup") as bs:
+            links = self.crawler._process_page(1, 1, "https://example.com/", html)
+        bs.assert_not_called()
+        self.assertIn("https://example.com/na-vice-radcich", links)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# tests/test_parsers.py
+# Autor: Martin Šilar
+# Paritní testy HTML backendů – lxml a selectolax musí dávat stejné výsledky jako html.parser
+
+import re
+import unittest
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler import parsers
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.content_extractor import ContentExtractor
+from src.webcrawler.parsers import create_document, resolve_parser
+from src.webcrawler.seo_extractor import SEOExtractor
+
+
+CORPUS = {
+    "basic": """<!DOCTYPE html>
+<html lang="cs">
+<head>
+  <meta charset="utf-8">
+  <title>  Kontakty &amp; informace </title>
+  <meta name="description" content="Popis &quot;firmy&quot;">
+  <meta name="keywords" content="firma, kontakt, Praha">
+  <style>body { color: red; }</style>
+  <script>var email = "skryty@script.cz";</script>
+</head>
+<body>
+  <!-- komentar@example.com -->
+  <h1>Vítejte <b>u nás</b></h1>
+  <h3>Třetí úroveň</h3>
+  <h2>  Druhá  </h2>
+  <h2></h2>
+  <p>Pište na <a href="mailto:info@firma.cz">info@firma.cz</a>,
+     volejte +420&nbsp;777&nbsp;123&nbsp;456 nebo 00420 602 111 222.</p>
+  <ul>
+    <li><a href="/o-nas">O nás</a></li>
+    <li><a href="kontakt.html?x=1&amp;y=2">Kontakt</a></li>
+    <li><a href="https://example.com/blog#top">Blog</a></li>
+    <li><a name="kotva">Bez odkazu</a></li>
+    <li><a href="">Prázdný</a></li>
+  </ul>
+  <div><p>Odstavec <i>s</i> <span>vnořenými</span> tagy.</p></div>
+</body>
+</html>""",
+    "no_head": """<html><base href="/sekce/"><body><p>Jen text bez hlavičky, tel. 777 888 999.</p>
+<a href='relativni/stranka'>rel</a></body></html>""",
+    "xhtml": """<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml"><head><title>XHTML</title>
+<meta name="description" content="Starý web" /></head>
+<body><h1>Nadpis</h1><p>mail: stary@web.cz</p><a href="/a">a</a></body></html>""",
+    "no_meta_content": """<html><head><title>T</title><meta name="description"></head>
+<body><h4>Čtvrtý</h4><template><p>sablona@example.com</p></template></body></html>""",
+    "empty": "",
+}
+
+
+def _corpus():
+    site = StubSite(pages=12, fanout=3, padding=500)
+    pages = {f"stub_{n}": site.render(n) for n in range(12)}
+    pages.update(CORPUS)
+    return pages
+
+
+def _snapshot(html, parser):
+    doc = create_document(html, parser)
+    return {
+        "links": doc.links(),
+        "base_href": doc.base_href(),
+        "title": doc.title(),
+        "description": doc.meta_content("description"),
+        "keywords": doc.meta_content("keywords"),
+        "headings": doc.headings(),
+        "clean_text": doc.clean_text(),
+        "text_lines": doc.text("\n", strip=True),
+    }
+
+
+def _extracted(html, parser):
+    url = "https://example.com/x"
+    out = {}
+    for name, cls in (("contacts", ContactsExtractor), ("seo", SEOExtractor), ("content", ContentExtractor)):
+        result = cls().extract(url, create_document(html, parser))
+        if result and name == "contacts":
+            result = {k: sorted(v) if isinstance(v, list) else v for k, v in result.items()}
+        out[name] = result
+    return out
+
+
+class ParityMixin:
+    parser = None
+
+    def setUp(self):
+        if not parsers.is_available(self.parser):
+            self.skipTest(f"{self.parser} není nainstalovaný")
+
+    def test_document_queries_match_html_parser(self):
+        for name, html in _corpus().items():
+            with self.subTest(page=name):
+                self.assertEqual(_snapshot(html, self.parser), _snapshot(html, "html.parser"))
+
+    def test_extractors_match_html_parser(self):
+        for name, html in _corpus().items():
+            with self.subTest(page=name):
+                self.assertEqual(_extracted(html, self.parser), _extracted(html, "html.parser"))
+
+    def test_script_and_comments_are_not_text(self):
+        text = create_document(CORPUS["basic"], self.parser).clean_text()
+        self.assertNotIn("skryty@script.cz", text)
+        self.assertNotIn("komentar@example.com", text)
+        self.assertNotIn("color: red", text)
+        self.assertTrue(re.search(r"Vítejte u nás", text))
+
+
+class TestLxmlParity(ParityMixin, unittest.TestCase):
+    parser = "lxml"
+
+
+class TestSelectolaxParity(ParityMixin, unittest.TestCase):
+    parser = "selectolax"
+
+
+class TestParserResolution(unittest.TestCase):
+    def test_unknown_parser(self):
+        with self.assertRaises(ValueError):
+            resolve_parser("html5lib")
+
+    def test_fallback_when_backend_missing(self):
+        with patch.object(parsers, "LexborHTMLParser", None):
+            self.assertEqual(resolve_parser("selectolax"), "lxml" if parsers.is_available("lxml") else "html.parser")
+            with patch.object(parsers, "lxml_html", None):
+                self.assertEqual(resolve_parser("selectolax"), "html.parser")
+                self.assertEqual(resolve_parser("lxml"), "html.parser")
+                self.assertEqual(create_document("<p>x</p>", "lxml").parser_name, "html.parser")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,253 @@
+# tests/test_politeness.py
+# Autor: Martin Šilar
+# Testy plánovače zdvořilosti po hostech (s falešnými hodinami) a jeho použití v crawleru
+
+import heapq
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.crawler import JOB_SENTINEL, WebCrawler
+from src.webcrawler.engine import build_crawler
+from src.webcrawler.politeness import HostFrontier, HostScheduler, url_host
+
+
+def simulate(frontier, workers, duration):
+    """
+    Diskrétní simulace s falešnými hodinami: workery berou URL z frontieru,
+    požadavek trvá duration sekund, poté se uvolní spojení. Vrací seznam
+    (start, url), dobu nečinnosti workerů v době, kdy ve frontě ještě něco
+    bylo, a nejvyšší počet souběžných požadavků na jeden host.
+    """
+    events = [(0.0, 0, w) for w in range(workers)]  # (čas, priorita, worker); uvolnění spojení má přednost
+    heapq.heapify(events)
+    running = {}
+    active_per_host = {}
+    peak = 0
+    starts = []
+    idle = 0.0
+
+    while events:
+        now, kind, who = heapq.heappop(events)
+        if kind == -1:
+            url = running.pop(who)
+            frontier.release(url)
+            active_per_host[url_host(url)] -= 1
+            continue
+
+        url, wait = frontier.pop(now)
+        if url is None:
+            if wait is None:
+                if running:
+                    # Vše na limitu spojení – worker počká na nejbližší uvolnění.
+                    heapq.heappush(events, (min(t for t, k, _ in events if k == -1), 1, who))
+                continue
+            idle += wait
+            heapq.heappush(events, (now + wait, 1, who))
+            continue
+
+        starts.append((now, url))
+        host = url_host(url)
+        active_per_host[host] = active_per_host.get(host, 0) + 1
+        peak = max(peak, active_per_host[host])
+        running[who] = url
+        heapq.heappush(events, (now + duration, -1, who))
+        heapq.heappush(events, (now + duration, 1, who))
+
+    return starts, idle, peak
+
+
+def _fill(frontier, hosts, per_host):
+    for i in range(per_host):
+        for h in hosts:
+            frontier.push(f"https://{h}/page/{i}")
+
+
+class TestHostFrontier(unittest.TestCase):
+    def test_rate_per_host_is_respected(self):
+        frontier = HostFrontier(default_delay=1.0)
+        _fill(frontier, ["a.cz", "b.cz"], 5)
+
+        starts, _, _ = simulate(frontier, workers=5, duration=0.1)
+
+        self.assertEqual(len(starts), 10)
+        for host in ("a.cz", "b.cz"):
+            times = [t for t, url in starts if url_host(url) == host]
+            gaps = [b - a for a, b in zip(times, times[1:])]
+            self.assertTrue(all(g >= 1.0 - 1e-9 for g in gaps), gaps)
+        # Oba hosty běží souběžně: 5 požadavků po 1 s, ne 10.
+        self.assertAlmostEqual(max(t for t, _ in starts), 4.0)
+
+    def test_workers_do_not_idle_while_some_host_is_ready(self):
+        frontier = HostFrontier(default_delay=1.0)
+        _fill(frontier, ["a.cz", "b.cz", "c.cz", "d.cz"], 3)
+
+        starts, idle, _ = simulate(frontier, workers=1, duration=0.25)
+
+        self.assertEqual(len(starts), 12)
+        self.assertEqual(idle, 0.0)
+        self.assertAlmostEqual(max(t for t, _ in starts), 11 * 0.25)
+
+    def test_max_connections_per_host(self):
+        frontier = HostFrontier(max_per_host=2)
+        _fill(frontier, ["a.cz"], 10)
+
+        starts, _, peak = simulate(frontier, workers=5, duration=0.5)
+
+        self.assertEqual(len(starts), 10)
+        self.assertEqual(peak, 2)
+        self.assertAlmostEqual(max(t for t, _ in starts), 2.0)
+
+    def test_per_host_delay_override(self):
+        frontier = HostFrontier(default_delay=0.0)
+        frontier.set_delay("slow.cz", 2.0)
+        _fill(frontier, ["slow.cz", "fast.cz"], 3)
+
+        starts, _, _ = simulate(frontier, workers=2, duration=0.1)
+        slow = [t for t, url in starts if url_host(url) == "slow.cz"]
+        self.assertEqual(slow, [0.0, 2.0, 4.0])
+
+    def test_maxsize_and_clear(self):
+        frontier = HostFrontier(maxsize=2)
+        self.assertTrue(frontier.push("https://a.cz/1"))
+        self.assertTrue(frontier.push("https://b.cz/1"))
+        self.assertFalse(frontier.push("https://a.cz/2"))
+        self.assertEqual(len(frontier), 2)
+        self.assertEqual(frontier.clear(), 2)
+        self.assertEqual(frontier.pop(0.0), (None, None))
+
+
+class TestHostScheduler(unittest.TestCase):
+    def test_threads_respect_delay(self):
+        scheduler = HostScheduler(default_delay=0.05)
+        for i in range(5):
+            scheduler.put(f"https://a.cz/{i}")
+
+        starts = []
+        lock = threading.Lock()
+
+        def worker():
+            while True:
+                url = scheduler.get()
+                if url is JOB_SENTINEL:
+                    return
+                with lock:
+                    starts.append(time.monotonic())
+                scheduler.release(url)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        while not scheduler.empty():
+            time.sleep(0.01)
+        for _ in threads:
+            scheduler.put(JOB_SENTINEL)
+        for t in threads:
+            t.join(timeout=5)
+
+        starts.sort()
+        self.assertEqual(len(starts), 5)
+        self.assertTrue(all(b - a >= 0.045 for a, b in zip(starts, starts[1:])))
+
+    def test_close_drops_pending(self):
+        scheduler = HostScheduler(default_delay=10)
+        scheduler.put("https://a.cz/1")
+        scheduler.put("https://a.cz/2")
+        self.assertEqual(scheduler.get(), "https://a.cz/1")
+        scheduler.close()
+        self.assertTrue(scheduler.empty())
+        scheduler.put("https://a.cz/3")
+        self.assertTrue(scheduler.empty())
+        scheduler.put(JOB_SENTINEL)
+        self.assertIs(scheduler.get(), JOB_SENTINEL)
+
+    def test_join_waits_for_task_done(self):
+        scheduler = HostScheduler()
+        scheduler.put("https://a.cz/1")
+        joined = threading.Event()
+        threading.Thread(target=lambda: (scheduler.join(), joined.set()), daemon=True).start()
+
+        url = scheduler.get()
+        scheduler.release(url)
+        self.assertFalse(joined.wait(0.05))
+
+        # Odkaz zařazený před task_done() drží práci otevřenou.
+        scheduler.put("https://a.cz/2")
+        scheduler.task_done()
+        self.assertFalse(joined.wait(0.05))
+
+        scheduler.get()
+        scheduler.task_done()
+        self.assertTrue(joined.wait(1))
+        self.assertRaises(ValueError, scheduler.task_done)
+
+    def test_close_finishes_dropped_urls(self):
+        scheduler = HostScheduler()
+        for i in range(3):
+            scheduler.put(f"https://a.cz/{i}")
+        self.assertEqual(scheduler.get(), "https://a.cz/0")
+        scheduler.close()
+        scheduler.put("https://a.cz/3")
+        scheduler.task_done()
+        scheduler.join()
+        self.assertTrue(scheduler.empty())
+
+
+class TestCrawlerPoliteness(unittest.TestCase):
+    def setUp(self):
+        self.site = StubSite(pages=20, fanout=3, latency=0.02)
+        self.site.start()
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.site.stop()
+        self.tmp.cleanup()
+
+    def _config(self, engine, max_pages=100, **overrides):
+        return CrawlerConfig(
+            start_url=self.site.start_url,
+            allowed_domain=self.site.domain,
+            max_workers=8,
+            max_pages=max_pages,
+            queue_maxsize=1000,
+            request_timeout=5,
+            user_agent="TestAgent",
+            output_dir=Path(self.tmp.name) / "data",
+            log_file=Path(self.tmp.name) / "logs" / "test.log",
+            profile="raw",
+            save_html=False,
+            profiles=["raw"],
+            engine=engine,
+            **overrides,
+        )
+
+    def test_max_connections_per_host(self):
+        for engine in ("threads", "async"):
+            with self.subTest(engine=engine):
+                self.site.peak_inflight = 0
+                crawler = build_crawler(self._config(engine, max_connections_per_host=2))
+                crawler.run()
+                self.assertEqual(crawler.page_count, 20)
+                self.assertLessEqual(self.site.peak_inflight, 2)
+
+    def test_robots_crawl_delay_paces_host(self):
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0.03)):
+            crawler = build_crawler(self._config("threads", max_pages=6))
+        self.assertEqual(crawler.task_queue.frontier.delay_for(self.site.domain), 0.03)
+
+        t0 = time.monotonic()
+        crawler.run()
+        self.assertEqual(crawler.page_count, 6)
+        self.assertGreaterEqual(time.monotonic() - t0, 5 * 0.03)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# tests/test_priority.py
+# Autor: Martin Šilar
+# Testy best-first frontieru – skóre URL podle profilu, pořadí v HostFrontier a crawl s omezeným max_pages
+
+import tempfile
+import unittest
+from collections import deque
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.composite_extractor import CompositeExtractor
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.content_extractor import ContentExtractor
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.politeness import HostFrontier
+from src.webcrawler.priority import DEFAULT_SCORER, UrlScorer
+from src.webcrawler.seo_extractor import SEOExtractor
+
+
+class TestUrlScorer(unittest.TestCase):
+    def test_keywords_and_depth(self):
+        scorer = UrlScorer({"kontakt": 10, "/tag": -5}, depth_weight=1)
+        self.assertEqual(scorer("https://a.cz/"), 0)
+        self.assertEqual(scorer("https://a.cz/Kontakty"), 9)
+        self.assertEqual(scorer("https://a.cz/tag/x/y"), -8)
+        self.assertEqual(scorer("https://a.cz/x?tag=1"), -1)
+
+    def test_profiles_prefer_their_pages(self):
+        contacts = ContactsExtractor()
+        self.assertGreater(contacts.score_url("https://a.cz/firma/kontakt"), contacts.score_url("https://a.cz/produkty"))
+        self.assertLess(contacts.score_url("https://a.cz/stitky/akce"), contacts.score_url("https://a.cz/produkty"))
+
+        content = ContentExtractor()
+        self.assertGreater(content.score_url("https://a.cz/blog/clanek-1"), content.score_url("https://a.cz/kategorie/x"))
+
+        self.assertEqual(SEOExtractor().score_url("https://a.cz/a/b"), DEFAULT_SCORER("https://a.cz/a/b"))
+
+        composite = CompositeExtractor({"seo": SEOExtractor(), "contacts": contacts})
+        self.assertEqual(composite.score_url("https://a.cz/kontakt"), contacts.score_url("https://a.cz/kontakt"))
+
+
+class TestBestFirstFrontier(unittest.TestCase):
+    def _drain(self, frontier):
+        out = []
+        while len(frontier):
+            url, _ = frontier.pop(0.0)
+            out.append(url)
+            frontier.release(url)
+        return out
+
+    def test_highest_score_first_fifo_on_ties(self):
+        scores = {"https://a.cz/1": 0, "https://a.cz/2": 5, "https://a.cz/3": 0, "https://a.cz/4": 5}
+        frontier = HostFrontier(score=scores.get)
+        for url in scores:
+            frontier.push(url)
+        self.assertEqual(
+            self._drain(frontier),
+            ["https://a.cz/2", "https://a.cz/4", "https://a.cz/1", "https://a.cz/3"],
+        )
+
+    def test_lowest_scored_urls_are_spilled(self):
+        frontier = HostFrontier(maxsize=2, spill=deque(), score=lambda url: int(url.rsplit("/", 1)[1]))
+        for i in (1, 2, 9, 3):
+            frontier.push(f"https://a.cz/{i}")
+        self.assertEqual(list(frontier.spill), ["https://a.cz/1", "https://a.cz/2"])
+        self.assertEqual(self._drain(frontier), [f"https://a.cz/{i}" for i in (9, 3, 2, 1)])
+
+    def test_memory_keeps_best_urls(self):
+        scores = [(n * 7919) % 3001 for n in range(3000)]
+        urls = [f"https://{'ab'[n % 2]}.cz/{n}" for n in range(3000)]
+        by_url = dict(zip(urls, scores))
+        frontier = HostFrontier(maxsize=20, spill=deque(), score=by_url.get)
+        for url in urls:
+            frontier.push(url)
+        self.assertEqual(len(frontier), 3000)
+
+        drained = self._drain(frontier)
+        self.assertEqual(sorted(drained), sorted(urls))
+        self.assertEqual(sorted(by_url[url] for url in drained[:20]), sorted(scores)[-20:])
+        self.assertEqual(len(frontier._lowest) + len(frontier._gone), 0)
+
+
+class TestBestFirstCrawl(unittest.TestCase):
+    def test_best_first_finds_more_contacts(self):
+        with StubSite(pages=300, fanout=4, taxonomy=6) as site, tempfile.TemporaryDirectory() as tmp:
+            found = {}
+            for order in ("fifo", "best_first"):
+                config = CrawlerConfig(
+                    start_url=site.start_url,
+                    allowed_domain=site.domain,
+                    max_workers=2,
+                    max_pages=40,
+                    queue_maxsize=1000,
+                    request_timeout=5,
+                    user_agent="TestAgent",
+                    output_dir=Path(tmp) / order,
+                    log_file=Path(tmp) / "logs" / "test.log",
+                    profile="contacts",
+                    save_html=False,
+                    profiles=["contacts"],
+                    crawl_order=order,
+                )
+                with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+                    crawler = WebCrawler(config)
+                crawler.set_extractor(ContactsExtractor())
+                crawler.run()
+                self.assertEqual(crawler.page_count, 40)
+                found[order] = len(crawler.results)
+
+            self.assertGreaterEqual(found["best_first"], 3 * max(1, found["fifo"]))
+
+    def test_unknown_crawl_order(self):
+        config = CrawlerConfig(
+            start_url="https://example.com", allowed_domain="example.com", max_workers=1, max_pages=5,
+            queue_maxsize=100, request_timeout=5, user_agent="TestAgent",
+            output_dir=Path("tests/tmp_test_dir/data"), log_file=Path("tests/tmp_test_dir/logs/test.log"),
+            profile="contacts", save_html=False, profiles=["contacts"], crawl_order="random",
+        )
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            with self.assertRaises(ValueError):
+                WebCrawler(config)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+# tests/test_profiles.py
+# Autor: Martin Šilar
+# Testy crawlu s více profily – jedno stažení a parsování stránky, výsledky a soubory po profilech
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.base_extractor import BaseExtractor
+from src.webcrawler.composite_extractor import CompositeExtractor
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.crawler import WebCrawler, results_to_save
+from src.webcrawler.engine import build_crawler
+from src.webcrawler.extractor import build_extractor
+from src.webcrawler.reextract import reextract
+from src.webcrawler.seo_extractor import SEOExtractor
+from src.webcrawler.sink import read_results
+
+PROFILES = ("contacts", "seo", "content")
+
+
+class TestResultsToSave(unittest.TestCase):
+    def test_should_save_applies_per_profile(self):
+        data = {
+            "contacts": {"url": "x", "emails": [], "phones": []},
+            "seo": {"url": "x", "title": "Titulek"},
+            "content": {"url": "x", "text": "krátké"},
+        }
+        self.assertEqual(results_to_save(list(PROFILES), data), [("seo", data["seo"])])
+        self.assertEqual(results_to_save(list(PROFILES), None), [])
+        self.assertEqual(results_to_save(["seo"], data["seo"]), [("seo", data["seo"])])
+
+
+class BrokenExtractor(BaseExtractor):
+    def extract(self, url, doc):
+        raise RuntimeError("rozbitý extraktor")
+
+
+class TestCompositeExtractor(unittest.TestCase):
+    def test_failing_profile_does_not_drop_others(self):
+        crawler = Mock(parser="html.parser")
+        extractor = CompositeExtractor({"broken": BrokenExtractor(), "seo": SEOExtractor()})
+        extractor.set_crawler(crawler)
+
+        html = "<html><head><title>Titulek</title></head><body></body></html>"
+        data = extractor.extract("https://a.cz/", html)
+        self.assertEqual(list(data), ["seo"])
+        self.assertEqual(data["seo"]["title"], "Titulek")
+        message = crawler.log.call_args[0][0]
+        self.assertIn("broken", message)
+        self.assertIn("rozbitý extraktor", message)
+
+        # V procesu poolu crawler není – chyba se jen přeskočí.
+        self.assertEqual(list(extractor.without_crawler().extract("https://a.cz/", html)), ["seo"])
+
+
+class TestMultiProfileCrawl(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.site = StubSite(pages=40, fanout=3)
+        cls.site.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.site.stop()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _crawl(self, profile, name, **overrides):
+        values = dict(
+            start_url=self.site.start_url,
+            allowed_domain=self.site.domain,
+            max_workers=4,
+            max_pages=100,
+            queue_maxsize=1000,
+            request_timeout=5,
+            user_agent="TestAgent",
+            output_dir=Path(self.tmp.name) / name,
+            log_file=Path(self.tmp.name) / "logs" / "test.log",
+            profile=profile,
+            save_html=False,
+            profiles=list(PROFILES),
+        )
+        values.update(overrides)
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = build_crawler(CrawlerConfig(**values))
+        if profile != "raw":
+            crawler.set_extractor(build_extractor(profile))
+        hits = self.site.hits
+        crawler.run()
+        return crawler, self.site.hits - hits
+
+    def _single_profile_results(self):
+        out = {}
+        for profile in PROFILES:
+            crawler, hits = self._crawl(profile, profile)
+            self.assertEqual(hits, 40)
+            out[profile] = sorted(crawler.results, key=lambda r: r["url"])
+        return out
+
+    def test_one_crawl_matches_separate_crawls(self):
+        expected = self._single_profile_results()
+        for engine, processes in (("threads", 0), ("threads", 2), ("async", 0)):
+            with self.subTest(engine=engine, extract_processes=processes):
+                name = f"multi_{engine}_{processes}"
+                crawler, hits = self._crawl(
+                    "contacts, seo, content", name, engine=engine, extract_processes=processes,
+                )
+                self.assertEqual(hits, 40)
+
+                output = crawler.save_results()
+                self.assertEqual(output, Path(self.tmp.name) / name)
+                for profile in PROFILES:
+                    data = json.loads((output / f"{profile}_data.json").read_text("utf-8"))
+                    self.assertEqual(sorted(data, key=lambda r: r["url"]), expected[profile])
+                self.assertEqual(len(crawler.profile_results["contacts"]), 4)
+
+    def test_streamed_results_per_profile(self):
+        crawler, _ = self._crawl("contacts, seo", "jsonl", result_format="jsonl")
+        output = crawler.save_results()
+
+        self.assertEqual(len(list(read_results(output / "contacts_data.jsonl"))), 4)
+        self.assertEqual(len(list(read_results(output / "seo_data.jsonl"))), 40)
+        self.assertFalse((output / "content_data.jsonl").exists())
+
+    def test_resume_restores_results_per_profile(self):
+        state_file = Path(self.tmp.name) / "state.sqlite"
+        self._crawl("contacts, seo", "state", state_file=state_file)
+
+        config = CrawlerConfig(
+            start_url=self.site.start_url, allowed_domain=self.site.domain, max_workers=1, max_pages=100,
+            queue_maxsize=1000, request_timeout=5, user_agent="TestAgent",
+            output_dir=Path(self.tmp.name) / "state", log_file=Path(self.tmp.name) / "logs" / "test.log",
+            profile="contacts, seo", save_html=False, profiles=list(PROFILES), state_file=state_file,
+        )
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(config, resume=True)
+        self.assertEqual(crawler._seed_urls(), [])
+        crawler._close_state()
+
+        self.assertEqual(len(crawler.profile_results["contacts"]), 4)
+        self.assertEqual(len(crawler.profile_results["seo"]), 40)
+
+    def test_reextract_several_profiles(self):
+        output_dir = Path(self.tmp.name) / "saved"
+        self._crawl("raw", "saved", save_html=True)
+
+        stats = reextract(output_dir, "contacts, seo", processes=1)
+
+        self.assertEqual(stats.pages, 40)
+        self.assertEqual(stats.results, 44)
+        self.assertEqual(len(list(read_results(output_dir / "reextract" / "contacts_data.jsonl"))), 4)
+        self.assertEqual(len(list(read_results(output_dir / "reextract" / "seo_data.jsonl"))), 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
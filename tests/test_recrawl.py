@@ -0,0 +1,125 @@
+# tests/test_recrawl.py
+# Autor: Martin Šilar
+# Testy inkrementálního recrawlu s podmíněným GET
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.recrawl import RecrawlCache, page_fingerprint
+
+
+class TestRecrawl(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _site(self, **kwargs):
+        site = StubSite(pages=30, fanout=3, **kwargs)
+        site.start()
+        self.addCleanup(site.stop)
+        return site
+
+    def _crawl(self, site, profile="contacts", **overrides):
+        values = dict(
+            start_url=site.start_url,
+            allowed_domain=site.domain,
+            max_workers=4,
+            max_pages=100,
+            queue_maxsize=1000,
+            request_timeout=5,
+            user_agent="TestAgent",
+            output_dir=Path(self.tmp.name) / "data",
+            log_file=Path(self.tmp.name) / "logs" / "test.log",
+            profile=profile,
+            save_html=False,
+            profiles=[profile],
+            recrawl_cache=Path(self.tmp.name) / "recrawl.sqlite",
+        )
+        values.update(overrides)
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(CrawlerConfig(**values))
+        if profile != "raw":
+            crawler.set_extractor(ContactsExtractor())
+        crawler.run()
+        return crawler
+
+    def test_not_modified_reuses_results(self):
+        site = self._site(validators=True)
+        first = self._crawl(site)
+        self.assertEqual(first.recrawl_summary()["conditional"], 0)
+        sent = site.bytes_sent
+
+        second = self._crawl(site)
+        summary = second.recrawl_summary()
+
+        self.assertEqual(site.not_modified, 30)
+        self.assertEqual(summary["not_modified"], 30)
+        self.assertEqual(summary["bytes_saved"], sent)
+        self.assertGreater(summary["cpu_saved"], 0)
+        self.assertEqual(site.bytes_sent, sent)
+        self.assertEqual(second.page_count, 30)
+        self.assertEqual(
+            sorted(r["url"] for r in second.results),
+            sorted(r["url"] for r in first.results),
+        )
+
+    def test_edited_page_is_refetched(self):
+        site = self._site(validators=True)
+        self._crawl(site)
+        site.edited.add(10)
+        site.edited.add(11)
+
+        second = self._crawl(site)
+        self.assertEqual(second.recrawl_summary()["not_modified"], 28)
+        self.assertEqual(len(second.results), 3)
+
+        # Nový ETag se uložil – třetí běh už dostane 304 i na upravené stránky.
+        third = self._crawl(site)
+        self.assertEqual(third.recrawl_summary()["not_modified"], 30)
+
+    def test_unchanged_body_without_validators(self):
+        site = self._site()
+        self._crawl(site)
+
+        second = self._crawl(site)
+        summary = second.recrawl_summary()
+
+        self.assertEqual(site.not_modified, 0)
+        self.assertEqual(summary["unchanged"], 30)
+        self.assertEqual(summary["bytes_saved"], 0)
+        self.assertEqual(len(second.results), 3)
+
+    def test_cache_is_per_profile(self):
+        site = self._site(validators=True)
+        self._crawl(site, profile="raw")
+
+        crawler = self._crawl(site)
+        self.assertEqual(crawler.recrawl_summary()["not_modified"], 0)
+        self.assertEqual(len(crawler.results), 3)
+
+    def test_cache_roundtrip(self):
+        cache = RecrawlCache(Path(self.tmp.name) / "cache.sqlite", "contacts")
+        cache.start()
+        digest, size = page_fingerprint("<p>Čau</p>")
+        cache.put("https://a.cz/", {"ETag": '"x"'}, digest, size, 0.5, {"url": "https://a.cz/"}, ["https://a.cz/b"])
+        cache.close()
+
+        cache = RecrawlCache(Path(self.tmp.name) / "cache.sqlite", "contacts")
+        cache.start()
+        self.addCleanup(cache.close)
+        page = cache.get("https://a.cz/")
+        self.assertEqual(page.conditional_headers(), {"If-None-Match": '"x"'})
+        self.assertEqual((page.content_hash, page.size), (digest, 11))
+        self.assertEqual(page.result, {"url": "https://a.cz/"})
+        self.assertEqual(page.links, ["https://a.cz/b"])
+        self.assertIsNone(cache.get("https://a.cz/b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
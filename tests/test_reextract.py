@@ -0,0 +1,108 @@
+# tests/test_reextract.py
+# Autor: Martin Šilar
+# Testy opakované extrakce nad uloženým HTML
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.extractor import build_extractor
+from src.webcrawler.reextract import iter_html_files, reextract
+from src.webcrawler.sink import read_results
+
+
+class TestReextract(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.site = StubSite(pages=40, fanout=3)
+        cls.site.start()
+        cls.expected = sorted(f"{cls.site.base_url}/page/{n}" for n in range(0, 40, 10))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.site.stop()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _crawl(self, html_store, profile="raw"):
+        output_dir = Path(self.tmp.name) / html_store
+        config = CrawlerConfig(
+            start_url=self.site.start_url,
+            allowed_domain=self.site.domain,
+            max_workers=4,
+            max_pages=100,
+            queue_maxsize=1000,
+            request_timeout=5,
+            user_agent="TestAgent",
+            output_dir=output_dir,
+            log_file=Path(self.tmp.name) / "logs" / "test.log",
+            profile=profile,
+            save_html=True,
+            profiles=[profile],
+            html_store=html_store,
+        )
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            crawler = WebCrawler(config)
+        if profile != "raw":
+            crawler.set_extractor(build_extractor(profile))
+        crawler.run()
+        crawler.save_results()
+        return output_dir
+
+    def test_reextract_saved_pages(self):
+        for html_store, processes in (("files", 1), ("archive", 1), ("files", 2)):
+            with self.subTest(html_store=html_store, processes=processes):
+                output_dir = self._crawl(html_store)
+                hits = self.site.hits
+
+                stats = reextract(output_dir, "contacts", processes=processes)
+
+                self.assertEqual(self.site.hits, hits)
+                self.assertEqual(stats.pages, 40)
+                self.assertEqual(stats.results, 4)
+                self.assertEqual(stats.errors, 0)
+                results = list(read_results(output_dir / "reextract" / "contacts_data.jsonl"))
+                self.assertEqual(sorted(r["url"] for r in results), self.expected)
+                self.assertTrue(all(r["emails"] for r in results))
+
+    def test_crawl_results_are_kept(self):
+        output_dir = self._crawl("files", "contacts")
+        crawl_results = (output_dir / "contacts_data.json").read_bytes()
+
+        reextract(output_dir, "contacts", processes=1)
+        # Opakovaná reextrakce přepíše jen svůj vlastní výstup.
+        reextract(output_dir, "contacts", processes=1)
+
+        self.assertEqual((output_dir / "contacts_data.json").read_bytes(), crawl_results)
+        self.assertFalse((output_dir / "contacts_data.jsonl").exists())
+        self.assertEqual(len(list(read_results(output_dir / "reextract" / "contacts_data.jsonl"))), 4)
+
+    def test_iter_html_files(self):
+        output_dir = Path(self.tmp.name)
+        (output_dir / "a.cz").mkdir()
+        (output_dir / "0001_index.html").write_text("<!-- URL: https://b.cz/ -->\n<p>b</p>", encoding="utf-8")
+        (output_dir / "a.cz" / "0002_kontakt.html").write_text(
+            "<!-- URL: https://a.cz/kontakt -->\n<p>a</p>", encoding="utf-8"
+        )
+        (output_dir / "poznamky.html").write_text("<!-- URL: https://c.cz/ -->\n", encoding="utf-8")
+        (output_dir / "0003_bez_hlavicky.html").write_text("<p>c</p>", encoding="utf-8")
+
+        pages = sorted((d.name, url, html) for d, url, html in iter_html_files(output_dir))
+        self.assertEqual(pages, [
+            ("a.cz", "https://a.cz/kontakt", "<p>a</p>"),
+            (output_dir.name, "https://b.cz/", "<p>b</p>"),
+        ])
+
+    def test_raw_profile_is_rejected(self):
+        with self.assertRaises(ValueError):
+            reextract(self.tmp.name, "raw")
+
+
+if __name__ == "__main__":
+    unittest.main()
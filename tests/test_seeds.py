@@ -0,0 +1,175 @@
+# tests/test_seeds.py
+# Autor: Martin Šilar
+# Testy crawlu více webů ze seznamu seedů
+
+import json
+import tempfile
+import unittest
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.engine import build_crawler
+from src.webcrawler.politeness import HostFrontier
+from src.webcrawler.reextract import reextract
+from src.webcrawler.seeds import DomainScope, domain_dir, load_seed_file, seed_domain
+from src.webcrawler.sink import read_results
+
+
+class TestSeedFile(unittest.TestCase):
+    def test_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "seeds.txt"
+            path.write_text(
+                "# start_url [doména]\n"
+                "https://www.Example.cz/\n"
+                "\n"
+                "https://blog.priklad.cz/start priklad.cz\n"
+                "https://example.cz/jinde\n",
+                encoding="utf-8",
+            )
+            seeds = load_seed_file(path)
+
+        self.assertEqual([(s.start_url, s.domain) for s in seeds], [
+            ("https://www.Example.cz/", "example.cz"),
+            ("https://blog.priklad.cz/start", "priklad.cz"),
+        ])
+
+    def test_invalid(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "seeds.txt"
+            path.write_text("# nic\n", encoding="utf-8")
+            with self.assertRaises(ValueError):
+                load_seed_file(path)
+            path.write_text("example.cz\n", encoding="utf-8")
+            with self.assertRaises(ValueError):
+                load_seed_file(path)
+
+    def test_seed_domain(self):
+        self.assertEqual(seed_domain("http://www.example.cz:8080/a"), "example.cz:8080")
+
+
+class TestDomainScope(unittest.TestCase):
+    def test_match(self):
+        scope = DomainScope(["example.cz", "blog.priklad.cz", "127.0.0.1:8000"])
+        self.assertEqual(scope.match("https://example.cz/a"), "example.cz")
+        self.assertEqual(scope.match("https://www.Example.cz/a"), "example.cz")
+        self.assertEqual(scope.match("https://a.blog.priklad.cz/"), "blog.priklad.cz")
+        self.assertEqual(scope.match("http://127.0.0.1:8000/page/1"), "127.0.0.1:8000")
+        self.assertIsNone(scope.match("https://priklad.cz/"))
+        self.assertIsNone(scope.match("https://notexample.cz/"))
+        self.assertIsNone(scope.match("http://127.0.0.1:8001/"))
+
+    def test_domain_dir(self):
+        scope = DomainScope(["example.cz", "127.0.0.1:8000"])
+        out = Path("data")
+        self.assertEqual(domain_dir(out, None, "https://example.cz/a"), out)
+        self.assertEqual(domain_dir(out, scope, "https://www.example.cz/a"), out / "example.cz")
+        self.assertEqual(domain_dir(out, scope, "http://127.0.0.1:8000/"), out / "127.0.0.1_8000")
+        self.assertEqual(domain_dir(out, scope, "https://jinde.cz/"), out / "_other")
+
+    def test_delay_inherited_by_subdomains(self):
+        frontier = HostFrontier(default_delay=0.5)
+        frontier.set_delay("example.cz", 2.0)
+        self.assertEqual(frontier.delay_for("www.example.cz"), 2.0)
+        self.assertEqual(frontier.delay_for("example.cz"), 2.0)
+        self.assertEqual(frontier.delay_for("jinde.cz"), 0.5)
+
+
+class TestMultiDomainCrawl(unittest.TestCase):
+    def setUp(self):
+        self.stack = ExitStack()
+        self.sites = [self.stack.enter_context(StubSite(pages=15, fanout=3, latency=0.005)) for _ in range(3)]
+        self.tmp = Path(self.stack.enter_context(tempfile.TemporaryDirectory()))
+        self.seed_file = self.tmp / "seeds.txt"
+        self.seed_file.write_text("".join(f"{s.start_url}\n" for s in self.sites), encoding="utf-8")
+
+    def tearDown(self):
+        self.stack.close()
+
+    def _config(self, engine="threads", max_pages=100, save_html=False, html_store="files"):
+        return CrawlerConfig(
+            start_url="https://ignored.example",
+            allowed_domain="ignored.example",
+            max_workers=6,
+            max_pages=max_pages,
+            queue_maxsize=1000,
+            request_timeout=5,
+            user_agent="TestAgent",
+            output_dir=self.tmp / "data",
+            log_file=self.tmp / "logs" / "test.log",
+            profile="contacts",
+            save_html=save_html,
+            profiles=["contacts"],
+            engine=engine,
+            seed_file=self.seed_file,
+            html_store=html_store,
+        )
+
+    def _crawl(self, config, robots=([], 0)):
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=robots):
+            crawler = build_crawler(config)
+        crawler.set_extractor(ContactsExtractor())
+        crawler.run()
+        return crawler
+
+    def test_all_sites_crawled_with_per_domain_output(self):
+        for engine in ("threads", "async"):
+            with self.subTest(engine=engine):
+                crawler = self._crawl(self._config(engine, save_html=True))
+                self.assertEqual(crawler.page_count, 45)
+                self.assertTrue(crawler.multi_domain)
+
+                out = crawler.save_results()
+                self.assertEqual(out, self.tmp / "data")
+                for site in self.sites:
+                    domain_dir = out / site.domain.replace(":", "_")
+                    data = json.loads((domain_dir / "contacts_data.json").read_text(encoding="utf-8"))
+                    self.assertEqual(len(data), 2)
+                    self.assertTrue(all(site.domain in r["url"] for r in data))
+                    self.assertEqual(len(list(domain_dir.glob("*.html"))), 15)
+                    for f in domain_dir.glob("*.html"):
+                        f.unlink()
+
+    def test_reextract_archive_per_domain(self):
+        crawler = self._crawl(self._config(save_html=True, html_store="archive"))
+        out = crawler.save_results()
+
+        stats = reextract(out, "contacts", processes=1, seed_file=self.seed_file)
+
+        self.assertEqual(stats.pages, 45)
+        for site in self.sites:
+            name = site.domain.replace(":", "_")
+            results = list(read_results(out / "reextract" / name / "contacts_data.jsonl"))
+            self.assertEqual(len(results), 2)
+            self.assertTrue(all(site.domain in r["url"] for r in results))
+            crawl_results = json.loads((out / name / "contacts_data.json").read_text(encoding="utf-8"))
+            self.assertEqual(len(crawl_results), 2)
+        self.assertFalse((out / "reextract" / "contacts_data.jsonl").exists())
+
+    def test_round_robin_across_hosts(self):
+        crawler = self._crawl(self._config(max_pages=18))
+        self.assertEqual(crawler.page_count, 18)
+        self.assertTrue(all(5 <= site.hits <= 7 for site in self.sites), [s.hits for s in self.sites])
+
+    def test_robots_per_domain(self):
+        blocked = self.sites[1].domain
+
+        def robots(domain=None):
+            return (["/page/"], 0) if domain == blocked else ([], 0)
+
+        with patch.object(WebCrawler, "_load_robots_txt", side_effect=robots):
+            crawler = build_crawler(self._config())
+        crawler.run()
+
+        self.assertEqual(self.sites[0].hits, 15)
+        self.assertEqual(self.sites[1].hits, 1)
+        self.assertEqual(self.sites[2].hits, 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
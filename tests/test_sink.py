@@ -0,0 +1,131 @@
+# tests/test_sink.py
+# Autor: Martin Šilar
+# Testy průběžného zápisu výsledků a převodu do původního JSON
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.engine import build_crawler
+from src.webcrawler.sink import SUFFIXES, ResultSink, compact_to_json, pq, read_results
+
+RECORDS = [
+    {"url": f"https://a.cz/{i}", "emails": [f"info{i}@a.cz"], "phones": [], "title": "Čeština, \"uvozovky\"\na řádky"}
+    for i in range(450)
+]
+
+
+class TestResultSink(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _write(self, fmt, records, fsync="close"):
+        path = Path(self.tmp.name) / "out" / f"contacts_data{SUFFIXES[fmt]}"
+        sink = ResultSink(fmt, fsync)
+        sink.start()
+        sink.open(path)
+        for record in records:
+            sink.add(path, record)
+        sink.close()
+        self.assertEqual(sink.written, len(records))
+        return path
+
+    def test_round_trip(self):
+        formats = ["jsonl", "csv", "sqlite"] + (["parquet"] if pq is not None else [])
+        for fmt in formats:
+            with self.subTest(format=fmt):
+                path = self._write(fmt, RECORDS)
+                self.assertEqual(list(read_results(path)), RECORDS)
+
+    def test_compact_matches_legacy_json(self):
+        for records in (RECORDS[:3], []):
+            with self.subTest(count=len(records)):
+                path = self._write("jsonl", records)
+                output_path = compact_to_json(path)
+                self.assertEqual(output_path.name, "contacts_data.json")
+                self.assertEqual(
+                    output_path.read_text(encoding="utf-8"),
+                    json.dumps(records, indent=2, ensure_ascii=False),
+                )
+
+    def test_results_reach_disk_before_close(self):
+        path = Path(self.tmp.name) / "contacts_data.jsonl"
+        sink = ResultSink("jsonl")
+        sink.start()
+        self.addCleanup(sink.close)
+        sink.add(path, RECORDS[0])
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if path.exists() and path.read_text(encoding="utf-8"):
+                break
+            time.sleep(0.05)
+        self.assertEqual(list(read_results(path)), RECORDS[:1])
+
+    def test_fsync_policy(self):
+        for policy, expected in (("never", 0), ("close", 1), ("batch", 4)):
+            with self.subTest(policy=policy), patch("src.webcrawler.sink.os.fsync") as fsync:
+                self._write("jsonl", RECORDS, fsync=policy)
+                # 450 výsledků = 3 dávky (po 200) + zavření
+                self.assertEqual(fsync.call_count, expected)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            ResultSink("xml")
+        with self.assertRaises(ValueError):
+            ResultSink("jsonl", fsync="sometimes")
+
+
+class TestCrawlerSink(unittest.TestCase):
+    def setUp(self):
+        self.site = StubSite(pages=40, fanout=3)
+        self.site.start()
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.site.stop()
+        self.tmp.cleanup()
+
+    def test_streamed_results(self):
+        for engine in ("threads", "async"):
+            with self.subTest(engine=engine):
+                config = CrawlerConfig(
+                    start_url=self.site.start_url,
+                    allowed_domain=self.site.domain,
+                    max_workers=4,
+                    max_pages=100,
+                    queue_maxsize=1000,
+                    request_timeout=5,
+                    user_agent="TestAgent",
+                    output_dir=Path(self.tmp.name) / engine,
+                    log_file=Path(self.tmp.name) / "logs" / "test.log",
+                    profile="contacts",
+                    save_html=False,
+                    profiles=["contacts"],
+                    engine=engine,
+                    result_format="jsonl",
+                )
+                crawler = build_crawler(config)
+                crawler.set_extractor(ContactsExtractor())
+                crawler.run()
+
+                self.assertEqual(crawler.results, [])
+                path = crawler.save_results()
+                self.assertEqual(path, config.output_dir / "contacts_data.jsonl")
+                urls = sorted(r["url"] for r in read_results(path))
+                self.assertEqual(urls, sorted(f"{self.site.base_url}/page/{n}" for n in range(0, 40, 10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+# tests/test_spill.py
+# Autor: Martin Šilar
+# Testy přetečení frontieru na disk – SpillQueue, dvouúrovňový HostFrontier a crawl s malou queue_maxsize
+
+import tempfile
+import unittest
+from collections import deque
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.engine import build_crawler
+from src.webcrawler.politeness import HostFrontier
+from src.webcrawler.spill import SpillQueue
+
+
+class TestSpillQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name) / "spill"
+
+    def test_fifo_across_segments(self):
+        spill = SpillQueue(self.dir, segment_size=3)
+        out = []
+        for i in range(10):
+            spill.append(f"https://a.cz/{i}")
+            if i % 3 == 2:
+                out.append(spill.popleft())
+        self.assertEqual(len(spill), 7)
+        self.assertGreater(len(list(self.dir.glob("*.spill"))), 1)
+        while spill:
+            out.append(spill.popleft())
+
+        self.assertEqual(out, [f"https://a.cz/{i}" for i in range(10)])
+        self.assertEqual(list(self.dir.glob("*.spill")), [])
+        self.assertEqual(spill.summary(), {"spilled": 10, "refilled": 10, "on_disk": 0})
+        self.assertRaises(IndexError, spill.popleft)
+
+    def test_reuse_after_drain_and_clear(self):
+        spill = SpillQueue(segment_size=2)
+        spill.append("https://a.cz/1")
+        tmp_dir = spill._dir
+        self.assertEqual(spill.popleft(), "https://a.cz/1")
+        self.assertFalse(tmp_dir.exists())
+
+        for i in range(5):
+            spill.append(f"https://a.cz/{i}\n")
+        self.assertEqual(spill.popleft(), "https://a.cz/0%0A")
+        self.assertEqual(spill.clear(), 4)
+        self.assertEqual(len(spill), 0)
+        spill.append("https://a.cz/x")
+        self.assertEqual(spill.popleft(), "https://a.cz/x")
+
+
+class TestSpillingFrontier(unittest.TestCase):
+    def test_overflow_is_refilled_in_order(self):
+        frontier = HostFrontier(maxsize=2, spill=deque())
+        urls = [f"https://a.cz/{i}" for i in range(6)]
+        for url in urls:
+            self.assertTrue(frontier.push(url))
+        self.assertEqual((frontier._count, len(frontier.spill), len(frontier)), (2, 4, 6))
+
+        popped = []
+        while len(frontier):
+            url, _ = frontier.pop(0.0)
+            popped.append(url)
+            frontier.release(url)
+            self.assertLessEqual(frontier._count, 2)
+        self.assertEqual(popped, urls)
+
+    def test_clear_drops_spilled(self):
+        frontier = HostFrontier(maxsize=1, spill=deque())
+        for i in range(3):
+            frontier.push(f"https://a.cz/{i}")
+        self.assertEqual(frontier.clear(), 3)
+        self.assertEqual(len(frontier), 0)
+
+    def test_without_spill_push_fails_when_full(self):
+        frontier = HostFrontier(maxsize=1)
+        self.assertTrue(frontier.push("https://a.cz/1"))
+        self.assertFalse(frontier.push("https://a.cz/2"))
+
+
+class TestCrawlWithSmallQueue(unittest.TestCase):
+    def test_small_queue_loses_no_pages(self):
+        with StubSite(pages=80, fanout=6) as site, tempfile.TemporaryDirectory() as tmp:
+            for engine in ("threads", "async"):
+                with self.subTest(engine=engine):
+                    config = CrawlerConfig(
+                        start_url=site.start_url,
+                        allowed_domain=site.domain,
+                        max_workers=4,
+                        max_pages=1000,
+                        queue_maxsize=3,
+                        request_timeout=5,
+                        user_agent="TestAgent",
+                        output_dir=Path(tmp) / engine,
+                        log_file=Path(tmp) / "logs" / "test.log",
+                        profile="raw",
+                        save_html=False,
+                        profiles=["raw"],
+                        engine=engine,
+                        frontier_spill_dir=Path(tmp) / "spill",
+                    )
+                    with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+                        crawler = build_crawler(config)
+                    crawler.run()
+
+                    self.assertEqual(crawler.page_count, 80)
+                    summary = crawler.frontier_summary()
+                    self.assertGreater(summary["spilled"], 0)
+                    self.assertEqual(summary["spilled"], summary["refilled"])
+                    self.assertEqual(list((Path(tmp) / "spill").glob("*.spill")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
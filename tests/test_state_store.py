@@ -0,0 +1,141 @@
+# tests/test_state_store.py
+# Autor: Martin Šilar
+# Testy perzistentního stavu crawlu – uložení, načtení a navázání po zabití procesu
+
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.stub_server import StubSite
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.contacts_extractor import ContactsExtractor
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.state_store import CrawlStateStore, STATUS_DONE
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD = textwrap.dedent("""
+    import sys
+    from pathlib import Path
+    from unittest.mock import patch
+    from src.webcrawler.config import CrawlerConfig
+    from src.webcrawler.contacts_extractor import ContactsExtractor
+    from src.webcrawler.crawler import WebCrawler
+
+    start_url, domain, tmp = sys.argv[1:4]
+    config = CrawlerConfig(
+        start_url=start_url, allowed_domain=domain, max_workers=2, max_pages=1000,
+        queue_maxsize=1000, request_timeout=5, user_agent="TestAgent",
+        output_dir=Path(tmp) / "data", log_file=Path(tmp) / "logs" / "child.log",
+        profile="contacts", save_html=False, profiles=["contacts"],
+        state_file=Path(tmp) / "state.sqlite",
+    )
+    with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+        crawler = WebCrawler(config)
+    crawler.set_extractor(ContactsExtractor())
+    crawler.run()
+""")
+
+
+def _make_config(tmp, site):
+    return CrawlerConfig(
+        start_url=site.start_url,
+        allowed_domain=site.domain,
+        max_workers=2,
+        max_pages=1000,
+        queue_maxsize=1000,
+        request_timeout=5,
+        user_agent="TestAgent",
+        output_dir=Path(tmp) / "data",
+        log_file=Path(tmp) / "logs" / "test.log",
+        profile="contacts",
+        save_html=False,
+        profiles=["contacts"],
+        state_file=Path(tmp) / "state.sqlite",
+    )
+
+
+def _done_urls(path):
+    conn = sqlite3.connect(path)
+    try:
+        return {row[0] for row in conn.execute("SELECT url FROM urls WHERE status = ?", (STATUS_DONE,))}
+    except sqlite3.OperationalError:
+        return set()
+    finally:
+        conn.close()
+
+
+class TestCrawlStateStore(unittest.TestCase):
+    def test_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = CrawlStateStore(Path(tmp) / "s.sqlite")
+            store.start()
+            store.add_urls(["https://a.cz/", "https://a.cz/1", "https://a.cz/2"])
+            store.add_result("https://a.cz/", {"url": "https://a.cz/", "emails": ["x@a.cz"]})
+            store.mark_done("https://a.cz/")
+            store.add_urls(["https://a.cz/1"])
+            store.close()
+
+            visited, frontier, done, results = CrawlStateStore(Path(tmp) / "s.sqlite").load()
+            self.assertEqual(visited, {"https://a.cz/", "https://a.cz/1", "https://a.cz/2"})
+            self.assertEqual(frontier, ["https://a.cz/1", "https://a.cz/2"])
+            self.assertEqual(done, 1)
+            self.assertEqual(results[0]["emails"], ["x@a.cz"])
+
+
+class TestResumeAfterKill(unittest.TestCase):
+    def test_killed_crawl_resumes_without_refetching(self):
+        site = StubSite(pages=80, fanout=3, latency=0.03)
+        site.start()
+        self.addCleanup(site.stop)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = Path(tmp) / "state.sqlite"
+            child = subprocess.Popen(
+                [sys.executable, "-c", CHILD, site.start_url, site.domain, tmp],
+                cwd=ROOT,
+            )
+            try:
+                deadline = time.monotonic() + 30
+                while len(_done_urls(state_path)) < 20 and time.monotonic() < deadline:
+                    time.sleep(0.05)
+            finally:
+                os.kill(child.pid, signal.SIGKILL)
+                child.wait()
+
+            done_before = _done_urls(state_path)
+            self.assertGreaterEqual(len(done_before), 20)
+            self.assertLess(len(done_before), 80)
+
+            with site.hits_lock:
+                hits_before = dict(site.path_hits)
+
+            with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+                crawler = WebCrawler(_make_config(tmp, site), resume=True)
+            crawler.set_extractor(ContactsExtractor())
+            crawler.run()
+
+            with site.hits_lock:
+                hits_after = dict(site.path_hits)
+            refetched = {
+                path for path, n in hits_after.items()
+                if n > hits_before.get(path, 0) and site.base_url + path in done_before
+            }
+
+            self.assertEqual(refetched, set())
+            self.assertEqual(set(hits_after), {f"/page/{n}" for n in range(80)})
+            self.assertEqual(crawler.page_count, 80)
+            self.assertEqual(len(crawler.results), 8)
+            self.assertEqual(_done_urls(state_path), {site.base_url + f"/page/{n}" for n in range(80)})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# tests/test_visited.py
+# Autor: Martin Šilar
+# Testy kompaktních úložišť visited (fingerprint / bloom) a visited rozděleného na části
+
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.webcrawler.config import CrawlerConfig
+from src.webcrawler.crawler import WebCrawler
+from src.webcrawler.visited import FingerprintSet, ScalableBloomFilter, ShardedVisited, make_visited_set
+
+
+def _urls(prefix, n):
+    return [f"https://example.com/{prefix}/{i}?q={i * 7}" for i in range(n)]
+
+
+class TestFingerprintSet(unittest.TestCase):
+    def test_exact_membership_across_growth(self):
+        visited = FingerprintSet(capacity=16)
+        urls = _urls("a", 20_000)
+        visited.update(urls)
+        visited.update(urls[:100])
+
+        self.assertEqual(len(visited), 20_000)
+        self.assertTrue(all(u in visited for u in urls))
+        self.assertFalse(any(u in visited for u in _urls("b", 20_000)))
+        self.assertLessEqual(visited.memory_bytes() / len(visited), 32)
+
+
+class TestScalableBloomFilter(unittest.TestCase):
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        bloom = ScalableBloomFilter(capacity=1000, error_rate=0.01)
+        urls = _urls("a", 20_000)
+        bloom.update(urls)
+
+        self.assertTrue(all(u in bloom for u in urls))
+        false_positives = sum(u in bloom for u in _urls("b", 20_000))
+        self.assertLess(false_positives / 20_000, 0.01)
+        self.assertLess(bloom.memory_bytes() / len(bloom), 4)
+
+
+class TestShardedVisited(unittest.TestCase):
+    def test_add_new_keeps_order_and_drops_duplicates(self):
+        visited = ShardedVisited("set", shards=4)
+        urls = _urls("a", 50)
+        self.assertEqual(visited.add_new(urls + urls[:10]), urls)
+        self.assertEqual(visited.add_new(_urls("a", 60)), _urls("a", 60)[50:])
+        self.assertEqual(len(visited), 60)
+        self.assertIn(urls[0], visited)
+        self.assertNotIn("https://example.com/b", visited)
+
+    def test_concurrent_batches_admit_each_url_once(self):
+        for store in ("set", "fingerprint"):
+            with self.subTest(store=store):
+                visited = ShardedVisited(store, capacity=64, shards=8)
+                urls = _urls("a", 4000)
+                admitted = []
+                lock = threading.Lock()
+
+                def worker(offset):
+                    for start in range(offset * 100, len(urls), 100):
+                        new = visited.add_new(urls[start:start + 300])
+                        with lock:
+                            admitted.extend(new)
+
+                threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+
+                self.assertEqual(sorted(admitted), sorted(urls))
+                summary = visited.lock_summary()
+                self.assertEqual(summary["shards"], 8)
+                self.assertGreater(summary["acquisitions"], 0)
+                self.assertLessEqual(summary["contended"], summary["acquisitions"])
+                self.assertLessEqual(len(summary["wait_per_thread"]), 8)
+
+
+class TestVisitedStoreConfig(unittest.TestCase):
+    def _crawler(self, store):
+        config = CrawlerConfig(
+            start_url="https://example.com",
+            allowed_domain="example.com",
+            max_workers=1,
+            max_pages=5,
+            queue_maxsize=100,
+            request_timeout=5,
+            user_agent="TestAgent",
+            output_dir=Path("test_data"),
+            log_file=Path("logs/test.log"),
+            profile="contacts",
+            save_html=False,
+            profiles=["contacts"],
+            visited_store=store,
+        )
+        with patch.object(WebCrawler, "_load_robots_txt", return_value=([], 0)):
+            return WebCrawler(config)
+
+    def test_admission_uses_configured_store(self):
+        for store, cls in (("set", set), ("fingerprint", FingerprintSet), ("bloom", ScalableBloomFilter)):
+            with self.subTest(store=store):
+                crawler = self._crawler(store)
+                self.assertIsInstance(crawler.visited.shards[0], cls)
+                links = ["https://example.com/a", "https://example.com/b", "https://example.com/a"]
+                self.assertEqual(crawler._admit_links(links), ["https://example.com/a", "https://example.com/b"])
+                self.assertEqual(crawler._admit_links(links), [])
+
+    def test_unknown_store(self):
+        with self.assertRaises(ValueError):
+            make_visited_set("trie")
+
+
+if __name__ == "__main__":
+    unittest.main()